@@ -0,0 +1,69 @@
+"""
+Benchmark: memory footprint per agent.
+
+Creates a large rider population (1M by default) plus a proportional driver
+population and reports the bytes allocated per agent, as measured by
+tracemalloc. Each run can be appended as one JSON line to a history file so
+the footprint can be tracked over time.
+
+Usage:
+    python -m benchmarks.agent_memory [--riders 1000000] [--history benchmarks/agent_memory_history.jsonl]
+"""
+import argparse
+import json
+import subprocess
+import time
+import tracemalloc
+
+from simulator.agents.rider.rider import RiderAgent
+from simulator.agents.driver.driver import DriverAgent
+
+def measure(factory, count: int) -> float:
+    """Returns the bytes allocated per object when creating `count` objects."""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    agents = [factory(i) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding the agents is part of any population, so it is included.
+    per_agent = (current - baseline) / count
+    del agents
+    return per_agent
+
+def make_rider(i: int) -> RiderAgent:
+    return RiderAgent(i, (i % 10000, i // 10000), True, i % 2 == 0, 0.1, 0.5, 0.5, 3.0, 18)
+
+def make_driver(i: int) -> DriverAgent:
+    return DriverAgent(i, (i % 10000, i // 10000), i % 7 == 0, 0.1, 0.7, 0.3)
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-agent memory report.")
+    parser.add_argument('--riders', type=int, default=1_000_000, help='Number of riders to create.')
+    parser.add_argument('--drivers', type=int, default=None, help='Number of drivers to create (default: riders / 5).')
+    parser.add_argument('--history', type=str, default=None, help='JSON-lines file to append the result to.')
+    args = parser.parse_args()
+    num_drivers = args.drivers if args.drivers is not None else args.riders // 5
+
+    report = {
+        "benchmark": "agent_memory",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "riders": args.riders,
+        "drivers": num_drivers,
+        "bytes_per_rider": round(measure(make_rider, args.riders), 1),
+        "bytes_per_driver": round(measure(make_driver, num_drivers), 1) if num_drivers else None,
+    }
+    print(json.dumps(report))
+
+    if args.history:
+        with open(args.history, 'a') as f:
+            f.write(json.dumps(report) + "\n")
+
+if __name__ == "__main__":
+    main()
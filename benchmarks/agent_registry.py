@@ -0,0 +1,85 @@
+"""
+Benchmark: event handling throughput with the O(1) agent registry.
+
+Builds a market at several population sizes and measures how many
+EVALUATE_* events per second `Market.handle_event` processes, next to the
+cost of the old linear `next(...)` scan for the same lookups.
+
+Usage:
+    python -m benchmarks.agent_registry [--sizes 10000 100000] [--events 200000]
+"""
+import argparse
+import copy
+import logging
+import os
+import random
+import tempfile
+import time
+
+import yaml
+
+from simulator.core.engine import Engine
+from simulator.core.events import EventType
+from simulator.market.market import Market
+from simulator.utils.csv_logger import CsvLogger
+
+BASE_CONFIG = os.path.join(os.path.dirname(__file__), '..', 'configs', 'base_scenario.yaml')
+
+def build_market(total_agents: int, output_dir: str) -> Market:
+    """Builds a market with `total_agents` agents, 5 riders per driver."""
+    with open(BASE_CONFIG, 'r') as f:
+        config = copy.deepcopy(yaml.safe_load(f))
+    config['market']['initial_riders'] = total_agents * 5 // 6
+    config['market']['initial_drivers'] = total_agents - config['market']['initial_riders']
+
+    csv_logger = CsvLogger(os.path.join(output_dir, f"bench_{total_agents}.csv"))
+    market = Market(config, csv_logger)
+    engine = Engine(market, [])
+    market.set_engine(engine)
+    return market
+
+def bench_handle_event(market: Market, num_events: int) -> float:
+    """Returns events handled per wall-clock second."""
+    events = []
+    for _ in range(num_events):
+        if random.random() < 0.5:
+            rider = random.choice(market.riders)
+            events.append((EventType.EVALUATE_RIDER_SEARCH_INTENT, rider.agent_id, 0))
+        else:
+            driver = random.choice(market.drivers)
+            events.append((EventType.EVALUATE_DRIVER_GO_ONLINE, driver.agent_id, 0))
+
+    start = time.perf_counter()
+    for tick, event in enumerate(events):
+        market.handle_event(event, tick)
+    return num_events / (time.perf_counter() - start)
+
+def bench_linear_lookup(market: Market, num_lookups: int) -> float:
+    """Returns lookups per second of the linear scan the registry replaced."""
+    ids = [random.choice(market.riders).agent_id for _ in range(num_lookups)]
+    start = time.perf_counter()
+    for agent_id in ids:
+        next((r for r in market.riders if r.agent_id == agent_id), None)
+    return num_lookups / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description="Agent registry event throughput benchmark.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000], help='Total agent counts to benchmark.')
+    parser.add_argument('--events', type=int, default=200_000, help='Events to handle per size.')
+    parser.add_argument('--linear-lookups', type=int, default=200, help='Lookups to time with the old linear scan.')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    random.seed(42)
+
+    print(f"{'agents':>10} | {'events/sec':>12} | {'linear lookups/sec':>18}")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for size in args.sizes:
+            market = build_market(size, output_dir)
+            events_per_sec = bench_handle_event(market, args.events)
+            linear_per_sec = bench_linear_lookup(market, args.linear_lookups)
+            market.csv_logger.close()
+            print(f"{size:>10} | {events_per_sec:>12,.0f} | {linear_per_sec:>18,.0f}")
+
+if __name__ == "__main__":
+    main()
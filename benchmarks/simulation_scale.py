@@ -0,0 +1,294 @@
+"""
+Benchmark: full simulation runs at realistic population sizes.
+
+Generates a config per population size from a base scenario and runs each
+one end to end in a fresh process, reporting:
+
+- startup time (population generation and market setup),
+- simulated ticks per wall-second and events handled per second,
+- matcher calls (orders and batches) per second,
+- peak resident set size of the process.
+
+Each process also times a fixed calibration workload, and throughput is
+compared per million calibration operations (`relative_*` metrics), so a
+machine that is busier or slower than at the baseline does not read as a
+regression.
+
+Each size is run `--repeats` times; the history file gets one JSON line per
+size with the median of every metric and its [min, max] range over the
+repeats. `compare` checks the latest run against an earlier one and exits
+with status 1 if a metric got worse by more than the threshold and by more
+than the noise: the two runs' ranges must not overlap.
+
+Usage:
+    python -m benchmarks.simulation_scale run [--sizes 1000 10000 100000] [--days 1] [--repeats 3] [--history benchmarks/simulation_scale_history.jsonl]
+    python -m benchmarks.simulation_scale compare [--history ...] [--baseline REVISION] [--threshold 0.1]
+"""
+import argparse
+import copy
+import json
+import logging
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Dict, List, Optional
+
+import yaml
+
+from main import build_simulation
+from simulator.core.run_stats import RunStats
+from simulator.utils.csv_logger import CsvLogger
+
+BASE_CONFIG = os.path.join(os.path.dirname(__file__), '..', 'configs', 'base_scenario.yaml')
+DEFAULT_HISTORY = os.path.join(os.path.dirname(__file__), 'simulation_scale_history.jsonl')
+
+# Throughput metrics. Each is also recorded as `relative_<metric>`: the
+# throughput per million operations of the calibration workload.
+THROUGHPUT_METRICS = ("ticks_per_second", "events_per_second", "matcher_calls_per_second")
+
+# Compared metrics and whether a higher value is better. Throughput is compared
+# relative to the calibration, so a busier or slower machine is not a regression.
+METRICS = {
+    "startup_seconds": False,
+    "relative_ticks_per_second": True,
+    "relative_events_per_second": True,
+    "relative_matcher_calls_per_second": True,
+    "peak_rss_mb": False,
+}
+
+# Changes smaller than this are measurement resolution, never regressions.
+NOISE_FLOOR = {"startup_seconds": 0.05, "peak_rss_mb": 2.0}
+
+# Metrics aggregated over repeats (median and [min, max]).
+RECORDED_METRICS = (*METRICS, *THROUGHPUT_METRICS, "calibration_ops_per_second")
+
+def generate_config(base_config: Dict, riders: int, days: int) -> Dict:
+    """Returns the base config scaled to `riders` riders (one driver per 5 riders) and `days` days."""
+    config = copy.deepcopy(base_config)
+    config['simulation']['duration_days'] = days
+    config['market']['initial_riders'] = riders
+    config['market']['initial_drivers'] = max(1, riders // 5)
+    config['market'].pop('population_file', None)
+    config['instrumentation'] = {'progress': False}
+    return config
+
+def count_calls(counts: Dict[str, int], name: str, method):
+    """Wraps a bound method so each call is counted under `name`."""
+    def counted(*args, **kwargs):
+        counts[name] += 1
+        return method(*args, **kwargs)
+    return counted
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def calibration_ops_per_second(operations: int = 300_000) -> float:
+    """
+    Speed of a fixed pure-Python workload (heap pushes and pops with dict
+    updates, like the event loop) on this machine, right now. Dividing
+    throughput by it cancels out machine-wide slowdowns between runs.
+    """
+    import heapq
+    heap, counts = [], {}
+    start = time.perf_counter()
+    for i in range(operations):
+        heapq.heappush(heap, (i * 7919) % 10007)
+        counts[i & 255] = counts.get(i & 255, 0) + 1
+        if len(heap) > 64:
+            heapq.heappop(heap)
+    return operations / (time.perf_counter() - start)
+
+def run_size(config: Dict, output_dir: str) -> Dict:
+    """Runs one generated config and returns its measurements. Runs in a fresh process."""
+    logging.disable(logging.CRITICAL)
+    random.seed(config['simulation'].get('random_seed'))
+    riders = config['market']['initial_riders']
+    calibration = calibration_ops_per_second()
+
+    start = time.perf_counter()
+    csv_logger = CsvLogger(os.path.join(output_dir, f"bench_{riders}.csv"),
+                           ticks_per_major=config['simulation']['ticks_per_major'])
+    market, engine = build_simulation(config, csv_logger)
+    startup_seconds = time.perf_counter() - start
+
+    matcher_calls = {"process_order": 0, "match_batch": 0}
+    for platform in market.platforms:
+        for name in matcher_calls:
+            setattr(platform.matcher, name, count_calls(matcher_calls, name, getattr(platform.matcher, name)))
+
+    stats = engine.run(
+        duration_days=config['simulation']['duration_days'],
+        ticks_per_major=config['simulation']['ticks_per_major'],
+        skip_idle_ticks=config['simulation'].get('skip_idle_ticks', False),
+        stats=RunStats(progress=False),
+    )
+    csv_logger.close()
+    calibration = (calibration + calibration_ops_per_second()) / 2
+    wall_seconds = max(stats.wall_seconds, 1e-9)
+    result = {
+        "riders": riders,
+        "drivers": config['market']['initial_drivers'],
+        "days": config['simulation']['duration_days'],
+        "startup_seconds": round(startup_seconds, 3),
+        "run_seconds": round(stats.wall_seconds, 3),
+        "ticks_per_second": round((stats.ticks_processed + stats.ticks_skipped) / wall_seconds, 1),
+        "events_per_second": round(stats.events_handled / wall_seconds, 1),
+        "matcher_calls": sum(matcher_calls.values()),
+        "matcher_calls_per_second": round(sum(matcher_calls.values()) / wall_seconds, 1),
+        "completed_trips": market.metrics.total_completed_trips,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "calibration_ops_per_second": round(calibration, 1),
+    }
+    for metric in THROUGHPUT_METRICS:
+        result[f"relative_{metric}"] = round(result[metric] / calibration * 1e6, 3)
+    return result
+
+def aggregate_repeats(results: List[Dict]) -> Dict:
+    """
+    Merges the results of repeated runs of one size: each metric becomes the
+    median over the repeats, and its [min, max] is kept under "ranges".
+    """
+    record = dict(results[0])
+    record["repeats"] = len(results)
+    record["ranges"] = {}
+    for metric in RECORDED_METRICS:
+        values = [result[metric] for result in results]
+        record[metric] = statistics.median(values)
+        record["ranges"][metric] = [min(values), max(values)]
+    return record
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def load_history(path: str) -> List[Dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def run(args):
+    with open(args.config, 'r') as f:
+        base_config = yaml.safe_load(f)
+    run_id = time.strftime("%Y-%m-%dT%H:%M:%S")
+    revision = git_revision()
+
+    print(f"{'riders':>8} | {'startup s':>9} | {'ticks/sec':>10} | {'events/sec':>11} | {'matcher calls/sec':>17} | {'peak RSS MB':>11}")
+    spawn = get_context('spawn')
+    with tempfile.TemporaryDirectory() as output_dir:
+        for riders in args.sizes:
+            config = generate_config(base_config, riders, args.days)
+            results = []
+            for _ in range(args.repeats):
+                # A fresh process per repeat, so peak RSS belongs to that run alone.
+                with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                    results.append(pool.submit(run_size, config, output_dir).result())
+            record = {"benchmark": "simulation_scale", "run_id": run_id, "revision": revision, **aggregate_repeats(results)}
+            print(f"{riders:>8} | {record['startup_seconds']:>9.2f} | {record['ticks_per_second']:>10,.0f} | "
+                  f"{record['events_per_second']:>11,.0f} | {record['matcher_calls_per_second']:>17,.0f} | "
+                  f"{record['peak_rss_mb']:>11,.1f}")
+            if args.history:
+                with open(args.history, 'a') as f:
+                    f.write(json.dumps(record) + "\n")
+
+def _value_range(record: Dict, metric: str) -> List[float]:
+    """The [min, max] of a metric over the repeats (a single value for records without ranges)."""
+    return record.get("ranges", {}).get(metric, [record[metric], record[metric]])
+
+def find_regressions(latest: List[Dict], baseline: List[Dict], threshold: float) -> List[str]:
+    """
+    Compares two runs size by size.
+
+    A metric regresses when its median is worse than the baseline median by
+    more than `threshold` (a fraction of the baseline value) and the change
+    is beyond the measured noise: even the best repeat of the latest run is
+    worse than the worst repeat of the baseline, by more than the metric's
+    NOISE_FLOOR.
+
+    Returns:
+        One message per regressed metric.
+    """
+    baseline_by_size = {(r["riders"], r["days"]): r for r in baseline}
+    regressions = []
+    for record in latest:
+        base = baseline_by_size.get((record["riders"], record["days"]))
+        if base is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = base.get(metric), record.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            old_low, old_high = _value_range(base, metric)
+            new_low, new_high = _value_range(record, metric)
+            floor = NOISE_FLOOR.get(metric, 0.0)
+            beyond_noise = old_low - new_high > floor if higher_is_better else new_low - old_high > floor
+            if (-change if higher_is_better else change) > threshold and beyond_noise:
+                regressions.append(f"{record['riders']} riders: {metric} {old:,.2f} -> {new:,.2f} ({change:+.1%})")
+    return regressions
+
+def select_runs(history: List[Dict], baseline_revision: Optional[str]):
+    """Returns the records of the latest run and of the baseline run (the previous run by default)."""
+    run_ids = list(dict.fromkeys(r["run_id"] for r in history))
+    if not run_ids:
+        return [], []
+    latest_id = run_ids[-1]
+    if baseline_revision is not None:
+        candidates = [i for i in run_ids[:-1] if any(r["revision"] == baseline_revision for r in history if r["run_id"] == i)]
+    else:
+        candidates = run_ids[:-1]
+    baseline_id = candidates[-1] if candidates else None
+    latest = [r for r in history if r["run_id"] == latest_id]
+    baseline = [r for r in history if r["run_id"] == baseline_id]
+    return latest, baseline
+
+def compare(args):
+    latest, baseline = select_runs(load_history(args.history), args.baseline)
+    if not baseline:
+        print(f"No baseline run to compare with in {args.history}.")
+        return 0
+    print(f"Comparing run {latest[0]['run_id']} ({latest[0]['revision']}) "
+          f"with {baseline[0]['run_id']} ({baseline[0]['revision']}), threshold {args.threshold:.0%}.")
+    regressions = find_regressions(latest, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION | {regression}")
+    if not regressions:
+        print("No regressions.")
+    return 1 if regressions else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaled end-to-end simulation benchmark.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Benchmark generated configs at several population sizes.')
+    run_parser.add_argument('--config', type=str, default=BASE_CONFIG, help='Base scenario the configs are generated from.')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000], help='Rider counts to benchmark (one driver per 5 riders).')
+    run_parser.add_argument('--days', type=int, default=1, help='Simulated days per run.')
+    run_parser.add_argument('--repeats', type=int, default=3, help='Runs per size; the median is recorded with the min-max range.')
+    run_parser.add_argument('--history', type=str, default=DEFAULT_HISTORY, help='JSON-lines file to append the results to.')
+
+    compare_parser = commands.add_parser('compare', help='Flag regressions of the latest run against an earlier one.')
+    compare_parser.add_argument('--history', type=str, default=DEFAULT_HISTORY, help='JSON-lines history file.')
+    compare_parser.add_argument('--baseline', type=str, default=None, help='Git revision to compare with (default: the previous run).')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='Relative change counted as a regression.')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,44 @@
 import argparse
+import copy
+import json
+import os
+import random
 import yaml
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict
 from simulator.market.market import Market
 from simulator.platform.matcher import Matcher
 from simulator.platform.platform import Platform
 from simulator.core.engine import Engine
+from simulator.core.run_stats import RunStats
 from simulator.utils.csv_logger import CsvLogger
+from simulator.utils.async_writer import BatchedFileHandler
+from simulator.utils.event_log import BinaryEventLogger, convert_to_csv
+from simulator.market.population_file import build_population_file
+from simulator.utils.monte_carlo import print_replicate_summary, summarize_replicates
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(message)s',
-    filename='simulation.log',
-    filemode='w'
-)
+def load_config(path: str) -> dict:
+    """Loads a YAML configuration file."""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
 
-def main():
-    """Main entry point for the simulator."""
-    parser = argparse.ArgumentParser(description="Ride-hailing simulator.")
-    parser.add_argument('--config', type=str, required=True, help='Path to the configuration file.')
-    args = parser.parse_args()
+def build_population(args):
+    """Pre-generates the population for a config and writes it to a population file."""
+    config = load_config(args.config)
+    num_riders, num_drivers = build_population_file(config, args.output)
+    print(f"Wrote {num_riders} riders and {num_drivers} drivers to {args.output}.")
+    print(f"Set market.population_file: {args.output} in the config to use it.")
 
-    with open(args.config, 'r') as f:
-        config = yaml.safe_load(f)
+def convert_event_log(args):
+    """Rebuilds the CSV event log from a binary event log."""
+    rows = convert_to_csv(args.input, args.output)
+    print(f"Wrote {rows} events to {args.output}.")
 
-    csv_logger = CsvLogger()
+def build_simulation(config: dict, csv_logger):
+    """Builds the market, its platforms and the engine for a config."""
     market = Market(config, csv_logger)
-    
+
     # Create platforms based on the config file
     platforms = []
     for platform_id, platform_config in config['platforms'].items():
@@ -33,9 +46,11 @@ def main():
         matcher = Matcher(
             grid=market.grid,
             max_order_tries=matcher_config['max_order_tries'],
-            ticks_per_major=config['simulation']['ticks_per_major']
+            ticks_per_major=config['simulation']['ticks_per_major'],
+            search_rings=matcher_config.get('search_rings', 1),
+            batch_window_ticks=matcher_config.get('batch_window_ticks', 0)
         )
-        platform = Platform(platform_id, matcher)
+        platform = Platform(platform_id, matcher, base_fare=platform_config.get('base_fare', 20.0))
         platforms.append(platform)
 
     market.set_platforms(platforms)
@@ -43,14 +58,138 @@ def main():
 
     # Link the market to the engine to allow event scheduling
     market.set_engine(engine)
+    return market, engine
+
+def simulate(config: dict, output_dir: str = '.', verbose: bool = True) -> Market:
+    """
+    Runs one simulation of a config.
+
+    simulation.log, the event log and the optional run report and profile are
+    written to `output_dir`. With `verbose`, the summaries are printed.
+
+    Returns:
+        The market, holding the run's SimulationMetrics.
+    """
+    # Log records are formatted and written on a background thread.
+    log_handler = BatchedFileHandler(os.path.join(output_dir, 'simulation.log'), mode='w')
+    log_handler.setFormatter(logging.Formatter('%(asctime)s | %(message)s'))
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(log_handler)
+
+    # Every other generator (e.g. the bulk population sampler) is seeded from `random`.
+    random.seed(config['simulation'].get('random_seed'))
+
+    ticks_per_major = config['simulation']['ticks_per_major']
+    if config['simulation'].get('event_log_format', 'csv') == 'binary':
+        csv_logger = BinaryEventLogger(os.path.join(output_dir, 'simulation_log.bin'), ticks_per_major=ticks_per_major,
+                                       platform_ids=config['platforms'])
+    else:
+        csv_logger = CsvLogger(os.path.join(output_dir, 'simulation_log.csv'), ticks_per_major=ticks_per_major)
+    try:
+        market, engine = build_simulation(config, csv_logger)
+
+        instrumentation_config = dict(config.get('instrumentation') or {})
+        if instrumentation_config.get('profile_file'):
+            instrumentation_config['profile_file'] = os.path.join(output_dir, instrumentation_config['profile_file'])
+        stats = engine.run(
+            duration_days=config['simulation']['duration_days'],
+            ticks_per_major=config['simulation']['ticks_per_major'],
+            skip_idle_ticks=config['simulation'].get('skip_idle_ticks', False),
+            stats=RunStats.from_config(instrumentation_config)
+        )
+
+        if verbose:
+            market.metrics.print_summary()
+            market.output.print_summary()
+            stats.print_summary()
+        report_file = instrumentation_config.get('report_file')
+        if report_file:
+            stats.write_report(os.path.join(output_dir, report_file))
+            if verbose:
+                print(f"Run report written to {report_file}.")
+    finally:
+        try:
+            csv_logger.close()
+        finally:
+            root_logger.removeHandler(log_handler)
+            log_handler.close()
+    return market
 
-    engine.run(
-        duration_days=config['simulation']['duration_days'],
-        ticks_per_major=config['simulation']['ticks_per_major']
-    )
+def run_simulation(args):
+    """Runs a single simulation."""
+    simulate(load_config(args.config))
 
-    market.metrics.print_summary()
-    csv_logger.close()
+def run_replicate(config: dict, seed: int, output_dir: str) -> Dict[str, float]:
+    """Runs one seed of a config in `output_dir` and returns its summary metrics. Runs in a worker process."""
+    config = copy.deepcopy(config)
+    config['simulation']['random_seed'] = seed
+    # Workers share the terminal: no per-day progress lines.
+    config['instrumentation'] = {**(config.get('instrumentation') or {}), 'progress': False}
+    os.makedirs(output_dir, exist_ok=True)
+    return simulate(config, output_dir, verbose=False).metrics.summary_values()
+
+def run_monte_carlo(args):
+    """Runs many seeds of a config in parallel and reports means and confidence intervals."""
+    config = load_config(args.config)
+    first_seed = args.first_seed if args.first_seed is not None else config['simulation'].get('random_seed') or 0
+    seeds = list(range(first_seed, first_seed + args.runs))
+    workers = args.workers or os.cpu_count()
+    print(f"Running {len(seeds)} seeds on {workers} worker processes; output in {args.output_dir}/.")
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(run_replicate, config, seed, os.path.join(args.output_dir, f"seed_{seed}")): seed
+            for seed in seeds
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            print(f"Seed {futures[future]} done ({len(results)}/{len(seeds)}).")
+
+    runs = [results[seed] for seed in seeds]
+    summary = summarize_replicates(runs)
+    print_replicate_summary(summary)
+    with open(os.path.join(args.output_dir, 'summary.json'), 'w') as f:
+        json.dump({"seeds": seeds, "runs": runs, "summary": summary}, f, indent=2)
+    print(f"Per-seed metrics and the summary written to {os.path.join(args.output_dir, 'summary.json')}.")
+
+def main():
+    """Main entry point for the simulator."""
+    parser = argparse.ArgumentParser(description="Ride-hailing simulator.")
+    parser.add_argument('--config', type=str, help='Path to the configuration file.')
+    subparsers = parser.add_subparsers(dest='command')
+
+    population_parser = subparsers.add_parser('population', help='Manage pre-generated population files.')
+    population_commands = population_parser.add_subparsers(dest='population_command', required=True)
+    build_parser = population_commands.add_parser('build', help='Generate a population and write it to disk.')
+    build_parser.add_argument('--config', type=str, required=True, help='Path to the configuration file.')
+    build_parser.add_argument('--output', type=str, required=True, help='Path of the population file to write.')
+
+    event_log_parser = subparsers.add_parser('eventlog', help='Work with binary event logs.')
+    event_log_commands = event_log_parser.add_subparsers(dest='event_log_command', required=True)
+    to_csv_parser = event_log_commands.add_parser('to-csv', help='Convert a binary event log to the CSV layout.')
+    to_csv_parser.add_argument('--input', type=str, default='simulation_log.bin', help='Path of the binary event log.')
+    to_csv_parser.add_argument('--output', type=str, default='simulation_log.csv', help='Path of the CSV file to write.')
+
+    monte_carlo_parser = subparsers.add_parser('montecarlo', help='Run many seeds of a config in parallel and aggregate their metrics.')
+    monte_carlo_parser.add_argument('--config', type=str, required=True, help='Path to the configuration file.')
+    monte_carlo_parser.add_argument('--runs', type=int, default=30, help='Number of seeds to run.')
+    monte_carlo_parser.add_argument('--first-seed', type=int, default=None, help='First seed (default: simulation.random_seed); seeds are consecutive.')
+    monte_carlo_parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: one per CPU core).')
+    monte_carlo_parser.add_argument('--output-dir', type=str, default='runs', help='Directory holding one output directory per seed.')
+
+    args = parser.parse_args()
+    if args.command == 'population':
+        build_population(args)
+    elif args.command == 'eventlog':
+        convert_event_log(args)
+    elif args.command == 'montecarlo':
+        run_monte_carlo(args)
+    elif args.config:
+        run_simulation(args)
+    else:
+        parser.error("the following arguments are required: --config")
 
 if __name__ == "__main__":
     main()
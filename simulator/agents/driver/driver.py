@@ -1,5 +1,5 @@
 from enum import Enum, auto
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 class DriverState(Enum):
     """Enumeration for the possible states of a DriverAgent."""
@@ -11,7 +11,15 @@ class DriverState(Enum):
 class DriverAgent:
     """
     Represents a driver in the simulation.
+
+    Uses __slots__ to keep the per-agent memory footprint small.
     """
+    __slots__ = (
+        "agent_id", "is_exclusive", "exclusive_platform_id",
+        "preference_score", "price_sensitivity", "eta_sensitivity",
+        "current_state", "location", "idle_timer", "match",
+    )
+
     def __init__(
         self,
         agent_id: int,
@@ -19,7 +27,8 @@ class DriverAgent:
         is_exclusive: bool,
         preference_score: float,
         price_sensitivity: float,
-        eta_sensitivity: float
+        eta_sensitivity: float,
+        exclusive_platform_id: Optional[str] = None
     ):
         """
         Initializes a DriverAgent with its core attributes and default state.
@@ -27,6 +36,9 @@ class DriverAgent:
         # --- Core Identity & Attributes ---
         self.agent_id: int = agent_id
         self.is_exclusive: bool = is_exclusive
+        # The one platform an exclusive driver takes orders from, drawn when the
+        # population is generated. None for multi-homing drivers.
+        self.exclusive_platform_id: Optional[str] = exclusive_platform_id if is_exclusive else None
 
         # --- Behavioral Properties ---
         self.preference_score: float = preference_score
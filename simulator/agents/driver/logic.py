@@ -1,5 +1,9 @@
+from typing import Sequence, Tuple, Union
+import numpy as np
 from ..driver.driver import DriverAgent
 
+ArrayLike = Union[float, np.ndarray]
+
 def calculate_profitability_score(
     driver: DriverAgent,
     fare: float,
@@ -13,3 +17,37 @@ def calculate_profitability_score(
         - (driver.eta_sensitivity * eta_to_rider)
     )
     return score
+
+def calculate_profitability_scores(
+    price_sensitivity: np.ndarray,
+    eta_sensitivity: np.ndarray,
+    fare: ArrayLike,
+    eta_to_rider: ArrayLike
+) -> np.ndarray:
+    """
+    Vectorized `calculate_profitability_score`.
+
+    Scores many drivers at once from their sensitivity columns (e.g. the
+    driver columns of a ColumnarAgentStore, or `driver_sensitivities`).
+    `fare` and `eta_to_rider` may be scalars (one offer) or arrays that
+    broadcast against the columns (e.g. one ETA per driver). The arithmetic
+    matches the scalar function exactly.
+    """
+    return (price_sensitivity * fare) - (eta_sensitivity * eta_to_rider)
+
+def driver_sensitivities(drivers: Sequence[DriverAgent]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the price and ETA sensitivity columns of a list of drivers.
+    """
+    count = len(drivers)
+    price_sensitivity = np.fromiter((driver.price_sensitivity for driver in drivers), dtype=np.float64, count=count)
+    eta_sensitivity = np.fromiter((driver.eta_sensitivity for driver in drivers), dtype=np.float64, count=count)
+    return price_sensitivity, eta_sensitivity
+
+def serves_platform(driver: DriverAgent, platform_id: str) -> bool:
+    """
+    Returns True if the driver accepts orders from the given platform.
+    Exclusive drivers only serve the platform drawn for them when the population
+    was generated; non-exclusive drivers multi-home and serve every platform.
+    """
+    return driver.exclusive_platform_id is None or driver.exclusive_platform_id == platform_id
@@ -1,5 +1,9 @@
+from typing import Sequence, Tuple, Union
+import numpy as np
 from ..rider.rider import RiderAgent
 
+ArrayLike = Union[float, np.ndarray]
+
 def calculate_utility(
     rider: RiderAgent,
     price: float,
@@ -15,3 +19,38 @@ def calculate_utility(
         + (preference_score_weight * rider.preference_score)
     )
     return utility
+
+def calculate_utilities(
+    price_sensitivity: np.ndarray,
+    time_sensitivity: np.ndarray,
+    preference_score: np.ndarray,
+    price: ArrayLike,
+    eta: ArrayLike,
+    preference_score_weight: ArrayLike
+) -> np.ndarray:
+    """
+    Vectorized `calculate_utility`.
+
+    Scores offers for many riders at once from their sensitivity columns. With
+    1-D rider columns and scalar offer terms, one offer is scored for every
+    rider. To score many offers against many riders, pass the rider columns as
+    a column (`[:, None]`) and the offer terms as rows: the result has one row
+    per rider and one column per offer. The arithmetic matches the scalar
+    function exactly.
+    """
+    return (
+        (-price_sensitivity * price)
+        + (-time_sensitivity * eta)
+        + (preference_score_weight * preference_score)
+    )
+
+def rider_sensitivities(riders: Sequence[RiderAgent]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the price sensitivity, time sensitivity and preference score columns
+    of a list of riders.
+    """
+    count = len(riders)
+    return tuple(
+        np.fromiter((getattr(rider, name) for rider in riders), dtype=np.float64, count=count)
+        for name in ("price_sensitivity", "time_sensitivity", "preference_score")
+    )
@@ -14,14 +14,26 @@ class RiderState(Enum):
     ON_TRIP = auto()            # In a vehicle, on the way to destination
     ABANDONED_SEARCH = auto()   # Gave up searching for a ride
 
+# Patience used when a rider is created without one (~3 minutes of 10-second ticks).
+DEFAULT_PATIENCE_TICKS = 18
+
 class RiderAgent:
     """
     Represents a rider in the simulation.
 
     This class holds the state and properties of a single rider agent.
     All decision-making logic will be handled by other modules to keep this class
-    as a clean data container.
+    as a clean data container. It uses __slots__ to keep the per-agent memory
+    footprint small, since memory per agent bounds the size of city we can simulate.
     """
+    __slots__ = (
+        "agent_id", "has_app_a", "has_app_b",
+        "preference_score", "price_sensitivity", "time_sensitivity",
+        "rides_per_week", "patience_ticks",
+        "current_state", "location", "patience_timer", "active_order_id", "match",
+        "_active_discounts", "_enrolled_tests",
+    )
+
     def __init__(
         self,
         agent_id: int,
@@ -32,7 +44,7 @@ class RiderAgent:
         price_sensitivity: float,
         time_sensitivity: float,
         rides_per_week: float,
-        patience_ticks: int
+        patience_ticks: int = DEFAULT_PATIENCE_TICKS
     ):
         """
         Initializes a RiderAgent with its core attributes and default state.
@@ -61,11 +73,35 @@ class RiderAgent:
         self.match: Dict[str, Any] = None
 
         # --- Incentives & Testing ---
-        # A list to store any active discounts offered to this rider.
-        self.active_discounts: List[Dict[str, Any]] = []
-        # A dictionary to track which A/B tests the rider is enrolled in.
-        # Format: {test_id: variant_id}
-        self.enrolled_tests: Dict[str, str] = {}
+        # Most riders never receive a discount or join a test, so these containers
+        # are only allocated on first access (see the properties below).
+        self._active_discounts: Optional[List[Dict[str, Any]]] = None
+        self._enrolled_tests: Optional[Dict[str, str]] = None
+
+    @property
+    def active_discounts(self) -> List[Dict[str, Any]]:
+        """A list to store any active discounts offered to this rider."""
+        if self._active_discounts is None:
+            self._active_discounts = []
+        return self._active_discounts
+
+    @active_discounts.setter
+    def active_discounts(self, value: List[Dict[str, Any]]):
+        self._active_discounts = value
+
+    @property
+    def enrolled_tests(self) -> Dict[str, str]:
+        """
+        A dictionary to track which A/B tests the rider is enrolled in.
+        Format: {test_id: variant_id}
+        """
+        if self._enrolled_tests is None:
+            self._enrolled_tests = {}
+        return self._enrolled_tests
+
+    @enrolled_tests.setter
+    def enrolled_tests(self, value: Dict[str, str]):
+        self._enrolled_tests = value
 
     def __repr__(self) -> str:
         """
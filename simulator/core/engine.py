@@ -1,6 +1,7 @@
 import time
-from typing import List
-from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from simulator.core.event_queue import EventQueue
+from simulator.core.run_stats import RunStats
 
 class Engine:
     """
@@ -16,38 +17,113 @@ class Engine:
         """
         self.market = market
         self.platforms = platforms
-        self.event_schedule = defaultdict(list)
+        self.event_queue = EventQueue()
         self.current_tick = 0
+        self.stats: Optional[RunStats] = None
 
-    def schedule_event(self, tick, event):
-        self.event_schedule[tick].append(event)
+    def schedule_event(self, tick: int, event: Any) -> int:
+        """
+        Schedules an event to be handled by the market at the given tick.
+
+        Returns:
+            A handle that can be used to cancel the event.
+        """
+        return self.event_queue.push(tick, event)
+
+    def cancel_event(self, handle: int) -> bool:
+        """
+        Cancels a previously scheduled event.
+
+        Returns:
+            True if the event was still pending and has been cancelled.
+        """
+        return self.event_queue.cancel(handle)
 
-    def run(self, duration_days: int, ticks_per_major: int):
+    def get_queue_stats(self) -> Dict[str, int]:
+        """Returns the depth and memory footprint of the event queue."""
+        return self.event_queue.stats()
+
+    def run(self, duration_days: int, ticks_per_major: int, skip_idle_ticks: bool = False,
+            stats: Optional[RunStats] = None) -> RunStats:
         """
         Runs the simulation.
 
         Args:
             duration_days: The duration of the simulation in days.
             ticks_per_major: The number of minor ticks per major tick.
+            skip_idle_ticks: If True, run in discrete-event mode: whenever no
+                market phase reports pending work, jump straight to the next
+                tick with a scheduled event (or the next major tick).
+            stats: Collects phase timings, event counts and the progress
+                line (a default RunStats is used if None).
+
+        Returns:
+            The RunStats of the run.
         """
+        self.stats = stats = stats if stats is not None else RunStats()
+        phase_seconds = stats.phase_seconds
+        event_counts = stats.event_counts
+        clock = time.perf_counter
         total_ticks = duration_days * ticks_per_major
-        for self.current_tick in range(total_ticks):
+        self.ticks_processed = 0
+        self.ticks_skipped = 0
+        self.current_tick = 0
+        stats.start_run(duration_days, ticks_per_major)
+        while self.current_tick < total_ticks:
             day = self.current_tick // ticks_per_major
             tick_in_day = self.current_tick % ticks_per_major
+            if tick_in_day == 0:
+                stats.start_day(day, self.ticks_processed)
 
             # --- Event-Driven Logic ---
-            events = self.event_schedule.get(self.current_tick, [])
-            for event in events:
+            t0 = clock()
+            for event in self.event_queue.pop_due(self.current_tick):
                 self.market.handle_event(event, self.current_tick)
+                # Tuple events are counted by opcode, any other event by its type.
+                event_counts[event[0] if type(event) is tuple else type(event).__name__] += 1
+            t1 = clock()
 
             # --- Minor Tick Logic (remains the same) ---
-            self.market.process_rider_searches(day, tick_in_day)
-            self.market.process_matcher_offers(day, tick_in_day)
-            self.market.process_driver_responses(day, tick_in_day)
-            self.market.update_agent_locations(day, tick_in_day)
+            # Each phase reports whether it still has work for the next tick.
+            searches_pending = self.market.process_rider_searches(day, tick_in_day)
+            t2 = clock()
+            offers_pending = self.market.process_matcher_offers(day, tick_in_day)
+            t3 = clock()
+            responses_pending = self.market.process_driver_responses(day, tick_in_day)
+            t4 = clock()
+            movement_pending = self.market.update_agent_locations(day, tick_in_day)
+            t5 = clock()
+            phase_seconds[0] += t1 - t0
+            phase_seconds[1] += t2 - t1
+            phase_seconds[2] += t3 - t2
+            phase_seconds[3] += t4 - t3
+            phase_seconds[4] += t5 - t4
 
             # --- Major Tick Logic (simplified) ---
-            if self.current_tick % ticks_per_major == 0:
+            if tick_in_day == 0:
                 self.market.update_platform_strategies(day)
-                print(f"Day {day + 1} complete.")
-                time.sleep(0.1)
\ No newline at end of file
+                phase_seconds[5] += clock() - t5
+
+            self.ticks_processed += 1
+            work_pending = searches_pending or offers_pending or responses_pending or movement_pending
+            if skip_idle_ticks and not work_pending:
+                next_tick = self._next_active_tick(ticks_per_major, total_ticks)
+            else:
+                next_tick = self.current_tick + 1
+            self.ticks_skipped += next_tick - self.current_tick - 1
+            self.current_tick = next_tick
+        stats.end_run(self.ticks_processed, self.ticks_skipped)
+        return stats
+
+    def _next_active_tick(self, ticks_per_major: int, total_ticks: int) -> int:
+        """
+        Returns the next tick that needs processing when the market is idle:
+        the earliest of the next scheduled event, the next major tick and the
+        end of the run.
+        """
+        next_major_tick = (self.current_tick // ticks_per_major + 1) * ticks_per_major
+        next_tick = min(next_major_tick, total_ticks)
+        next_event_tick = self.event_queue.peek_tick()
+        if next_event_tick is not None:
+            next_tick = min(next_tick, max(next_event_tick, self.current_tick + 1))
+        return next_tick
@@ -0,0 +1,145 @@
+import heapq
+import sys
+from typing import Any, Dict, Iterator, List, Optional
+
+# Layout of a heap key: | tick | sequence (40 bits) | slot (32 bits) |
+# Keys order by tick, then by scheduling order within a tick.
+_SLOT_BITS = 32
+_SEQUENCE_BITS = 40
+_TICK_SHIFT = _SLOT_BITS + _SEQUENCE_BITS
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+
+# Marks a free slot in the key array.
+_FREE = -1
+
+class EventQueue:
+    """
+    A priority queue of scheduled events, ordered by tick.
+
+    Events scheduled for the same tick are returned in the order they were
+    scheduled, so runs stay deterministic. The heap holds plain integers that
+    encode the tick, a sequence number and the slot of the event payload;
+    payloads live in preallocated slot arrays whose slots are recycled through
+    a free list, so scheduling an event allocates no per-entry containers.
+    Cancelled entries are skipped when they reach the top of the heap.
+    """
+    def __init__(self):
+        """
+        Initializes an empty EventQueue.
+        """
+        self._heap: List[int] = []
+        self._sequence = 0
+        # Payload and current heap key of each slot (_FREE when unused).
+        self._payloads: List[Any] = []
+        self._keys: List[int] = []
+        self._free_slots: List[int] = []
+        self._cancelled_count = 0
+
+    def push(self, tick: int, event: Any) -> int:
+        """
+        Schedules an event for the given tick.
+
+        Returns:
+            A handle that can be passed to `cancel`.
+        """
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._keys)
+            self._payloads.append(None)
+            self._keys.append(_FREE)
+        key = (tick << _TICK_SHIFT) | (self._sequence << _SLOT_BITS) | slot
+        self._sequence += 1
+        self._payloads[slot] = event
+        self._keys[slot] = key
+        heapq.heappush(self._heap, key)
+        return key
+
+    def _release(self, slot: int):
+        """Frees a slot for reuse."""
+        self._payloads[slot] = None
+        self._keys[slot] = _FREE
+        self._free_slots.append(slot)
+
+    def cancel(self, handle: int) -> bool:
+        """
+        Cancels a scheduled event.
+
+        The slot is freed at once; the stale heap key is discarded when it
+        reaches the top of the queue.
+
+        Returns:
+            True if the event was pending and is now cancelled, False otherwise.
+        """
+        slot = handle & _SLOT_MASK
+        if slot >= len(self._keys) or self._keys[slot] != handle:
+            return False
+        self._release(slot)
+        self._cancelled_count += 1
+        return True
+
+    def peek_tick(self) -> Optional[int]:
+        """
+        Returns the tick of the next pending event, or None if the queue is empty.
+        """
+        self._discard_cancelled()
+        return self._heap[0] >> _TICK_SHIFT if self._heap else None
+
+    def pop_due(self, tick: int) -> Iterator[Any]:
+        """
+        Yields, in order, every pending event scheduled at or before `tick`.
+
+        Events scheduled for `tick` while iterating are also yielded, matching
+        the behavior of appending to the current tick's bucket.
+        """
+        heap = self._heap
+        keys = self._keys
+        payloads = self._payloads
+        # Every key of a tick at or before `tick` is below this bound.
+        bound = (tick + 1) << _TICK_SHIFT
+        while heap and heap[0] < bound:
+            key = heapq.heappop(heap)
+            slot = key & _SLOT_MASK
+            if keys[slot] != key:
+                self._cancelled_count -= 1
+                continue
+            event = payloads[slot]
+            self._release(slot)
+            yield event
+
+    def _discard_cancelled(self):
+        """Drops cancelled entries from the top of the heap."""
+        heap = self._heap
+        keys = self._keys
+        while heap and keys[heap[0] & _SLOT_MASK] != heap[0]:
+            heapq.heappop(heap)
+            self._cancelled_count -= 1
+
+    def memory_bytes(self) -> int:
+        """
+        Returns an estimate of the memory held by the queue structures, in bytes.
+
+        Event payloads are included at their shallow size.
+        """
+        total = sys.getsizeof(self._heap) + sys.getsizeof(self._payloads)
+        total += sys.getsizeof(self._keys) + sys.getsizeof(self._free_slots)
+        total += sum(sys.getsizeof(key) for key in self._heap)
+        total += sum(sys.getsizeof(event) for event in self._payloads if event is not None)
+        return total
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the current queue depth and memory footprint.
+        """
+        return {
+            "pending_events": len(self),
+            "cancelled_entries": self._cancelled_count,
+            "memory_bytes": self.memory_bytes(),
+        }
+
+    def __len__(self) -> int:
+        """Returns the number of pending (non-cancelled) events."""
+        return len(self._keys) - len(self._free_slots)
+
+    def __repr__(self) -> str:
+        return f"EventQueue(pending={len(self)})"
@@ -0,0 +1,23 @@
+from enum import IntEnum
+from typing import Tuple
+
+class EventType(IntEnum):
+    """
+    Opcodes of the events the Market schedules on the engine.
+
+    Events are plain `(event_type, agent_id, arg)` tuples: `arg` carries one
+    integer of extra data (e.g. the tick a driver session ends) and is 0 when
+    unused. The Market dispatches on the opcode through a handler table, so a
+    new event type only needs a new opcode and a registered handler.
+    """
+    EVALUATE_DRIVER_GO_ONLINE = 0
+    EVALUATE_RIDER_SEARCH_INTENT = 1
+    RIDER_SEARCH = 2
+    DRIVER_SESSION_START = 3
+    DRIVER_SESSION_END = 4
+    DRIVER_ARRIVED_AT_PICKUP = 5
+    TRIP_COMPLETED = 6
+    RIDER_SEARCH_TIMEOUT = 7
+
+# (event_type, agent_id, arg)
+Event = Tuple[EventType, int, int]
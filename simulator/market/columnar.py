@@ -0,0 +1,194 @@
+from itertools import chain
+from operator import attrgetter
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from simulator.agents.rider.rider import RiderAgent, RiderState
+from simulator.agents.driver.driver import DriverAgent, DriverState
+
+# Platform codes used by the vectorized platform choice.
+PLATFORM_NONE = 0
+PLATFORM_A = 1
+PLATFORM_B = 2
+PLATFORM_IDS = (None, 'A', 'B')
+
+# Number of search-intent evaluations per week (one every 15 minutes).
+EVALUATIONS_PER_WEEK = 7 * 24 * 4
+
+def _fill_column(column: np.ndarray, agents: List, value: Callable):
+    column[:] = np.fromiter(map(value, agents), dtype=column.dtype, count=len(agents))
+
+def _fill_states(column: np.ndarray, agents: List, state_enum):
+    state_values = {state: state.value for state in state_enum}
+    _fill_column(column, agents, lambda agent: state_values[agent.current_state])
+
+def _locations(agents: List) -> np.ndarray:
+    """The agents' (x, y) locations as an (n, 2) array."""
+    flat = np.fromiter(chain.from_iterable(map(attrgetter("location"), agents)), dtype=np.int32, count=2 * len(agents))
+    return flat.reshape(-1, 2)
+
+class ColumnarAgentStore:
+    """
+    A struct-of-arrays copy of the rider and driver populations.
+
+    Each agent attribute lives in its own NumPy column, indexed by the agent's
+    position (rider id for riders, id minus the driver id offset for drivers).
+    The Market keeps the columns in sync with the agent objects so that the
+    per-tick kernels below can work on whole populations at once.
+
+    The store is a copy kept next to the agent objects, not a replacement:
+    it adds about 51 bytes per rider and 34 per driver (see `memory_bytes`)
+    in exchange for vectorized kernels.
+    """
+    def __init__(self, num_riders: int, num_drivers: int, driver_id_offset: Optional[int] = None):
+        """
+        Initializes an empty ColumnarAgentStore.
+
+        Args:
+            num_riders: The size of the rider population.
+            num_drivers: The size of the driver population.
+            driver_id_offset: The id of the first driver (defaults to num_riders).
+        """
+        self.num_riders = num_riders
+        self.num_drivers = num_drivers
+        self.driver_id_offset = num_riders if driver_id_offset is None else driver_id_offset
+
+        # --- Rider columns ---
+        self.rider_x = np.zeros(num_riders, dtype=np.int32)
+        self.rider_y = np.zeros(num_riders, dtype=np.int32)
+        self.rider_state = np.full(num_riders, RiderState.IDLE.value, dtype=np.int8)
+        self.has_app_a = np.zeros(num_riders, dtype=bool)
+        self.has_app_b = np.zeros(num_riders, dtype=bool)
+        self.rider_preference_score = np.zeros(num_riders, dtype=np.float64)
+        self.rider_price_sensitivity = np.zeros(num_riders, dtype=np.float64)
+        self.rider_time_sensitivity = np.zeros(num_riders, dtype=np.float64)
+        self.rides_per_week = np.zeros(num_riders, dtype=np.float64)
+        self.patience_ticks = np.zeros(num_riders, dtype=np.int32)
+        self.patience_timer = np.zeros(num_riders, dtype=np.int32)
+
+        # --- Driver columns ---
+        self.driver_x = np.zeros(num_drivers, dtype=np.int32)
+        self.driver_y = np.zeros(num_drivers, dtype=np.int32)
+        self.driver_state = np.full(num_drivers, DriverState.OFFLINE.value, dtype=np.int8)
+        self.is_exclusive = np.zeros(num_drivers, dtype=bool)
+        self.driver_preference_score = np.zeros(num_drivers, dtype=np.float64)
+        self.driver_price_sensitivity = np.zeros(num_drivers, dtype=np.float64)
+        self.driver_eta_sensitivity = np.zeros(num_drivers, dtype=np.float64)
+
+    @classmethod
+    def from_agents(cls, riders: List[RiderAgent], drivers: List[DriverAgent]) -> "ColumnarAgentStore":
+        """
+        Builds a store from agent objects with contiguous ids.
+
+        Each column is filled in one pass over the objects with `np.fromiter`.
+        """
+        driver_id_offset = drivers[0].agent_id if drivers else len(riders)
+        store = cls(len(riders), len(drivers), driver_id_offset)
+        rider_xy = _locations(riders)
+        store.rider_x[:], store.rider_y[:] = rider_xy[:, 0], rider_xy[:, 1]
+        _fill_states(store.rider_state, riders, RiderState)
+        _fill_column(store.has_app_a, riders, attrgetter("has_app_a"))
+        _fill_column(store.has_app_b, riders, attrgetter("has_app_b"))
+        _fill_column(store.rider_preference_score, riders, attrgetter("preference_score"))
+        _fill_column(store.rider_price_sensitivity, riders, attrgetter("price_sensitivity"))
+        _fill_column(store.rider_time_sensitivity, riders, attrgetter("time_sensitivity"))
+        _fill_column(store.rides_per_week, riders, attrgetter("rides_per_week"))
+        _fill_column(store.patience_ticks, riders, attrgetter("patience_ticks"))
+        _fill_column(store.patience_timer, riders, attrgetter("patience_timer"))
+        driver_xy = _locations(drivers)
+        store.driver_x[:], store.driver_y[:] = driver_xy[:, 0], driver_xy[:, 1]
+        _fill_states(store.driver_state, drivers, DriverState)
+        _fill_column(store.is_exclusive, drivers, attrgetter("is_exclusive"))
+        _fill_column(store.driver_preference_score, drivers, attrgetter("preference_score"))
+        _fill_column(store.driver_price_sensitivity, drivers, attrgetter("price_sensitivity"))
+        _fill_column(store.driver_eta_sensitivity, drivers, attrgetter("eta_sensitivity"))
+        return store
+
+    @classmethod
+    def from_rows(cls, rider_rows: np.ndarray, driver_rows: np.ndarray) -> "ColumnarAgentStore":
+        """
+        Builds a store straight from population rows (see `market/population.py`),
+        without going through the agent objects. Drivers get ids after the riders.
+        """
+        store = cls(len(rider_rows), len(driver_rows))
+        store.rider_x[:] = rider_rows["x"]
+        store.rider_y[:] = rider_rows["y"]
+        store.has_app_a[:] = rider_rows["has_app_a"]
+        store.has_app_b[:] = rider_rows["has_app_b"]
+        store.rider_preference_score[:] = rider_rows["preference_score"]
+        store.rider_price_sensitivity[:] = rider_rows["price_sensitivity"]
+        store.rider_time_sensitivity[:] = rider_rows["time_sensitivity"]
+        store.rides_per_week[:] = rider_rows["rides_per_week"]
+        store.patience_ticks[:] = rider_rows["patience_ticks"]
+        store.driver_x[:] = driver_rows["x"]
+        store.driver_y[:] = driver_rows["y"]
+        store.is_exclusive[:] = driver_rows["is_exclusive"]
+        store.driver_preference_score[:] = driver_rows["preference_score"]
+        store.driver_price_sensitivity[:] = driver_rows["price_sensitivity"]
+        store.driver_eta_sensitivity[:] = driver_rows["eta_sensitivity"]
+        return store
+
+    def set_rider_state(self, rider_id: int, state: RiderState):
+        self.rider_state[rider_id] = state.value
+
+    def set_driver_state(self, driver_id: int, state: DriverState):
+        self.driver_state[driver_id - self.driver_id_offset] = state.value
+
+    def set_rider_location(self, rider_id: int, location: Tuple[int, int]):
+        self.rider_x[rider_id], self.rider_y[rider_id] = location
+
+    def set_driver_location(self, driver_id: int, location: Tuple[int, int]):
+        index = driver_id - self.driver_id_offset
+        self.driver_x[index], self.driver_y[index] = location
+
+    def memory_bytes(self) -> int:
+        """Returns the number of bytes held by the columns."""
+        return sum(column.nbytes for column in vars(self).values() if isinstance(column, np.ndarray))
+
+    def __repr__(self) -> str:
+        return f"ColumnarAgentStore(riders={self.num_riders}, drivers={self.num_drivers})"
+
+# --- Vectorized per-tick kernels ---
+
+def roll_search_intent(store: ColumnarAgentStore, rider_ids: np.ndarray, draws: np.ndarray) -> np.ndarray:
+    """
+    Vectorized search-intent roll.
+
+    Mirrors the scalar rule in `Market.handle_event`: an idle rider starts a
+    search when its draw is below `rides_per_week / EVALUATIONS_PER_WEEK`.
+
+    Returns:
+        A boolean mask over `rider_ids` of the riders that start searching.
+    """
+    idle = store.rider_state[rider_ids] == RiderState.IDLE.value
+    probability = store.rides_per_week[rider_ids] / EVALUATIONS_PER_WEEK
+    return idle & (draws < probability)
+
+def choose_platforms(store: ColumnarAgentStore, rider_ids: np.ndarray) -> np.ndarray:
+    """
+    Vectorized platform choice for searching riders.
+
+    Riders with app A and a positive preference pick A; riders with app B and a
+    non-positive preference pick B; otherwise they fall back to whichever app
+    they have.
+
+    Returns:
+        An array of platform codes (PLATFORM_NONE, PLATFORM_A or PLATFORM_B).
+    """
+    has_a = store.has_app_a[rider_ids]
+    has_b = store.has_app_b[rider_ids]
+    prefers_a = store.rider_preference_score[rider_ids] > 0
+    return np.select(
+        [has_a & prefers_a, has_b & ~prefers_a, has_a, has_b],
+        [PLATFORM_A, PLATFORM_B, PLATFORM_A, PLATFORM_B],
+        default=PLATFORM_NONE,
+    ).astype(np.int8)
+
+def countdown_patience(store: ColumnarAgentStore, rider_ids: np.ndarray) -> np.ndarray:
+    """
+    Decrements the patience timers of riders whose matching attempt failed.
+
+    Returns:
+        A boolean mask over `rider_ids` of the riders who ran out of patience.
+    """
+    store.patience_timer[rider_ids] -= 1
+    return store.patience_timer[rider_ids] <= 0
@@ -0,0 +1,67 @@
+import math
+import random
+from typing import List, Optional, Sequence
+
+HOURS_PER_DAY = 24
+
+class PoissonDemand:
+    """
+    Samples when riders next want a ride.
+
+    Each rider's searches follow a Poisson process with a mean of
+    `rides_per_week` per week (a week is 7 major ticks), optionally shaped by
+    an hourly time-of-day profile. Instead of polling every rider on a fixed
+    interval, the Market schedules one event per rider at the sampled time of
+    their next search.
+    """
+    def __init__(self, ticks_per_major: int, hourly_profile: Optional[Sequence[float]] = None):
+        """
+        Initializes the PoissonDemand.
+
+        Args:
+            ticks_per_major: The number of minor ticks per day.
+            hourly_profile: Optional list of 24 relative demand weights, one per
+                hour of the day. They are normalized to average 1, so the profile
+                shifts demand across the day without changing the weekly total.
+        """
+        self.ticks_per_major = ticks_per_major
+        self.ticks_per_week = 7 * ticks_per_major
+        self.hourly_weights: Optional[List[float]] = None
+        self._max_weight = 1.0
+        if hourly_profile is not None:
+            if len(hourly_profile) != HOURS_PER_DAY or min(hourly_profile) < 0 or sum(hourly_profile) <= 0:
+                raise ValueError("market.demand_profile must hold 24 non-negative hourly weights with a positive sum.")
+            mean = sum(hourly_profile) / HOURS_PER_DAY
+            self.hourly_weights = [weight / mean for weight in hourly_profile]
+            self._max_weight = max(self.hourly_weights)
+
+    def rate_per_tick(self, rides_per_week: float) -> float:
+        """Returns the average number of searches per minor tick."""
+        return rides_per_week / self.ticks_per_week
+
+    def weight_at(self, tick: float) -> float:
+        """Returns the relative demand at a (fractional) tick."""
+        if self.hourly_weights is None:
+            return 1.0
+        hour = int((tick % self.ticks_per_major) * HOURS_PER_DAY / self.ticks_per_major)
+        return self.hourly_weights[hour]
+
+    def next_search_tick(self, rides_per_week: float, current_tick: int) -> Optional[int]:
+        """
+        Samples the tick of a rider's next search after `current_tick`.
+
+        With a profile, arrivals are drawn at the peak rate and thinned by the
+        profile weight at the tick they fall on.
+
+        Returns:
+            The tick of the next search, or None if the rider never searches.
+        """
+        if rides_per_week <= 0:
+            return None
+        peak_rate = self.rate_per_tick(rides_per_week) * self._max_weight
+        arrival = float(current_tick)
+        while True:
+            arrival += random.expovariate(peak_rate)
+            tick = max(current_tick + 1, math.ceil(arrival))
+            if self.hourly_weights is None or random.random() * self._max_weight < self.weight_at(tick):
+                return tick
@@ -1,12 +1,25 @@
+import heapq
 import random
 import logging
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from simulator.core.events import Event, EventType
 from simulator.market.space import HexGrid
+from simulator.market.travel_time import TravelTimeTable
+from simulator.market.demand import PoissonDemand
+from simulator.market.supply import SessionSupply
+from simulator.market.registry import AgentRegistry
+from simulator.market.state_index import StateIndex
+from simulator.market.population import generate_riders, generate_drivers, riders_from_rows, drivers_from_rows, platform_ids
+from simulator.market.population_file import load_population_file
+from simulator.market.columnar import ColumnarAgentStore, PLATFORM_IDS, PLATFORM_NONE, roll_search_intent, choose_platforms, countdown_patience
 from simulator.agents.rider.rider import RiderAgent, RiderState
 from simulator.agents.driver.driver import DriverAgent, DriverState
+from simulator.agents.rider.logic import calculate_utility
 from simulator.platform.platform import Platform
-from simulator.utils.time_utils import ticks_to_time_string
+from simulator.utils.time_utils import get_clock
 from simulator.utils.metrics import SimulationMetrics
+from simulator.utils.output_policy import OutputPolicy, CSV
 
 class Market:
     """
@@ -23,15 +36,81 @@ class Market:
         self.config = config
         self.csv_logger = csv_logger
         self.engine = None # Will be set later
+        self.output = OutputPolicy.from_config(config.get('output'), clock=get_clock(config['simulation']['ticks_per_major']))
         self.ticks_per_major = self.config['simulation']['ticks_per_major']
+        self.clock = get_clock(self.ticks_per_major)
+        # Dual-app riders compare both platforms' quotes before ordering.
+        self.comparison_shopping = config['market'].get('comparison_shopping', False)
+        self.preference_score_weight = config['market'].get('preference_score_weight', 1.0)
+        # 'poll': searching riders retry every tick; 'deadline': one timeout event per
+        # search, with retries only when idle supply near the rider changes.
+        self.search_mode = config['market'].get('search_mode', 'poll')
+        if self.search_mode not in ('poll', 'deadline'):
+            raise ValueError(f"Unknown market.search_mode '{self.search_mode}', expected 'poll' or 'deadline'.")
+        # 'polling': every rider rolls for a search every ~15 minutes; 'poisson':
+        # one event per rider at the sampled time of their next search.
+        self.demand_model = config['market'].get('demand_model', 'polling')
+        if self.demand_model not in ('polling', 'poisson'):
+            raise ValueError(f"Unknown market.demand_model '{self.demand_model}', expected 'polling' or 'poisson'.")
+        self.demand: Optional[PoissonDemand] = None
+        if self.demand_model == 'poisson':
+            self.demand = PoissonDemand(self.ticks_per_major, config['market'].get('demand_profile'))
+        # 'polling': offline drivers roll to go online every hour and never go offline;
+        # 'sessions': one event at the start and one at the end of each online session.
+        self.supply_model = config['market'].get('supply_model', 'polling')
+        if self.supply_model not in ('polling', 'sessions'):
+            raise ValueError(f"Unknown market.supply_model '{self.supply_model}', expected 'polling' or 'sessions'.")
+        self.supply: Optional[SessionSupply] = None
+        if self.supply_model == 'sessions':
+            self.supply = SessionSupply(self.ticks_per_major, config['market'].get('driver_sessions'))
+        # Drivers whose session ended during a trip, to take offline when it completes.
+        self._offline_after_trip: set = set()
         self.grid = HexGrid(config['market']['grid_resolution'])
+        self.travel_times = self._build_travel_times(config)
         self.platforms: List[Platform] = []
         self.riders: List[RiderAgent] = []
         self.drivers: List[DriverAgent] = []
         self.metrics = SimulationMetrics()
 
-        self._create_riders(config)
-        self._create_drivers(config)
+        self._rider_rows: Optional[np.ndarray] = None
+        self._driver_rows: Optional[np.ndarray] = None
+        if config['market'].get('population_file'):
+            self._load_population_file(config)
+        elif config['market'].get('population_generator', 'bulk') == 'per_agent':
+            # Reference implementation: one agent at a time from the stdlib generator.
+            self._create_riders(config)
+            self._create_drivers(config)
+        else:
+            self._create_population_bulk(config)
+        self.registry = AgentRegistry(self.riders, self.drivers)
+        self.rider_states = StateIndex(RiderState, self.riders)
+        self.driver_states = StateIndex(DriverState, self.drivers)
+        self.metrics.attach_state_indexes(self.rider_states, self.driver_states)
+        self._platforms_by_id: Dict[str, Platform] = {}
+
+        # Optional struct-of-arrays backend for the vectorized per-tick kernels.
+        self.columns: Optional[ColumnarAgentStore] = None
+        if config['market'].get('agent_backend', 'objects') == 'columnar':
+            if self._rider_rows is not None:
+                self.columns = ColumnarAgentStore.from_rows(self._rider_rows, self._driver_rows)
+            else:
+                self.columns = ColumnarAgentStore.from_agents(self.riders, self.drivers)
+        self._rider_rows = self._driver_rows = None
+        # Search-intent draws waiting for the next vectorized roll, by rider id.
+        self._pending_search_intents: Dict[int, float] = {}
+
+        # Deadline search mode: riders who started searching since the last tick,
+        # unmatched riders waiting per cell, their timeout events, and the cells
+        # whose idle supply changed since the last tick.
+        self._new_searchers: List[RiderAgent] = []
+        self._waiting_riders: Dict[Tuple[int, int], Dict[int, None]] = {}
+        self._waiting_cells: Dict[int, Tuple[int, int]] = {}
+        self._search_platform_ids: Dict[int, Optional[str]] = {}
+        self._search_timeouts: Dict[int, int] = {}
+        self._expiring_searches: List[RiderAgent] = []
+        self._dirty_cells: set = set()
+
+        self._register_event_handlers()
 
     def set_engine(self, engine):
         """Links the market to the simulation engine and schedules initial events."""
@@ -41,21 +120,119 @@ class Market:
     def set_platforms(self, platforms: List[Platform]):
         """Sets the platforms for the market."""
         self.platforms = platforms
+        self._platforms_by_id = {platform.platform_id: platform for platform in platforms}
+        for platform in platforms:
+            if platform.matcher.travel_times is None:
+                platform.matcher.travel_times = self.travel_times
+            platform.matcher.output = self.output
+        for driver_id in self.driver_states.members(DriverState.IDLE):
+            self._index_idle_driver(self.registry.get_driver(driver_id))
+
+    def set_rider_state(self, rider: RiderAgent, new_state: RiderState):
+        """Transitions a rider to a new state, keeping the state index in sync."""
+        self.rider_states.transition(rider, new_state)
+        if self.columns is not None:
+            self.columns.set_rider_state(rider.agent_id, new_state)
+        if new_state == RiderState.SEARCHING and self.search_mode == 'deadline' and rider.active_order_id is None:
+            self._new_searchers.append(rider)
+
+    def set_driver_state(self, driver: DriverAgent, new_state: DriverState):
+        """Transitions a driver to a new state, keeping the state index in sync."""
+        self.driver_states.transition(driver, new_state)
+        if self.columns is not None:
+            self.columns.set_driver_state(driver.agent_id, new_state)
+        if new_state == DriverState.IDLE:
+            self._index_idle_driver(driver)
+        else:
+            for platform in self.platforms:
+                platform.idle_drivers.remove(driver)
+
+    def _index_idle_driver(self, driver: DriverAgent):
+        """Adds an idle driver to the idle index of every platform they serve."""
+        for platform in self.platforms:
+            if platform.serves(driver):
+                platform.idle_drivers.add(driver)
+        if self.search_mode == 'deadline':
+            self._dirty_cells.add(self.grid.get_cell_id(driver.location))
+
+    def _build_travel_times(self, config: Dict) -> TravelTimeTable:
+        """Precomputes (or loads) the cell-to-cell travel times used for ETAs and trips."""
+        market_config = config['market']
+        options = {
+            "speed_kmh": market_config.get('travel_speed_kmh', 25.0),
+            "min_minutes": market_config.get('min_travel_minutes', 2.0),
+        }
+        if market_config.get('travel_time_file'):
+            return TravelTimeTable.from_file(self.grid, market_config['travel_time_file'], **options)
+        return TravelTimeTable(self.grid, **options)
+
+    def minutes_to_ticks(self, minutes: float) -> int:
+        """Converts a duration in minutes to a whole number of minor ticks (at least one)."""
+        return self.clock.minutes_to_ticks(minutes)
+
+    def move_driver(self, driver: DriverAgent, new_location: Tuple[int, int]):
+        """Moves a driver, keeping the grid, the columns and the idle indexes in sync."""
+        self.grid.move_agent(driver, new_location)
+        if self.columns is not None:
+            self.columns.set_driver_location(driver.agent_id, new_location)
+        for platform in self.platforms:
+            platform.idle_drivers.update_location(driver)
+        if self.search_mode == 'deadline' and driver.current_state == DriverState.IDLE:
+            self._dirty_cells.add(self.grid.get_cell_id(new_location))
+
+    def move_rider(self, rider: RiderAgent, new_location: Tuple[int, int]):
+        """Moves a rider, keeping the grid and the columns in sync."""
+        self.grid.move_agent(rider, new_location)
+        if self.columns is not None:
+            self.columns.set_rider_location(rider.agent_id, new_location)
 
     def _schedule_initial_events(self):
         """Schedules the first evaluation event for all agents."""
         for rider in self.riders:
+            if self.demand is not None:
+                self._schedule_next_search(rider, 0)
+                continue
             initial_tick = random.randint(0, self.ticks_per_major)
-            self.engine.schedule_event(
-                initial_tick,
-                {"action": "EVALUATE_RIDER_SEARCH_INTENT", "agent_id": rider.agent_id}
-            )
+            self.schedule(initial_tick, EventType.EVALUATE_RIDER_SEARCH_INTENT, rider.agent_id)
         for driver in self.drivers:
+            if self.supply is not None:
+                self._schedule_session(driver, self.supply.first_session())
+                continue
             initial_tick = random.randint(0, self.ticks_per_major)
-            self.engine.schedule_event(
-                initial_tick,
-                {"action": "EVALUATE_DRIVER_GO_ONLINE", "agent_id": driver.agent_id}
-            )
+            self.schedule(initial_tick, EventType.EVALUATE_DRIVER_GO_ONLINE, driver.agent_id)
+
+    def _create_population_bulk(self, config: Dict):
+        """
+        Creates both populations with batched draws and bulk-loads the grid.
+
+        The NumPy generator is seeded from the stdlib `random` state, so seeding
+        `random` still makes the whole run reproducible.
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        rider_rows = generate_riders(config['market']['rider_population'], config['market']['initial_riders'], rng)
+        driver_rows = generate_drivers(config['market']['driver_population'], config['market']['initial_drivers'], rng,
+                                       num_platforms=len(platform_ids(config)))
+        self._load_population(rider_rows, driver_rows, platform_ids(config))
+
+    def _load_population_file(self, config: Dict):
+        """
+        Loads a pre-generated population from a memory-mapped file instead of sampling it.
+
+        One value is still drawn from `random`, as the bulk generator would have
+        done, so the rest of the run stays identical to a freshly sampled one.
+        """
+        random.getrandbits(64)
+        rider_rows, driver_rows = load_population_file(config['market']['population_file'], config)
+        self._load_population(rider_rows, driver_rows, platform_ids(config))
+
+    def _load_population(self, rider_rows: np.ndarray, driver_rows: np.ndarray, platform_ids: Tuple[str, ...]):
+        """Builds the agents from population rows and bulk-loads them into the grid."""
+        self._rider_rows = rider_rows
+        self._driver_rows = driver_rows
+        self.riders = riders_from_rows(rider_rows)
+        self.drivers = drivers_from_rows(driver_rows, first_id=len(rider_rows), platform_ids=platform_ids)
+        self.grid.add_agents(self.riders, rider_rows["x"], rider_rows["y"])
+        self.grid.add_agents(self.drivers, driver_rows["x"], driver_rows["y"])
 
     def _create_riders(self, config: Dict):
         """
@@ -91,152 +268,568 @@ class Market:
         Creates the driver population.
         """
         driver_config = config['market']['driver_population']
+        exclusive_platform_ids = platform_ids(config)
         for i in range(config['market']['initial_drivers']):
+            initial_location = (random.randint(0, 10000), random.randint(0, 10000))
+            is_exclusive = random.random() < driver_config['pct_exclusive']
             driver = DriverAgent(
                 agent_id=i + config['market']['initial_riders'],
-                initial_location=(random.randint(0, 10000), random.randint(0, 10000)),
-                is_exclusive=(random.random() < driver_config['pct_exclusive']),
+                initial_location=initial_location,
+                is_exclusive=is_exclusive,
                 preference_score=random.normalvariate(*driver_config['preference_score_dist']),
                 price_sensitivity=random.normalvariate(*driver_config['price_sensitivity_dist']),
-                eta_sensitivity=random.normalvariate(*driver_config['eta_sensitivity_dist'])
+                eta_sensitivity=random.normalvariate(*driver_config['eta_sensitivity_dist']),
+                # Exclusive drivers work for one configured platform, drawn uniformly.
+                exclusive_platform_id=random.choice(exclusive_platform_ids) if is_exclusive else None
             )
             self.drivers.append(driver)
             self.grid.add_agent(driver)
 
-    def handle_event(self, event: Dict, current_tick: int):
-        action = event.get("action")
-        agent_id = event.get("agent_id")
-        day = current_tick // self.ticks_per_major
-        tick = current_tick % self.ticks_per_major
-        time_str = ticks_to_time_string(day, tick, self.ticks_per_major)
-
-        if action == "EVALUATE_DRIVER_GO_ONLINE":
-            driver = next((d for d in self.drivers if d.agent_id == agent_id), None)
-            if driver and driver.current_state == DriverState.OFFLINE:
-                if random.random() < 0.1:  # Simplified probability
-                    driver.current_state = DriverState.IDLE
-                    self.metrics.track_driver_online(driver.agent_id)
-                    self.csv_logger.log(time_str, "STATE_IDLE", driver_id=driver.agent_id, details=f"Driver {driver.agent_id} is now IDLE at location {driver.location}.")
-                    logging.info(f"DRIVER  | STATE_IDLE       | {time_str} | Driver {driver.agent_id} is now IDLE at location {driver.location}.")
-            
-            if driver:
-                # Schedule next evaluation
-                next_evaluation_tick = current_tick + 360  # Approx. 1 hour later
-                self.engine.schedule_event(
-                    next_evaluation_tick,
-                    {"action": "EVALUATE_DRIVER_GO_ONLINE", "agent_id": agent_id}
-                )
-
-        elif action == "EVALUATE_RIDER_SEARCH_INTENT":
-            rider = next((r for r in self.riders if r.agent_id == agent_id), None)
-            if rider and rider.current_state == RiderState.IDLE:
-                # Probability of searching in this evaluation interval
-                prob = rider.rides_per_week / (7 * 24 * 4) # Assuming evaluation every 15 mins
-                if random.random() < prob:
-                    rider.current_state = RiderState.SEARCHING
-                    rider.patience_timer = 180  # 30 minutes
-                    logging.info(f"RIDER   | STATE_SEARCHING  | {time_str} | Rider {rider.agent_id} is now SEARCHING.")
-
-            if rider:
-                # Schedule next evaluation with some randomness
-                interval = random.expovariate(1.0 / 90.0) # Average 15 mins (90 ticks)
-                next_evaluation_tick = current_tick + int(interval)
-                self.engine.schedule_event(
-                    next_evaluation_tick,
-                    {"action": "EVALUATE_RIDER_SEARCH_INTENT", "agent_id": agent_id}
-                )
+    def register_event_handler(self, event_type: EventType, handler: Callable[[int, int, int], None]):
+        """
+        Registers the handler of an event type, replacing any previous one.
+
+        Handlers are called as `handler(agent_id, arg, current_tick)`.
+        """
+        self._event_handlers[event_type] = handler
+
+    def _register_event_handlers(self):
+        """Fills the dispatch table with the market's own event handlers."""
+        self._event_handlers: List[Optional[Callable[[int, int, int], None]]] = [None] * (max(EventType) + 1)
+        self.register_event_handler(EventType.EVALUATE_DRIVER_GO_ONLINE, self._on_evaluate_driver_go_online)
+        self.register_event_handler(EventType.EVALUATE_RIDER_SEARCH_INTENT, self._on_evaluate_rider_search_intent)
+        self.register_event_handler(EventType.RIDER_SEARCH, self._on_rider_search)
+        self.register_event_handler(EventType.DRIVER_SESSION_START, self._on_driver_session_start)
+        self.register_event_handler(EventType.DRIVER_SESSION_END, self._on_driver_session_end)
+        self.register_event_handler(EventType.DRIVER_ARRIVED_AT_PICKUP, self._on_driver_arrived_at_pickup)
+        self.register_event_handler(EventType.TRIP_COMPLETED, self._on_trip_completed)
+        self.register_event_handler(EventType.RIDER_SEARCH_TIMEOUT, self._on_rider_search_timeout)
+
+    def schedule(self, tick: int, event_type: EventType, agent_id: int, arg: int = 0) -> int:
+        """
+        Schedules an event on the engine.
+
+        Returns:
+            A handle that can be used to cancel the event.
+        """
+        return self.engine.schedule_event(tick, (event_type, agent_id, arg))
+
+    def handle_event(self, event: Event, current_tick: int):
+        """Dispatches an `(event_type, agent_id, arg)` event to its registered handler."""
+        event_type, agent_id, arg = event
+        handler = self._event_handlers[event_type]
+        if handler is not None:
+            handler(agent_id, arg, current_tick)
+
+    def _log_event(self, tick: int, event_type: str, rider_id: Optional[int] = None, driver_id: Optional[int] = None, **kwargs):
+        """Writes an event to the CSV event log if the output policy allows it."""
+        if self.output.allows(CSV, event_type, rider_id, driver_id):
+            self.csv_logger.log(tick, event_type, rider_id=rider_id, driver_id=driver_id, **kwargs)
+
+    def _on_evaluate_driver_go_online(self, agent_id: int, arg: int, current_tick: int):
+        driver = self.registry.get_driver(agent_id)
+        if driver and driver.current_state == DriverState.OFFLINE:
+            if random.random() < 0.1:  # Simplified probability
+                self._go_online(driver, current_tick)
+
+        if driver:
+            # Schedule next evaluation
+            next_evaluation_tick = current_tick + 360  # Approx. 1 hour later
+            self.schedule(next_evaluation_tick, EventType.EVALUATE_DRIVER_GO_ONLINE, agent_id)
+
+    def _on_evaluate_rider_search_intent(self, agent_id: int, arg: int, current_tick: int):
+        rider = self.registry.get_rider(agent_id)
+        if rider and self.columns is not None:
+            self._queue_search_intent(rider, current_tick)
+        elif rider and rider.current_state == RiderState.IDLE:
+            # Probability of searching in this evaluation interval
+            prob = rider.rides_per_week / (7 * 24 * 4) # Assuming evaluation every 15 mins
+            if random.random() < prob:
+                self._begin_searching(rider, current_tick)
+
+        if rider:
+            # Schedule next evaluation with some randomness
+            interval = random.expovariate(1.0 / 90.0) # Average 15 mins (90 ticks)
+            next_evaluation_tick = current_tick + int(interval)
+            self.schedule(next_evaluation_tick, EventType.EVALUATE_RIDER_SEARCH_INTENT, agent_id)
+
+    def _on_rider_search(self, agent_id: int, arg: int, current_tick: int):
+        # Poisson demand: the rider wants a ride now, unless they are busy.
+        rider = self.registry.get_rider(agent_id)
+        if rider.current_state == RiderState.IDLE:
+            self._begin_searching(rider, current_tick)
+        self._schedule_next_search(rider, current_tick)
+
+    def _on_driver_session_start(self, agent_id: int, session_end: int, current_tick: int):
+        self._go_online(self.registry.get_driver(agent_id), current_tick)
+        self.schedule(session_end, EventType.DRIVER_SESSION_END, agent_id)
+
+    def _on_driver_session_end(self, agent_id: int, arg: int, current_tick: int):
+        driver = self.registry.get_driver(agent_id)
+        if driver.current_state == DriverState.IDLE:
+            self._go_offline(driver, current_tick)
+        else:
+            # Drivers finish the trip they are on before going offline.
+            self._offline_after_trip.add(agent_id)
+
+    def _on_driver_arrived_at_pickup(self, agent_id: int, arg: int, current_tick: int):
+        self._start_trip(self.registry.get_driver(agent_id), current_tick)
+
+    def _on_trip_completed(self, agent_id: int, arg: int, current_tick: int):
+        self._complete_trip(self.registry.get_driver(agent_id), current_tick)
+
+    def _on_rider_search_timeout(self, agent_id: int, arg: int, current_tick: int):
+        # Abandoned after this tick's matching, exactly when the polled countdown would run out.
+        self._search_timeouts.pop(agent_id, None)
+        self._expiring_searches.append(self.registry.get_rider(agent_id))
+
+    def _start_trip(self, driver: DriverAgent, current_tick: int):
+        """Picks the rider up and schedules the end of the trip at the destination."""
+        rider = self.registry.get_rider(driver.match['rider_id'])
+        self.move_driver(driver, rider.location)
+        self.set_driver_state(driver, DriverState.ON_TRIP)
+        self.set_rider_state(rider, RiderState.ON_TRIP)
+        self.output.log(logging.INFO, "TRIP_STARTED", current_tick, rider.agent_id, driver.agent_id, "MARKET  | TRIP_STARTED     | %s | Driver %s picked up Rider %s at %s.", driver.agent_id, rider.agent_id, rider.location)
+
+        trip_minutes = self.travel_times.minutes_between(rider.location, driver.match['destination'])
+        self.schedule(current_tick + self.minutes_to_ticks(trip_minutes), EventType.TRIP_COMPLETED, driver.agent_id)
+
+    def _complete_trip(self, driver: DriverAgent, current_tick: int):
+        """Drops the rider off at the destination and frees both agents."""
+        rider = self.registry.get_rider(driver.match['rider_id'])
+        destination = driver.match['destination']
+        platform_id = driver.match['platform_id']
+        self.move_driver(driver, destination)
+        self.move_rider(rider, destination)
+
+        session_over = driver.agent_id in self._offline_after_trip
+        if not session_over:
+            self.set_driver_state(driver, DriverState.IDLE)
+        self.set_rider_state(rider, RiderState.IDLE)
+        driver.match = None
+        rider.match = None
+
+        self.metrics.track_completed_trip(driver.agent_id, rider.agent_id)
+        self._log_event(current_tick, "TRIP_COMPLETED", rider_id=rider.agent_id, driver_id=driver.agent_id, platform_id=platform_id, details="Trip completed for Rider %s and Driver %s.", details_args=(rider.agent_id, driver.agent_id))
+        self.output.log(logging.INFO, "TRIP_COMPLETED", current_tick, rider.agent_id, driver.agent_id, "MARKET  | TRIP_COMPLETED   | %s | Trip completed for Rider %s and Driver %s.", rider.agent_id, driver.agent_id)
+
+        # Schedule next evaluations
+        if session_over:
+            self._offline_after_trip.discard(driver.agent_id)
+            self._go_offline(driver, current_tick)
+        elif self.supply is None:
+            self.schedule(current_tick + 1, EventType.EVALUATE_DRIVER_GO_ONLINE, driver.agent_id)
+        if self.demand is None:
+            self.schedule(current_tick + 1, EventType.EVALUATE_RIDER_SEARCH_INTENT, rider.agent_id)
+
+    def _go_online(self, driver: DriverAgent, current_tick: int):
+        """Brings an offline driver online and idle."""
+        self.set_driver_state(driver, DriverState.IDLE)
+        self.metrics.track_driver_online(driver.agent_id)
+        self.metrics.record_supply(current_tick, self.metrics.current_online_drivers())
+        self._log_event(current_tick, "STATE_IDLE", driver_id=driver.agent_id, details="Driver %s is now IDLE at location %s.", details_args=(driver.agent_id, driver.location))
+        self.output.log(logging.INFO, "STATE_IDLE", current_tick, None, driver.agent_id, "DRIVER  | STATE_IDLE       | %s | Driver %s is now IDLE at location %s.", driver.agent_id, driver.location)
+
+    def _go_offline(self, driver: DriverAgent, current_tick: int):
+        """Ends a driver's session and schedules their next one."""
+        self.set_driver_state(driver, DriverState.OFFLINE)
+        self.metrics.record_supply(current_tick, self.metrics.current_online_drivers())
+        self._log_event(current_tick, "STATE_OFFLINE", driver_id=driver.agent_id, details="Driver %s went OFFLINE at location %s.", details_args=(driver.agent_id, driver.location))
+        self.output.log(logging.INFO, "STATE_OFFLINE", current_tick, None, driver.agent_id, "DRIVER  | STATE_OFFLINE    | %s | Driver %s went OFFLINE at location %s.", driver.agent_id, driver.location)
+        self._schedule_session(driver, self.supply.next_session(current_tick))
+
+    def _schedule_session(self, driver: DriverAgent, session: Optional[Tuple[int, int]]):
+        """Schedules the start of a driver's next online session, if they ever go online."""
+        if session is not None:
+            start, end = session
+            self.schedule(start, EventType.DRIVER_SESSION_START, driver.agent_id, end)
+
+    def _begin_searching(self, rider: RiderAgent, current_tick: int):
+        """Moves an idle rider into the searching state."""
+        self.set_rider_state(rider, RiderState.SEARCHING)
+        self._set_patience_timer(rider, 180)  # 30 minutes
+        self.output.log(logging.INFO, "STATE_SEARCHING", current_tick, rider.agent_id, None, "RIDER   | STATE_SEARCHING  | %s | Rider %s is now SEARCHING.", rider.agent_id)
+
+    def _schedule_next_search(self, rider: RiderAgent, current_tick: int):
+        """Schedules a rider's next Poisson search event, if they ever search."""
+        next_tick = self.demand.next_search_tick(rider.rides_per_week, current_tick)
+        if next_tick is not None:
+            self.schedule(next_tick, EventType.RIDER_SEARCH, rider.agent_id)
 
     def update_platform_strategies(self, day: int):
         pass
 
-    def process_rider_searches(self, day: int, tick: int):
-        time_str = ticks_to_time_string(day, tick, self.ticks_per_major)
-        for rider in self.riders:
-            if rider.current_state == RiderState.SEARCHING:
-                # Step 1: Initiate Search Session (if new)
-                if rider.active_order_id is None:
-                    rider.active_order_id = f"order_{rider.agent_id}_{day}_{tick}"
-                    rider.patience_timer = rider.patience_ticks
-                    self.metrics.track_rider_search(rider.agent_id)
-                    self.csv_logger.log(time_str, "ORDER_CREATED", rider_id=rider.agent_id, details=f"Rider {rider.agent_id} starting search for Order {rider.active_order_id} from location {rider.location}.")
-                    logging.info(f"RIDER   | ORDER_CREATED    | {time_str} | Rider {rider.agent_id} starting search for Order {rider.active_order_id} from location {rider.location}.")
-
-                # Step 2: Continuous Matching Attempt
-                chosen_platform_id = None
-                if rider.has_app_a and rider.preference_score > 0:
-                    chosen_platform_id = 'A'
-                elif rider.has_app_b and rider.preference_score <= 0:
-                    chosen_platform_id = 'B'
-                elif rider.has_app_a:
-                    chosen_platform_id = 'A'
-                elif rider.has_app_b:
-                    chosen_platform_id = 'B'
-
-                if chosen_platform_id:
-                    chosen_platform = next((p for p in self.platforms if p.platform_id == chosen_platform_id), None)
-                    
-                    if chosen_platform:
-                        driver, status = chosen_platform.matcher.process_order(rider, 20.0, rider.active_order_id, day, tick)
-                        # Step 3: Handle Match Outcome
-                        if status == "MATCH_SUCCESSFUL":
-                            rider.current_state = RiderState.ORDERED
-                            driver.current_state = DriverState.DRIVING_TO_RIDER
-                            match_info = {"driver_id": driver.agent_id, "rider_id": rider.agent_id, "platform_id": chosen_platform.platform_id, "order_id": rider.active_order_id}
-                            rider.match = match_info
-                            driver.match = match_info
-                            logging.info(f"MARKET  | MATCH_SUCCESSFUL | {time_str} | Match successful for Order {rider.active_order_id} (Rider {rider.agent_id} and Driver {driver.agent_id} on Platform {chosen_platform.platform_id})")
-                            rider.active_order_id = None # End the search session
-                        else: # Match unsuccessful
-                            rider.patience_timer -= 1
-                            if rider.patience_timer <= 0:
-                                rider.current_state = RiderState.ABANDONED_SEARCH
-                                self.csv_logger.log(time_str, "SEARCH_ABANDONED", rider_id=rider.agent_id, details=f"Rider {rider.agent_id} ABANDONED SEARCH for Order {rider.active_order_id}.")
-                                logging.info(f"RIDER   | SEARCH_ABANDONED | {time_str} | Rider {rider.agent_id} ABANDONED SEARCH for Order {rider.active_order_id}.")
-                                rider.active_order_id = None # End the search session
-                    else: # No platform found
-                        rider.patience_timer -= 1
-                        if rider.patience_timer <= 0:
-                            rider.current_state = RiderState.ABANDONED_SEARCH
-                            logging.info(f"RIDER   | SEARCH_ABANDONED | {time_str} | Rider {rider.agent_id} ABANDONED SEARCH for Order {rider.active_order_id}.")
-                            rider.active_order_id = None # End the search session
-
-    def process_matcher_offers(self, day: int, tick: int):
-        pass
+    def _queue_search_intent(self, rider: RiderAgent, current_tick: int):
+        """
+        Draws the search-intent roll for a rider and defers the comparison to the
+        next vectorized flush.
 
-    def process_driver_responses(self, day: int, tick: int):
-        pass
-    
-    def update_agent_locations(self, day: int, tick: int):
-        time_str = ticks_to_time_string(day, tick, self.ticks_per_major)
+        The draw is taken immediately so the random stream is consumed in the same
+        order as the object path. If the rider already has a pending roll in this
+        batch, the batch is flushed first so the rider's state is current.
+        """
+        if rider.agent_id in self._pending_search_intents:
+            self._flush_search_intents(current_tick)
+        if rider.current_state == RiderState.IDLE:
+            self._pending_search_intents[rider.agent_id] = random.random()
+
+    def _flush_search_intents(self, current_tick: int):
+        """Runs the vectorized search-intent roll over all pending draws."""
+        if not self._pending_search_intents:
+            return
+        count = len(self._pending_search_intents)
+        rider_ids = np.fromiter(self._pending_search_intents.keys(), dtype=np.int64, count=count)
+        draws = np.fromiter(self._pending_search_intents.values(), dtype=np.float64, count=count)
+        self._pending_search_intents.clear()
+
+        starts_search = roll_search_intent(self.columns, rider_ids, draws)
+        for rider_id in rider_ids[starts_search].tolist():
+            self._begin_searching(self.registry.get_rider(rider_id), current_tick)
+
+    def _set_patience_timer(self, rider: RiderAgent, patience_timer: int):
+        """Sets a rider's patience timer, keeping the columns in sync."""
+        rider.patience_timer = patience_timer
+        if self.columns is not None:
+            self.columns.patience_timer[rider.agent_id] = patience_timer
+
+    def _start_search_session(self, rider: RiderAgent, day: int, tick: int):
+        """Opens a new order for a rider who has just started searching."""
+        rider.active_order_id = f"order_{rider.agent_id}_{day}_{tick}"
+        self._set_patience_timer(rider, rider.patience_ticks)
+        self.metrics.track_rider_search(rider.agent_id)
+        if self._compares_offers(rider):
+            self.set_rider_state(rider, RiderState.COMPARING_OFFERS)
+        self._log_event(day * self.ticks_per_major + tick, "ORDER_CREATED", rider_id=rider.agent_id, details="Rider %s starting search for Order %s from location %s.", details_args=(rider.agent_id, rider.active_order_id, rider.location))
+        self.output.log(logging.INFO, "ORDER_CREATED", day * self.ticks_per_major + tick, rider.agent_id, None, "RIDER   | ORDER_CREATED    | %s | Rider %s starting search for Order %s from location %s.", rider.agent_id, rider.active_order_id, rider.location)
+
+    def _choose_platform_id(self, rider: RiderAgent) -> Optional[str]:
+        """Picks the platform a rider searches on, based on app ownership and preference."""
+        if rider.has_app_a and rider.preference_score > 0:
+            return 'A'
+        elif rider.has_app_b and rider.preference_score <= 0:
+            return 'B'
+        elif rider.has_app_a:
+            return 'A'
+        elif rider.has_app_b:
+            return 'B'
+        return None
+
+    def _compares_offers(self, rider: RiderAgent) -> bool:
+        """True if the rider shops around: comparison is on, and they have both apps."""
+        return (
+            self.comparison_shopping and rider.has_app_a and rider.has_app_b
+            and 'A' in self._platforms_by_id and 'B' in self._platforms_by_id
+        )
+
+    def _compare_offers(self, rider: RiderAgent, current_tick: int) -> Optional[str]:
+        """
+        Picks the platform whose quote gives the rider the highest utility.
+
+        Quotes come from each platform's per-cell cache, so riders comparing in the
+        same cell and tick cost one quote per platform. Falls back to the
+        preference rule when neither platform has a driver nearby.
+        """
+        cell_id = self.grid.get_cell_id(rider.location)
+        best_platform_id, best_utility = None, None
+        for platform_id, weight in (('A', self.preference_score_weight), ('B', -self.preference_score_weight)):
+            quote = self._platforms_by_id[platform_id].get_quote(cell_id, current_tick)
+            if not quote.available:
+                continue
+            # Positive preference scores favour platform A, negative ones platform B.
+            utility = calculate_utility(rider, quote.price, quote.eta, weight)
+            if best_utility is None or utility > best_utility:
+                best_platform_id, best_utility = platform_id, utility
+        return best_platform_id if best_platform_id is not None else self._choose_platform_id(rider)
+
+    def _searching_rider_ids(self) -> List[int]:
+        """Returns the ids of all riders in a search session, in id order."""
+        return list(heapq.merge(
+            self.rider_states.members(RiderState.SEARCHING),
+            self.rider_states.members(RiderState.COMPARING_OFFERS),
+        ))
+
+    def _has_searching_riders(self) -> bool:
+        return self.rider_states.count(RiderState.SEARCHING) + self.rider_states.count(RiderState.COMPARING_OFFERS) > 0
+
+    def _is_queued(self, rider_id: int) -> bool:
+        """True if the rider's order is waiting in some platform's batch."""
+        return any(rider_id in platform.pending_orders for platform in self.platforms)
+
+    def _attempt_match(self, rider: RiderAgent, platform: Platform, day: int, tick: int) -> bool:
+        """
+        Runs one matching attempt for a rider on a platform.
+
+        Returns:
+            True if the rider was matched with a driver.
+        """
+        driver, status = platform.matcher.process_order(rider, platform.base_fare, rider.active_order_id, day, tick)
+        if status != "MATCH_SUCCESSFUL":
+            return False
+        self._confirm_match(rider, driver, platform, day * self.ticks_per_major + tick)
+        return True
+
+    def _confirm_match(self, rider: RiderAgent, driver: DriverAgent, platform: Platform, current_tick: int):
+        """
+        Books a matched rider and driver on a platform, ends the rider's search
+        session and schedules the driver's arrival at the pickup.
+        """
+        self.set_rider_state(rider, RiderState.ORDERED)
+        self.set_driver_state(driver, DriverState.DRIVING_TO_RIDER)
+        destination = (random.randint(0, 10000), random.randint(0, 10000))
+        match_info = {"driver_id": driver.agent_id, "rider_id": rider.agent_id, "platform_id": platform.platform_id, "order_id": rider.active_order_id, "destination": destination}
+        rider.match = match_info
+        driver.match = match_info
+        self.metrics.track_match(platform.platform_id)
+        self._drop_queued_order(rider)
+        self._end_search_wait(rider)
+        self.output.log(logging.INFO, "MATCH_SUCCESSFUL", current_tick, rider.agent_id, driver.agent_id, "MARKET  | MATCH_SUCCESSFUL | %s | Match successful for Order %s (Rider %s and Driver %s on Platform %s)", rider.active_order_id, rider.agent_id, driver.agent_id, platform.platform_id)
+        rider.active_order_id = None # End the search session
+
+        pickup_minutes = self.travel_times.minutes_between(driver.location, rider.location)
+        self.schedule(current_tick + self.minutes_to_ticks(pickup_minutes), EventType.DRIVER_ARRIVED_AT_PICKUP, driver.agent_id)
+
+    def _drop_queued_order(self, rider: RiderAgent):
+        for platform in self.platforms:
+            platform.pending_orders.pop(rider.agent_id, None)
+
+    def _dispatch_batches(self, day: int, tick: int):
+        """
+        Runs the batch matching of every platform whose window has closed, then
+        counts down the patience of the riders still waiting in a batch.
+        """
         current_tick = day * self.ticks_per_major + tick
-        
-        for driver in self.drivers:
-            if driver.current_state == DriverState.DRIVING_TO_RIDER:
-                # The driver object has the match info
-                rider_id = driver.match['rider_id']
-                rider = next((r for r in self.riders if r.agent_id == rider_id), None)
-
-                if rider and rider.current_state == RiderState.ORDERED:
-                    # Simulate instantaneous trip completion
-                    new_location = (random.randint(0, 10000), random.randint(0, 10000))
-                    driver.location = new_location
-                    rider.location = new_location
-
-                    driver.current_state = DriverState.IDLE
-                    rider.current_state = RiderState.IDLE
-                    driver.match = None
-                    rider.match = None
-                    
-                    self.metrics.track_completed_trip(driver.agent_id, rider.agent_id)
-                    self.csv_logger.log(time_str, "TRIP_COMPLETED", rider_id=rider.agent_id, driver_id=driver.agent_id, details=f"Trip completed for Rider {rider.agent_id} and Driver {driver.agent_id}.")
-                    logging.info(f"MARKET  | TRIP_COMPLETED   | {time_str} | Trip completed for Rider {rider.agent_id} and Driver {driver.agent_id}.")
-
-                    # Schedule next evaluations
-                    self.engine.schedule_event(
-                        current_tick + 1,
-                        {"action": "EVALUATE_DRIVER_GO_ONLINE", "agent_id": driver.agent_id}
-                    )
-                    self.engine.schedule_event(
-                        current_tick + 1,
-                        {"action": "EVALUATE_RIDER_SEARCH_INTENT", "agent_id": rider.agent_id}
-                    )
+        for platform in self.platforms:
+            if not platform.pending_orders:
+                continue
+            if platform.batch_is_due(current_tick):
+                riders = list(platform.pending_orders.values())
+                matches = platform.matcher.match_batch(riders, platform.base_fare, day, tick)
+                for rider in riders:
+                    driver = matches.get(rider.agent_id)
+                    if driver is not None:
+                        del platform.pending_orders[rider.agent_id]
+                        self._confirm_match(rider, driver, platform, current_tick)
+                # Unmatched orders roll over into the next window.
+                platform.reopen_batch(current_tick + 1)
+
+            if self.search_mode == 'deadline':
+                continue  # Patience is enforced by the search timeout events.
+            for rider in list(platform.pending_orders.values()):
+                self._set_patience_timer(rider, rider.patience_timer - 1)
+                if rider.patience_timer <= 0:
+                    del platform.pending_orders[rider.agent_id]
+                    self._abandon_search(rider, current_tick, platform_id=platform.platform_id)
+
+    def _abandon_search(self, rider: RiderAgent, current_tick: int, log_to_csv: bool = True, platform_id: Optional[str] = None):
+        """Ends a rider's search session after their patience ran out."""
+        self.set_rider_state(rider, RiderState.ABANDONED_SEARCH)
+        self._drop_queued_order(rider)
+        self._end_search_wait(rider)
+        if platform_id is not None:
+            self.metrics.track_abandoned_order(platform_id)
+        if log_to_csv:
+            self._log_event(current_tick, "SEARCH_ABANDONED", rider_id=rider.agent_id, platform_id=platform_id, details="Rider %s ABANDONED SEARCH for Order %s.", details_args=(rider.agent_id, rider.active_order_id))
+        self.output.log(logging.INFO, "SEARCH_ABANDONED", current_tick, rider.agent_id, None, "RIDER   | SEARCH_ABANDONED | %s | Rider %s ABANDONED SEARCH for Order %s.", rider.agent_id, rider.active_order_id)
+        rider.active_order_id = None # End the search session
+
+    def process_rider_searches(self, day: int, tick: int) -> bool:
+        """
+        Runs one matching attempt for every searching rider.
+
+        Returns:
+            True if any rider is still searching after this tick.
+        """
+        current_tick = day * self.ticks_per_major + tick
+        if self.search_mode == 'deadline':
+            if self.columns is not None:
+                self._flush_search_intents(day * self.ticks_per_major + tick)
+            return self._process_rider_searches_deadline(day, tick)
+        if self.columns is not None:
+            self._flush_search_intents(day * self.ticks_per_major + tick)
+            self._process_rider_searches_columnar(day, tick)
+            self._dispatch_batches(day, tick)
+            return self._has_searching_riders()
+
+        for rider_id in self._searching_rider_ids():
+            rider = self.registry.get_rider(rider_id)
+            # Step 1: Initiate Search Session (if new)
+            if rider.active_order_id is None:
+                self._start_search_session(rider, day, tick)
+
+            # Orders waiting in a batch are matched when the batch window closes.
+            if self._is_queued(rider_id):
+                continue
+
+            # Step 2: Continuous Matching Attempt
+            chosen_platform_id = self._select_platform_id(rider, current_tick)
+            if chosen_platform_id:
+                chosen_platform = self._platforms_by_id.get(chosen_platform_id)
+
+                # Batching platforms match the order when their window closes.
+                if chosen_platform and chosen_platform.batches_orders:
+                    chosen_platform.queue_order(rider, current_tick)
+                    continue
+
+                # Step 3: Handle Match Outcome
+                if chosen_platform and self._attempt_match(rider, chosen_platform, day, tick):
+                    continue
+
+                # Match unsuccessful, or no platform found
+                rider.patience_timer -= 1
+                if rider.patience_timer <= 0:
+                    self._abandon_search(rider, current_tick, log_to_csv=chosen_platform is not None,
+                                         platform_id=chosen_platform_id if chosen_platform else None)
+
+        self._dispatch_batches(day, tick)
+        return self._has_searching_riders()
+
+    def _select_platform_id(self, rider: RiderAgent, current_tick: int) -> Optional[str]:
+        """Returns the platform a searching rider orders on this tick."""
+        if rider.current_state == RiderState.COMPARING_OFFERS:
+            return self._compare_offers(rider, current_tick)
+        return self._choose_platform_id(rider)
+
+    def _process_rider_searches_deadline(self, day: int, tick: int) -> bool:
+        """
+        Deadline variant of `process_rider_searches`.
+
+        A new search gets one matching attempt and a single timeout event at the
+        end of the rider's patience. Unmatched riders wait in per-cell queues and
+        are retried only when a driver becomes idle in, or moves into, a cell
+        within the matchers' search rings. When supply changes near every rider
+        on every tick this makes the same attempts, in the same order, as polling.
+
+        Returns:
+            True if there is matching work left for the next tick.
+        """
+        current_tick = day * self.ticks_per_major + tick
+        attempts = set()
+
+        new_searchers, self._new_searchers = self._new_searchers, []
+        for rider in new_searchers:
+            if rider.current_state == RiderState.SEARCHING and rider.active_order_id is None:
+                self._start_search_session(rider, day, tick)
+                deadline = current_tick + rider.patience_ticks - 1
+                if deadline <= current_tick:
+                    self._expiring_searches.append(rider)
+                else:
+                    self._search_timeouts[rider.agent_id] = self.schedule(deadline, EventType.RIDER_SEARCH_TIMEOUT, rider.agent_id)
+                attempts.add(rider.agent_id)
+
+        dirty_cells, self._dirty_cells = self._dirty_cells, set()
+        if dirty_cells and self._waiting_riders:
+            search_rings = max((platform.matcher.search_rings for platform in self.platforms), default=0)
+            for dirty_cell in dirty_cells:
+                for cell_id in self.grid.k_ring(dirty_cell, search_rings):
+                    attempts.update(self._waiting_riders.get(cell_id, ()))
+
+        for rider_id in sorted(attempts):
+            rider = self.registry.get_rider(rider_id)
+            if rider.active_order_id is None or self._is_queued(rider_id):
+                continue
+            chosen_platform_id = self._select_platform_id(rider, current_tick)
+            chosen_platform = self._platforms_by_id.get(chosen_platform_id) if chosen_platform_id else None
+            self._search_platform_ids[rider_id] = chosen_platform_id if chosen_platform else None
+            if chosen_platform and chosen_platform.batches_orders:
+                chosen_platform.queue_order(rider, current_tick)
+                continue
+            if chosen_platform and self._attempt_match(rider, chosen_platform, day, tick):
+                continue
+            self._wait_for_supply(rider)
+
+        self._dispatch_batches(day, tick)
+
+        expiring, self._expiring_searches = self._expiring_searches, []
+        for rider in expiring:
+            if rider.active_order_id is not None:
+                platform_id = self._search_platform_ids.get(rider.agent_id)
+                self._abandon_search(rider, current_tick, log_to_csv=platform_id is not None, platform_id=platform_id)
+
+        return bool(self._dirty_cells or self._new_searchers or any(platform.pending_orders for platform in self.platforms))
+
+    def _wait_for_supply(self, rider: RiderAgent):
+        """Parks an unmatched rider in the queue of their cell until supply changes nearby."""
+        if rider.agent_id in self._waiting_cells:
+            return
+        cell_id = self.grid.get_cell_id(rider.location)
+        self._waiting_cells[rider.agent_id] = cell_id
+        self._waiting_riders.setdefault(cell_id, {})[rider.agent_id] = None
+
+    def _end_search_wait(self, rider: RiderAgent):
+        """Removes a rider whose search ended from the waiting queues and cancels their timeout."""
+        cell_id = self._waiting_cells.pop(rider.agent_id, None)
+        if cell_id is not None:
+            waiting = self._waiting_riders[cell_id]
+            del waiting[rider.agent_id]
+            if not waiting:
+                del self._waiting_riders[cell_id]
+        handle = self._search_timeouts.pop(rider.agent_id, None)
+        if handle is not None:
+            self.engine.cancel_event(handle)
+        self._search_platform_ids.pop(rider.agent_id, None)
+
+    def _process_rider_searches_columnar(self, day: int, tick: int):
+        """
+        Columnar variant of `process_rider_searches`.
+
+        Platform choice and the patience countdown run as array operations over
+        all searching riders; only the matching itself, which changes driver
+        states, runs rider by rider in id order.
+        """
+        rider_ids = np.array(self._searching_rider_ids(), dtype=np.int64)
+        if rider_ids.size == 0:
+            return
+
+        for rider_id in rider_ids.tolist():
+            rider = self.registry.get_rider(rider_id)
+            if rider.active_order_id is None:
+                self._start_search_session(rider, day, tick)
+
+        current_tick = day * self.ticks_per_major + tick
+        platform_codes = choose_platforms(self.columns, rider_ids)
+        if self.rider_states.count(RiderState.COMPARING_OFFERS):
+            for i, rider_id in enumerate(rider_ids.tolist()):
+                rider = self.registry.get_rider(rider_id)
+                if rider.current_state == RiderState.COMPARING_OFFERS and not self._is_queued(rider_id):
+                    platform_codes[i] = PLATFORM_IDS.index(self._compare_offers(rider, current_tick))
+        failed = np.zeros(rider_ids.size, dtype=bool)
+        platform_missing = np.zeros(rider_ids.size, dtype=bool)
+        for i, (rider_id, platform_code) in enumerate(zip(rider_ids.tolist(), platform_codes.tolist())):
+            if platform_code == PLATFORM_NONE or self._is_queued(rider_id):
+                continue
+            chosen_platform = self._platforms_by_id.get(PLATFORM_IDS[platform_code])
+            if chosen_platform is None:
+                failed[i] = platform_missing[i] = True
+            elif chosen_platform.batches_orders:
+                chosen_platform.queue_order(self.registry.get_rider(rider_id), current_tick)
+            elif not self._attempt_match(self.registry.get_rider(rider_id), chosen_platform, day, tick):
+                failed[i] = True
+
+        failed_ids = rider_ids[failed]
+        out_of_patience = countdown_patience(self.columns, failed_ids)
+        # Copy the decremented timers back so the agent objects stay in sync.
+        for rider_id, patience_timer in zip(failed_ids.tolist(), self.columns.patience_timer[failed_ids].tolist()):
+            self.registry.get_rider(rider_id).patience_timer = patience_timer
+        failed_codes = platform_codes[failed][out_of_patience].tolist()
+        for rider_id, missing, platform_code in zip(failed_ids[out_of_patience].tolist(), platform_missing[failed][out_of_patience].tolist(), failed_codes):
+            rider = self.registry.get_rider(rider_id)
+            self._abandon_search(rider, current_tick, log_to_csv=not missing,
+                                 platform_id=None if missing else PLATFORM_IDS[platform_code])
+
+    def process_matcher_offers(self, day: int, tick: int) -> bool:
+        return False
+
+    def process_driver_responses(self, day: int, tick: int) -> bool:
+        return False
+    
+    def update_agent_locations(self, day: int, tick: int) -> bool:
+        """
+        Moves agents between events.
+
+        Pickups and trip completions are scheduled events (see `_confirm_match`),
+        so there is nothing to poll here.
+
+        Returns:
+            False, as no movement is pending between events.
+        """
+        return False
@@ -0,0 +1,138 @@
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+from simulator.agents.rider.rider import RiderAgent
+from simulator.agents.driver.driver import DriverAgent
+
+# Side length of the square city, in location units.
+CITY_SIZE = 10000
+# Platforms exclusive drivers are drawn from when the config has no `platforms` section.
+DEFAULT_PLATFORM_IDS = ('A', 'B')
+# Stored in `exclusive_platform` for drivers who serve every platform.
+NO_EXCLUSIVE_PLATFORM = -1
+
+# One row per rider / driver. Field order is part of the on-disk population format.
+RIDER_DTYPE = np.dtype([
+    ("x", np.int32),
+    ("y", np.int32),
+    ("has_app_a", np.bool_),
+    ("has_app_b", np.bool_),
+    ("preference_score", np.float64),
+    ("price_sensitivity", np.float64),
+    ("time_sensitivity", np.float64),
+    ("rides_per_week", np.float64),
+    ("patience_ticks", np.int32),
+])
+
+DRIVER_DTYPE = np.dtype([
+    ("x", np.int32),
+    ("y", np.int32),
+    ("is_exclusive", np.bool_),
+    ("preference_score", np.float64),
+    ("price_sensitivity", np.float64),
+    ("eta_sensitivity", np.float64),
+    # Index into the configured platform ids, or NO_EXCLUSIVE_PLATFORM.
+    ("exclusive_platform", np.int8),
+])
+
+def platform_ids(config: Dict) -> Tuple[str, ...]:
+    """Returns the configured platform ids, in config order."""
+    return tuple(config.get('platforms') or DEFAULT_PLATFORM_IDS)
+
+def generate_riders(rider_config: Dict, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draws the attributes of `count` riders in batches.
+
+    Uses the same distributions as `Market._create_riders`, one array per
+    attribute instead of one call per agent.
+
+    Returns:
+        A structured array of RIDER_DTYPE rows.
+    """
+    rows = np.empty(count, dtype=RIDER_DTYPE)
+    rows["x"] = rng.integers(0, CITY_SIZE + 1, size=count)
+    rows["y"] = rng.integers(0, CITY_SIZE + 1, size=count)
+
+    # App-ownership split in one pass: A only, then B only, then both apps.
+    app_roll = rng.random(count)
+    pct_a_only = rider_config['pct_with_app_a_only']
+    pct_b_only = rider_config['pct_with_app_b_only']
+    a_only = app_roll < pct_a_only
+    b_only = ~a_only & (app_roll < pct_a_only + pct_b_only)
+    rows["has_app_a"] = ~b_only
+    rows["has_app_b"] = ~a_only
+
+    rows["preference_score"] = rng.normal(*rider_config['preference_score_dist'], size=count)
+    rows["price_sensitivity"] = rng.normal(*rider_config['price_sensitivity_dist'], size=count)
+    rows["time_sensitivity"] = rng.normal(*rider_config['time_sensitivity_dist'], size=count)
+    rows["rides_per_week"] = np.maximum(0, rng.normal(*rider_config['rides_per_week_dist'], size=count))
+    patience = np.trunc(rng.normal(*rider_config['patience_ticks_dist'], size=count))
+    rows["patience_ticks"] = np.maximum(1, patience)
+    return rows
+
+def generate_drivers(driver_config: Dict, count: int, rng: np.random.Generator, num_platforms: int = len(DEFAULT_PLATFORM_IDS)) -> np.ndarray:
+    """
+    Draws the attributes of `count` drivers in batches.
+
+    Each exclusive driver works for one of the `num_platforms` platforms,
+    drawn uniformly.
+
+    Returns:
+        A structured array of DRIVER_DTYPE rows.
+    """
+    rows = np.empty(count, dtype=DRIVER_DTYPE)
+    rows["x"] = rng.integers(0, CITY_SIZE + 1, size=count)
+    rows["y"] = rng.integers(0, CITY_SIZE + 1, size=count)
+    rows["is_exclusive"] = rng.random(count) < driver_config['pct_exclusive']
+    rows["preference_score"] = rng.normal(*driver_config['preference_score_dist'], size=count)
+    rows["price_sensitivity"] = rng.normal(*driver_config['price_sensitivity_dist'], size=count)
+    rows["eta_sensitivity"] = rng.normal(*driver_config['eta_sensitivity_dist'], size=count)
+    # Drawn last, so the other attributes do not depend on the number of platforms.
+    exclusive_platform = rng.integers(0, num_platforms, size=count)
+    rows["exclusive_platform"] = np.where(rows["is_exclusive"], exclusive_platform, NO_EXCLUSIVE_PLATFORM)
+    return rows
+
+def riders_from_rows(rows: np.ndarray, first_id: int = 0) -> List[RiderAgent]:
+    """
+    Builds RiderAgent objects from RIDER_DTYPE rows, with contiguous ids.
+    """
+    # Converting whole columns to Python lists first avoids per-element NumPy scalars.
+    columns = [rows[name].tolist() for name in RIDER_DTYPE.names]
+    return [
+        RiderAgent(
+            agent_id=first_id + i,
+            initial_location=(x, y),
+            has_app_a=has_app_a,
+            has_app_b=has_app_b,
+            preference_score=preference_score,
+            price_sensitivity=price_sensitivity,
+            time_sensitivity=time_sensitivity,
+            rides_per_week=rides_per_week,
+            patience_ticks=patience_ticks
+        )
+        for i, (x, y, has_app_a, has_app_b, preference_score, price_sensitivity,
+                time_sensitivity, rides_per_week, patience_ticks) in enumerate(zip(*columns))
+    ]
+
+def drivers_from_rows(rows: np.ndarray, first_id: int, platform_ids: Sequence[str] = DEFAULT_PLATFORM_IDS) -> List[DriverAgent]:
+    """
+    Builds DriverAgent objects from DRIVER_DTYPE rows, with contiguous ids.
+
+    Args:
+        platform_ids: The platform ids the `exclusive_platform` column indexes.
+    """
+    columns = [rows[name].tolist() for name in DRIVER_DTYPE.names]
+    # NO_EXCLUSIVE_PLATFORM (-1) maps to the trailing None.
+    exclusive_platform_ids = tuple(platform_ids) + (None,)
+    return [
+        DriverAgent(
+            agent_id=first_id + i,
+            initial_location=(x, y),
+            is_exclusive=is_exclusive,
+            preference_score=preference_score,
+            price_sensitivity=price_sensitivity,
+            eta_sensitivity=eta_sensitivity,
+            exclusive_platform_id=exclusive_platform_ids[exclusive_platform]
+        )
+        for i, (x, y, is_exclusive, preference_score, price_sensitivity,
+                eta_sensitivity, exclusive_platform) in enumerate(zip(*columns))
+    ]
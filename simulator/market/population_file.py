@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import random
+from typing import Dict, Tuple
+import numpy as np
+from simulator.market.population import RIDER_DTYPE, DRIVER_DTYPE, generate_riders, generate_drivers, platform_ids
+
+# File layout:
+#   MAGIC (8 bytes) | header length (uint32, little-endian) | JSON header
+#   | padding to DATA_ALIGNMENT | rider rows | driver rows
+MAGIC = b"RIDEPOP1"
+FORMAT_VERSION = 2
+DATA_ALIGNMENT = 64
+
+# `market` keys that decide the generated population. Everything else (dispatch,
+# demand and supply models, backends...) can change without rebuilding the file.
+# Files always hold rows of the bulk generator, so `population_generator` is not
+# one of them: `per_agent` is rejected instead (see `_check_generator`).
+POPULATION_KEYS = ("initial_riders", "initial_drivers", "rider_population", "driver_population")
+
+def population_config_hash(config: Dict) -> str:
+    """
+    Returns a hash of everything that determines the generated population:
+    the POPULATION_KEYS of the `market` section, the platform ids (exclusive
+    drivers are stored as an index into them), the random seed and the file
+    format version.
+    """
+    payload = {
+        "format_version": FORMAT_VERSION,
+        "market": {key: config['market'].get(key) for key in POPULATION_KEYS},
+        "platform_ids": list(platform_ids(config)),
+        "random_seed": config['simulation'].get('random_seed'),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+def _check_generator(config: Dict):
+    """Population files hold bulk-generated rows; the per-agent sampler draws a different population."""
+    if config['market'].get('population_generator', 'bulk') != 'bulk':
+        raise ValueError(
+            "Population files hold rows of the bulk generator; "
+            f"unset market.population_generator (got {config['market']['population_generator']!r}) to use one."
+        )
+
+def _align(offset: int) -> int:
+    return (offset + DATA_ALIGNMENT - 1) // DATA_ALIGNMENT * DATA_ALIGNMENT
+
+def write_population_file(path: str, config: Dict, rider_rows: np.ndarray, driver_rows: np.ndarray):
+    """
+    Writes population rows to `path`, tagged with the config hash.
+    """
+    header = {
+        "config_hash": population_config_hash(config),
+        "riders": len(rider_rows),
+        "drivers": len(driver_rows),
+        "rider_dtype": RIDER_DTYPE.descr,
+        "driver_dtype": DRIVER_DTYPE.descr,
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_offset = _align(len(MAGIC) + 4 + len(header_bytes))
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(len(header_bytes).to_bytes(4, "little"))
+        f.write(header_bytes)
+        f.write(b"\0" * (data_offset - f.tell()))
+        f.write(np.ascontiguousarray(rider_rows, dtype=RIDER_DTYPE).tobytes())
+        f.write(np.ascontiguousarray(driver_rows, dtype=DRIVER_DTYPE).tobytes())
+
+def build_population_file(config: Dict, path: str) -> Tuple[int, int]:
+    """
+    Generates the population for `config` and writes it to `path`.
+
+    The generator is seeded exactly as in a regular run (stdlib `random` seeded
+    with `simulation.random_seed`, then the NumPy generator seeded from it), so
+    the file holds the same population `Market` would have sampled.
+
+    Returns:
+        The number of riders and drivers written.
+
+    Raises:
+        ValueError: If the config asks for the per-agent generator.
+    """
+    _check_generator(config)
+    random.seed(config['simulation'].get('random_seed'))
+    rng = np.random.default_rng(random.getrandbits(64))
+    rider_rows = generate_riders(config['market']['rider_population'], config['market']['initial_riders'], rng)
+    driver_rows = generate_drivers(config['market']['driver_population'], config['market']['initial_drivers'], rng,
+                                   num_platforms=len(platform_ids(config)))
+    write_population_file(path, config, rider_rows, driver_rows)
+    return len(rider_rows), len(driver_rows)
+
+def load_population_file(path: str, config: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Memory-maps the rider and driver rows of a population file.
+
+    The returned arrays are read-only views of the file, so several processes
+    loading the same file share one copy in the page cache.
+
+    Raises:
+        ValueError: If the file is not a population file, was built from a
+            different configuration than `config`, or its rows do not match
+            RIDER_DTYPE, DRIVER_DTYPE or the file size; or if `config` asks for
+            the per-agent generator.
+    """
+    _check_generator(config)
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a population file.")
+        header_length = int.from_bytes(f.read(4), "little")
+        header = json.loads(f.read(header_length).decode("utf-8"))
+    data_offset = _align(len(MAGIC) + 4 + header_length)
+
+    expected_hash = population_config_hash(config)
+    if header["config_hash"] != expected_hash:
+        raise ValueError(
+            f"Population file {path} is stale: it was built for config hash {header['config_hash'][:12]}, "
+            f"but the current config hashes to {expected_hash[:12]}. Rebuild it with `python main.py population build`."
+        )
+
+    for key, dtype in (("rider_dtype", RIDER_DTYPE), ("driver_dtype", DRIVER_DTYPE)):
+        if np.dtype([tuple(field) for field in header[key]]) != dtype:
+            raise ValueError(f"Population file {path} has a {key} that does not match this version; rebuild it.")
+    expected_size = data_offset + header["riders"] * RIDER_DTYPE.itemsize + header["drivers"] * DRIVER_DTYPE.itemsize
+    if os.path.getsize(path) != expected_size:
+        raise ValueError(
+            f"Population file {path} is {os.path.getsize(path)} bytes, but its header describes "
+            f"{expected_size} bytes ({header['riders']} riders, {header['drivers']} drivers); it is truncated or corrupt."
+        )
+
+    rider_rows = _map_rows(path, RIDER_DTYPE, data_offset, header["riders"])
+    driver_offset = data_offset + header["riders"] * RIDER_DTYPE.itemsize
+    driver_rows = _map_rows(path, DRIVER_DTYPE, driver_offset, header["drivers"])
+    return rider_rows, driver_rows
+
+def _map_rows(path: str, dtype: np.dtype, offset: int, count: int) -> np.ndarray:
+    """Memory-maps `count` rows of `dtype` starting at `offset` (mmap cannot map zero bytes)."""
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
@@ -0,0 +1,68 @@
+from typing import List, Optional, Union
+from simulator.agents.rider.rider import RiderAgent
+from simulator.agents.driver.driver import DriverAgent
+
+class AgentRegistry:
+    """
+    Provides constant-time lookup of agents by their id.
+
+    The Market assigns contiguous ids: riders get 0..R-1 and drivers get
+    R..R+D-1. The registry relies on that layout to turn an id into a list
+    index instead of scanning the populations.
+    """
+    def __init__(self, riders: List[RiderAgent], drivers: List[DriverAgent]):
+        """
+        Initializes the AgentRegistry.
+
+        Args:
+            riders: The rider population, ordered by id.
+            drivers: The driver population, ordered by id.
+
+        Raises:
+            ValueError: If the agent ids are not contiguous.
+        """
+        self._riders = riders
+        self._drivers = drivers
+        self.driver_id_offset = drivers[0].agent_id if drivers else len(riders)
+
+        for index, rider in enumerate(riders):
+            if rider.agent_id != index:
+                raise ValueError(f"Rider ids must be contiguous from 0; found id {rider.agent_id} at position {index}.")
+        for index, driver in enumerate(drivers):
+            if driver.agent_id != self.driver_id_offset + index:
+                raise ValueError(
+                    f"Driver ids must be contiguous from {self.driver_id_offset}; "
+                    f"found id {driver.agent_id} at position {index}."
+                )
+
+    def get_rider(self, agent_id: int) -> Optional[RiderAgent]:
+        """
+        Returns the rider with the given id, or None if there is none.
+        """
+        if 0 <= agent_id < len(self._riders):
+            return self._riders[agent_id]
+        return None
+
+    def get_driver(self, agent_id: int) -> Optional[DriverAgent]:
+        """
+        Returns the driver with the given id, or None if there is none.
+        """
+        index = agent_id - self.driver_id_offset
+        if 0 <= index < len(self._drivers):
+            return self._drivers[index]
+        return None
+
+    def get(self, agent_id: int) -> Optional[Union[RiderAgent, DriverAgent]]:
+        """
+        Returns the rider or driver with the given id, or None if there is none.
+        """
+        return self.get_rider(agent_id) or self.get_driver(agent_id)
+
+    def __contains__(self, agent_id: int) -> bool:
+        return self.get(agent_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._riders) + len(self._drivers)
+
+    def __repr__(self) -> str:
+        return f"AgentRegistry(riders={len(self._riders)}, drivers={len(self._drivers)})"
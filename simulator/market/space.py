@@ -1,44 +1,225 @@
-from typing import Dict, Tuple, List, Union
+import math
+from typing import Dict, Iterator, Sequence, Tuple, List, Union
+import numpy as np
 from ..agents.rider.rider import RiderAgent
 from ..agents.driver.driver import DriverAgent
 
+Agent = Union[DriverAgent, RiderAgent]
+CellId = Tuple[int, int]
+
+SQRT3 = math.sqrt(3)
+
+# Axial (q, r) offsets of the six neighbours of a cell, in ring-walking order.
+HEX_DIRECTIONS: Tuple[CellId, ...] = ((1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1))
+
 class HexGrid:
     """
     Represents the hexagonal grid of the simulation environment.
+
+    Cells are pointy-top hexagons addressed by axial coordinates (q, r).
+    `grid_resolution` is the distance between the centres of two adjacent
+    cells. The grid is a dynamic index: agents can be moved or removed in O(1),
+    and proximity queries can grow beyond a single cell with k-rings or a radius.
     """
     def __init__(self, grid_resolution: int):
         """
         Initializes the HexGrid.
 
         Args:
-            grid_resolution: The resolution of the grid.
+            grid_resolution: The resolution of the grid (centre-to-centre distance
+                between adjacent cells).
         """
         self.grid_resolution = grid_resolution
-        self._grid: Dict[Tuple[int, int], List[Union[DriverAgent, RiderAgent]]] = {}
+        # Hexagon size (centre-to-corner distance).
+        self._hex_size = grid_resolution / SQRT3
+        # Each cell holds an insertion-ordered set of agents (dict keys) for O(1) removal.
+        self._grid: Dict[CellId, Dict[Agent, None]] = {}
+        self._agent_cells: Dict[Agent, CellId] = {}
+
+    # --- Cell geometry ---
+
+    def get_cell_id(self, location: Tuple[int, int]) -> CellId:
+        """
+        Converts a location to the axial id of the cell containing it.
+        """
+        q = (SQRT3 / 3 * location[0] - location[1] / 3) / self._hex_size
+        r = (2 / 3 * location[1]) / self._hex_size
+        return self._axial_round(q, r)
+
+    def get_cell_ids(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized `get_cell_id` for arrays of coordinates.
 
-    def get_cell_id(self, location: Tuple[int, int]) -> Tuple[int, int]:
+        Returns:
+            The arrays of q and r cell coordinates.
         """
-        Converts a location to a cell ID.
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        qf = (SQRT3 / 3 * xs - ys / 3) / self._hex_size
+        rf = (2 / 3 * ys) / self._hex_size
+        sf = -qf - rf
+        q, r, s = np.rint(qf), np.rint(rf), np.rint(sf)
+        dq, dr, ds = np.abs(q - qf), np.abs(r - rf), np.abs(s - sf)
+        fix_q = (dq > dr) & (dq > ds)
+        fix_r = ~fix_q & (dr > ds)
+        q = np.where(fix_q, -r - s, q)
+        r = np.where(fix_r, -q - s, r)
+        return q.astype(np.int64), r.astype(np.int64)
+
+    @staticmethod
+    def _axial_round(qf: float, rf: float) -> CellId:
+        """Rounds fractional axial coordinates to the nearest cell (cube rounding)."""
+        sf = -qf - rf
+        q, r, s = round(qf), round(rf), round(sf)
+        dq, dr, ds = abs(q - qf), abs(r - rf), abs(s - sf)
+        if dq > dr and dq > ds:
+            q = -r - s
+        elif dr > ds:
+            r = -q - s
+        return (q, r)
+
+    def get_cell_center(self, cell_id: CellId) -> Tuple[float, float]:
         """
-        return (
-            int(location[0] / self.grid_resolution),
-            int(location[1] / self.grid_resolution),
-        )
+        Returns the location of the centre of a cell.
+        """
+        q, r = cell_id
+        return (self._hex_size * SQRT3 * (q + r / 2), self._hex_size * 1.5 * r)
+
+    @staticmethod
+    def hex_distance(cell_a: CellId, cell_b: CellId) -> int:
+        """
+        Returns the number of cell steps between two cells.
+        """
+        dq = cell_a[0] - cell_b[0]
+        dr = cell_a[1] - cell_b[1]
+        return (abs(dq) + abs(dr) + abs(dq + dr)) // 2
+
+    @staticmethod
+    def ring(cell_id: CellId, k: int) -> List[CellId]:
+        """
+        Returns the cells at exactly `k` steps from `cell_id`.
+        """
+        if k == 0:
+            return [cell_id]
+        cells = []
+        q = cell_id[0] + HEX_DIRECTIONS[4][0] * k
+        r = cell_id[1] + HEX_DIRECTIONS[4][1] * k
+        for dq, dr in HEX_DIRECTIONS:
+            for _ in range(k):
+                cells.append((q, r))
+                q += dq
+                r += dr
+        return cells
+
+    @classmethod
+    def k_ring(cls, cell_id: CellId, k: int) -> List[CellId]:
+        """
+        Returns all cells within `k` steps of `cell_id`, nearest rings first.
+        """
+        cells = []
+        for distance in range(k + 1):
+            cells.extend(cls.ring(cell_id, distance))
+        return cells
+
+    # --- Agent index ---
 
-    def add_agent(self, agent: Union[DriverAgent, RiderAgent]):
+    def add_agent(self, agent: Agent):
         """
         Adds an agent to the grid.
         """
-        cell_id = self.get_cell_id(agent.location)
-        if cell_id not in self._grid:
-            self._grid[cell_id] = []
-        self._grid[cell_id].append(agent)
+        self._insert(agent, self.get_cell_id(agent.location))
 
-    def get_agents_in_cell(self, cell_id: Tuple[int, int]) -> List[Union[DriverAgent, RiderAgent]]:
+    def add_agents(self, agents: Sequence[Agent], xs: np.ndarray = None, ys: np.ndarray = None):
+        """
+        Bulk-loads agents into the grid.
+
+        Cell ids are computed for all agents at once from their coordinates.
+        Agents keep the same order within a cell as with repeated `add_agent` calls.
+
+        Args:
+            agents: The agents to add.
+            xs, ys: The agents' coordinates, if already available as arrays.
+        """
+        if xs is None or ys is None:
+            locations = np.array([agent.location for agent in agents], dtype=np.float64).reshape(-1, 2)
+            xs, ys = locations[:, 0], locations[:, 1]
+        qs, rs = self.get_cell_ids(xs, ys)
+        for agent, cell_id in zip(agents, zip(qs.tolist(), rs.tolist())):
+            self._insert(agent, cell_id)
+
+    def _insert(self, agent: Agent, cell_id: CellId):
+        cell = self._grid.get(cell_id)
+        if cell is None:
+            self._grid[cell_id] = cell = {}
+        cell[agent] = None
+        self._agent_cells[agent] = cell_id
+
+    def remove_agent(self, agent: Agent):
+        """
+        Removes an agent from the grid. Does nothing if the agent is not indexed.
+        """
+        cell_id = self._agent_cells.pop(agent, None)
+        if cell_id is None:
+            return
+        cell = self._grid[cell_id]
+        del cell[agent]
+        if not cell:
+            del self._grid[cell_id]
+
+    def move_agent(self, agent: Agent, new_location: Tuple[int, int]):
+        """
+        Moves an agent to a new location, updating its cell if it changed.
+        """
+        agent.location = new_location
+        new_cell_id = self.get_cell_id(new_location)
+        old_cell_id = self._agent_cells.get(agent)
+        if old_cell_id == new_cell_id:
+            return
+        if old_cell_id is not None:
+            self.remove_agent(agent)
+        self._insert(agent, new_cell_id)
+
+    def get_agent_cell(self, agent: Agent) -> CellId:
+        """
+        Returns the cell an agent is indexed in, or None if it is not on the grid.
+        """
+        return self._agent_cells.get(agent)
+
+    def get_agents_in_cell(self, cell_id: CellId) -> List[Agent]:
         """
         Returns the list of agents in a given cell.
         """
-        return self._grid.get(cell_id, [])
+        cell = self._grid.get(cell_id)
+        return list(cell) if cell else []
+
+    def iter_agents_in_ring(self, cell_id: CellId, k: int) -> Iterator[Agent]:
+        """
+        Yields the agents in all cells within `k` steps of `cell_id`, nearest rings first.
+        """
+        grid = self._grid
+        for ring_cell in self.k_ring(cell_id, k):
+            cell = grid.get(ring_cell)
+            if cell:
+                yield from cell
+
+    def get_agents_within_radius(self, location: Tuple[int, int], radius: float) -> List[Agent]:
+        """
+        Returns the agents whose Euclidean distance to `location` is at most `radius`.
+        """
+        # A point within `radius` lies in a cell whose centre is at most
+        # radius + 2 * hex size from the centre of the query cell, and centres k
+        # rings apart are at least k * grid_resolution * sqrt(3) / 2 apart.
+        k = math.ceil((radius + 2 * self._hex_size) / (self.grid_resolution * SQRT3 / 2))
+        x, y = location
+        radius_sq = radius * radius
+        return [
+            agent for agent in self.iter_agents_in_ring(self.get_cell_id(location), k)
+            if (agent.location[0] - x) ** 2 + (agent.location[1] - y) ** 2 <= radius_sq
+        ]
+
+    def __len__(self) -> int:
+        """Returns the number of agents on the grid."""
+        return len(self._agent_cells)
 
     def __repr__(self) -> str:
         """
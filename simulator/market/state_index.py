@@ -0,0 +1,57 @@
+from enum import Enum
+from typing import Dict, Iterable, List, Set, Type
+
+class StateIndex:
+    """
+    Tracks which agents are currently in each state of a state machine.
+
+    All state changes must go through `transition` so the membership sets stay
+    in sync with the agents' `current_state`. This lets the per-tick phases visit
+    only the agents in the state they care about, and gives O(1) state counts.
+    """
+    def __init__(self, states: Type[Enum], agents: Iterable = ()):
+        """
+        Initializes the StateIndex.
+
+        Args:
+            states: The state enumeration (e.g., RiderState or DriverState).
+            agents: The agents to index by their current state.
+        """
+        self._members: Dict[Enum, Set[int]] = {state: set() for state in states}
+        for agent in agents:
+            self._members[agent.current_state].add(agent.agent_id)
+
+    def transition(self, agent, new_state: Enum):
+        """
+        Moves an agent to a new state and updates the index.
+        """
+        old_state = agent.current_state
+        if old_state is new_state:
+            return
+        self._members[old_state].discard(agent.agent_id)
+        self._members[new_state].add(agent.agent_id)
+        agent.current_state = new_state
+
+    def members(self, state: Enum) -> List[int]:
+        """
+        Returns the ids of the agents in a state, in ascending id order.
+
+        A sorted snapshot is returned so callers visit agents in the same order
+        as a scan over the population would, and may change states while iterating.
+        """
+        return sorted(self._members[state])
+
+    def count(self, state: Enum) -> int:
+        """
+        Returns the number of agents in a state.
+        """
+        return len(self._members[state])
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Returns the number of agents in every state, keyed by state name.
+        """
+        return {state.name: len(ids) for state, ids in self._members.items()}
+
+    def __repr__(self) -> str:
+        return f"StateIndex({self.counts()})"
@@ -0,0 +1,78 @@
+import random
+from typing import Dict, Optional, Tuple
+from simulator.market.demand import PoissonDemand
+
+# Shortest online session, in hours.
+MIN_SESSION_HOURS = 0.25
+
+class SessionSupply:
+    """
+    Samples when drivers go online and for how long.
+
+    Each driver works in sessions. Session starts follow a Poisson process
+    with a mean of `sessions_per_day` per day, optionally shaped by an hourly
+    start profile (e.g. morning and evening peaks), and each session lasts a
+    normally distributed number of hours. The Market only schedules the real
+    transitions: one event when a session starts and one when it ends.
+    """
+    def __init__(self, ticks_per_major: int, sessions_config: Optional[Dict] = None):
+        """
+        Initializes the SessionSupply.
+
+        Args:
+            ticks_per_major: The number of minor ticks per day.
+            sessions_config: The `market.driver_sessions` section, with
+                `sessions_per_day`, `session_hours_dist` ([mean, std_dev]) and
+                an optional `start_profile` of 24 relative hourly weights.
+        """
+        sessions_config = sessions_config or {}
+        self.ticks_per_major = ticks_per_major
+        self.sessions_per_day = sessions_config.get('sessions_per_day', 1.0)
+        self.session_hours_dist = sessions_config.get('session_hours_dist', [4.0, 2.0])
+        # Session starts are arrivals of a Poisson process, like rider searches.
+        self._starts = PoissonDemand(ticks_per_major, sessions_config.get('start_profile'))
+
+    def next_session_start(self, current_tick: int) -> Optional[int]:
+        """
+        Samples the tick of a driver's next session start after `current_tick`.
+
+        Returns:
+            The tick the session starts, or None if drivers never go online.
+        """
+        return self._starts.next_search_tick(7 * self.sessions_per_day, current_tick)
+
+    def session_ticks(self) -> int:
+        """Samples the length of a session, in minor ticks."""
+        hours = max(MIN_SESSION_HOURS, random.normalvariate(*self.session_hours_dist))
+        return max(1, round(hours * self.ticks_per_major / 24))
+
+    def next_session(self, current_tick: int) -> Optional[Tuple[int, int]]:
+        """
+        Samples a driver's next session after `current_tick`.
+
+        Returns:
+            The start and end ticks of the session, or None if drivers never go online.
+        """
+        start = self.next_session_start(current_tick)
+        if start is None:
+            return None
+        return start, start + self.session_ticks()
+
+    def first_session(self, start_tick: int = 0) -> Optional[Tuple[int, int]]:
+        """
+        Samples a driver's first session at the start of a run.
+
+        Sessions are sampled from a day before `start_tick`, so drivers already
+        mid-session when the run starts are online from its first tick and the
+        run starts with a realistic supply instead of an empty market.
+
+        Returns:
+            The start (clipped to `start_tick`) and end ticks of the first
+            session that is still running at or after `start_tick`, or None.
+        """
+        session = self.next_session(start_tick - self.ticks_per_major)
+        while session is not None and session[1] <= start_tick:
+            session = self.next_session(session[1])
+        if session is None:
+            return None
+        return max(start_tick, session[0]), session[1]
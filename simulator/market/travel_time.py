@@ -0,0 +1,119 @@
+import math
+from typing import Dict, Optional, Tuple
+import numpy as np
+from simulator.market.space import HexGrid
+from simulator.market.population import CITY_SIZE
+
+CellId = Tuple[int, int]
+
+class TravelTimeTable:
+    """
+    Precomputed driving times between grid cells, in minutes.
+
+    Travel times are looked up, never computed, while the simulation runs. For
+    a homogeneous city the time only depends on the number of cell steps, so a
+    1-D table indexed by hex distance covers every pair of cells. A dense
+    cell-to-cell matrix is built on top of it when the city has few enough
+    cells, or loaded from disk (e.g. times exported from a road network); cells
+    outside the matrix fall back to the distance table.
+    """
+    def __init__(self, grid: HexGrid, speed_kmh: float = 25.0, min_minutes: float = 2.0,
+                 max_dense_cells: int = 2048, city_size: int = CITY_SIZE):
+        """
+        Initializes the TravelTimeTable.
+
+        Args:
+            grid: The HexGrid whose cells the table covers. Locations are in metres.
+            speed_kmh: Average driving speed.
+            min_minutes: Minimum travel time for any trip.
+            max_dense_cells: Largest number of city cells for which the dense
+                cell-to-cell matrix is built.
+            city_size: Side length of the square city, in metres.
+        """
+        self.grid = grid
+        self.speed_kmh = speed_kmh
+        self.min_minutes = min_minutes
+        metres_per_minute = speed_kmh * 1000 / 60
+
+        # Minutes per number of cell steps, up to the widest span of the city.
+        # Trips within one cell are counted as half a step.
+        max_steps = math.ceil(2 * city_size / grid.grid_resolution) + 2
+        steps = np.maximum(0.5, np.arange(max_steps + 1, dtype=np.float64))
+        self._by_distance = np.maximum(min_minutes, steps * grid.grid_resolution / metres_per_minute).astype(np.float32)
+
+        self._cell_index: Dict[CellId, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        # A hexagon covers sqrt(3)/2 * resolution^2, so large cities are skipped without enumerating cells.
+        approx_cells = (city_size / grid.grid_resolution + 1) ** 2 * 2 / math.sqrt(3)
+        cells = city_cells(grid, city_size) if approx_cells <= 2 * max_dense_cells else np.empty((0, 2), dtype=np.int64)
+        if 0 < len(cells) <= max_dense_cells:
+            q, r = cells[:, 0], cells[:, 1]
+            dq = q[:, None] - q[None, :]
+            dr = r[:, None] - r[None, :]
+            distances = (np.abs(dq) + np.abs(dr) + np.abs(dq + dr)) // 2
+            self._set_matrix(cells, self._by_distance[np.minimum(distances, max_steps)])
+
+    @classmethod
+    def from_file(cls, grid: HexGrid, path: str, **kwargs) -> "TravelTimeTable":
+        """
+        Builds a table whose cell-to-cell times come from an `.npz` file holding
+        `cells` (an (n, 2) array of axial cell ids) and `minutes` (an (n, n) matrix).
+        """
+        table = cls(grid, max_dense_cells=0, **kwargs)
+        with np.load(path) as data:
+            cells = data["cells"]
+            minutes = data["minutes"]
+        if minutes.shape != (len(cells), len(cells)):
+            raise ValueError(f"Travel-time file {path} has {len(cells)} cells but a {minutes.shape} matrix.")
+        table._set_matrix(cells, minutes.astype(np.float32))
+        return table
+
+    def _set_matrix(self, cells: np.ndarray, minutes: np.ndarray):
+        self._cell_index = {cell: i for i, cell in enumerate(map(tuple, cells.tolist()))}
+        self._matrix = minutes
+
+    def save(self, path: str):
+        """Writes the dense matrix to an `.npz` file readable by `from_file`."""
+        if self._matrix is None:
+            raise ValueError("This table has no dense matrix to save.")
+        cells = np.array(list(self._cell_index), dtype=np.int64).reshape(-1, 2)
+        np.savez(path, cells=cells, minutes=self._matrix)
+
+    def minutes(self, from_cell: CellId, to_cell: CellId) -> float:
+        """
+        Returns the driving time between two cells, in minutes.
+        """
+        index = self._cell_index
+        if self._matrix is not None and from_cell in index and to_cell in index:
+            return float(self._matrix[index[from_cell], index[to_cell]])
+        steps = min(HexGrid.hex_distance(from_cell, to_cell), len(self._by_distance) - 1)
+        return float(self._by_distance[steps])
+
+    def minutes_between(self, from_location: Tuple[int, int], to_location: Tuple[int, int]) -> float:
+        """
+        Returns the driving time between two locations, in minutes.
+        """
+        return self.minutes(self.grid.get_cell_id(from_location), self.grid.get_cell_id(to_location))
+
+    @property
+    def num_cells(self) -> int:
+        """Number of cells in the dense matrix (0 if there is none)."""
+        return len(self._cell_index)
+
+    def memory_bytes(self) -> int:
+        matrix_bytes = self._matrix.nbytes if self._matrix is not None else 0
+        return matrix_bytes + self._by_distance.nbytes
+
+    def __repr__(self) -> str:
+        return f"TravelTimeTable(speed_kmh={self.speed_kmh}, cells={self.num_cells})"
+
+def city_cells(grid: HexGrid, city_size: int = CITY_SIZE) -> np.ndarray:
+    """
+    Returns the axial ids of the cells covering the square city, as an (n, 2) array.
+    """
+    # Sample the city at half the cell spacing, so every cell holding a sizeable part of it is hit.
+    step = grid.grid_resolution / 2
+    coords = np.arange(0, city_size + step, step)
+    xs, ys = np.meshgrid(np.minimum(coords, city_size), np.minimum(coords, city_size))
+    qs, rs = grid.get_cell_ids(xs.ravel(), ys.ravel())
+    return np.unique(np.stack([qs, rs], axis=1), axis=0)
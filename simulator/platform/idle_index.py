@@ -0,0 +1,84 @@
+from typing import Dict, Iterable, Set, Tuple
+from simulator.market.space import HexGrid
+from simulator.agents.driver.driver import DriverAgent
+
+CellId = Tuple[int, int]
+
+class IdleDriverIndex:
+    """
+    Per-cell buckets of the idle drivers available to one platform.
+
+    Unlike the HexGrid, which holds every agent, a bucket only holds drivers who
+    are idle and eligible for the platform, so matching never has to filter out
+    riders or busy drivers. The Market keeps it up to date on every driver state
+    change and move.
+    """
+    def __init__(self, grid: HexGrid):
+        """
+        Initializes the IdleDriverIndex.
+
+        Args:
+            grid: The HexGrid whose cell geometry the buckets follow.
+        """
+        self.grid = grid
+        self._cells: Dict[CellId, Dict[DriverAgent, None]] = {}
+        self._driver_cells: Dict[DriverAgent, CellId] = {}
+        # Cells whose idle supply changed since the owning Platform last
+        # dropped the cached quotes around them (see Platform.get_quote).
+        self.changed_cells: Set[CellId] = set()
+
+    def add(self, driver: DriverAgent):
+        """
+        Adds a driver to the bucket of the cell they are in.
+        """
+        if driver in self._driver_cells:
+            return
+        cell_id = self.grid.get_cell_id(driver.location)
+        cell = self._cells.get(cell_id)
+        if cell is None:
+            self._cells[cell_id] = cell = {}
+        cell[driver] = None
+        self._driver_cells[driver] = cell_id
+        self.changed_cells.add(cell_id)
+
+    def remove(self, driver: DriverAgent):
+        """
+        Removes a driver from the index. Does nothing if the driver is not indexed.
+        """
+        cell_id = self._driver_cells.pop(driver, None)
+        if cell_id is None:
+            return
+        cell = self._cells[cell_id]
+        del cell[driver]
+        if not cell:
+            del self._cells[cell_id]
+        self.changed_cells.add(cell_id)
+
+    def update_location(self, driver: DriverAgent):
+        """
+        Moves an indexed driver to the bucket of their current location.
+        """
+        if driver in self._driver_cells:
+            self.remove(driver)
+            self.add(driver)
+
+    def drivers_in_cell(self, cell_id: CellId) -> Iterable[DriverAgent]:
+        """
+        Returns the idle drivers in a cell.
+        """
+        return self._cells.get(cell_id, ())
+
+    def count_in_cell(self, cell_id: CellId) -> int:
+        """
+        Returns the number of idle drivers in a cell.
+        """
+        return len(self._cells.get(cell_id, ()))
+
+    def __contains__(self, driver: DriverAgent) -> bool:
+        return driver in self._driver_cells
+
+    def __len__(self) -> int:
+        return len(self._driver_cells)
+
+    def __repr__(self) -> str:
+        return f"IdleDriverIndex(idle_drivers={len(self)}, cells={len(self._cells)})"
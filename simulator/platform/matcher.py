@@ -1,40 +1,122 @@
+import heapq
 import logging
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
+import numpy as np
 from simulator.market.space import HexGrid
+from simulator.market.travel_time import TravelTimeTable
+from simulator.platform.idle_index import IdleDriverIndex
 from simulator.agents.driver.driver import DriverAgent, DriverState
 from simulator.agents.rider.rider import RiderAgent, RiderState
-from simulator.agents.driver.logic import calculate_profitability_score
-from simulator.utils.time_utils import ticks_to_time_string
-from simulator.utils.helpers import calculate_distance
+from simulator.agents.driver.logic import calculate_profitability_scores, driver_sensitivities
+from simulator.utils.time_utils import get_clock
+from simulator.utils.output_policy import OutputPolicy
+
+# Pickup ETA, in minutes, used when the matcher has no travel-time table.
+SIMPLIFIED_ETA_MINUTES = 5
 
 class Matcher:
     """
     The platform's matching engine.
     """
-    def __init__(self, grid: HexGrid, max_order_tries: int = 3, ticks_per_major: int = 60):
+    def __init__(self, grid: HexGrid, max_order_tries: int = 3, ticks_per_major: int = 60, search_rings: int = 1,
+                 idle_drivers: Optional[IdleDriverIndex] = None, batch_window_ticks: int = 0,
+                 travel_times: Optional[TravelTimeTable] = None, output: Optional[OutputPolicy] = None):
         """
         Initializes the Matcher.
 
         Args:
             grid: The HexGrid object.
             max_order_tries: The maximum number of drivers to try for a single order.
+            search_rings: How many rings of neighbouring cells to search when the
+                rider's own cell has fewer than `max_order_tries` idle drivers.
+            idle_drivers: The platform's index of idle drivers. Without one, the
+                matcher falls back to scanning the grid cells.
+            batch_window_ticks: 0 to dispatch every order on its own as it comes in
+                (greedy); N > 0 to collect orders over N minor ticks and assign
+                them together with `match_batch`.
+            travel_times: The cell-to-cell travel times used for pickup ETAs.
+                Without them, every pickup takes SIMPLIFIED_ETA_MINUTES.
+            output: Decides which matcher events are logged. Without one, all are.
         """
         self.grid = grid
         self.max_order_tries = max_order_tries
         self.ticks_per_major = ticks_per_major
+        self.search_rings = search_rings
+        self.idle_drivers = idle_drivers
+        self.batch_window_ticks = batch_window_ticks
+        self.travel_times = travel_times
+        self.output = output if output is not None else OutputPolicy(clock=get_clock(ticks_per_major))
+
+    def _idle_drivers_in_cell(self, cell_id: Tuple[int, int]) -> Iterable[DriverAgent]:
+        """Returns the idle drivers in a cell, from the idle index when available."""
+        if self.idle_drivers is not None:
+            return self.idle_drivers.drivers_in_cell(cell_id)
+        return [
+            agent for agent in self.grid.get_agents_in_cell(cell_id)
+            if isinstance(agent, DriverAgent) and agent.current_state == DriverState.IDLE
+        ]
 
-    def find_nearest_idle_drivers(self, rider: RiderAgent) -> List[DriverAgent]:
+    def find_nearest_idle_drivers(self, rider: RiderAgent, k: Optional[int] = None) -> List[DriverAgent]:
         """
-        Finds idle drivers in the rider's cell and sorts them by distance.
+        Finds idle drivers around the rider, nearest first.
+
+        The search starts in the rider's cell and grows ring by ring, up to
+        `search_rings`, until at least `k` (default `max_order_tries`) idle
+        drivers are found.
+
+        Args:
+            rider: The rider to find drivers for.
+            k: If given, only the `k` nearest drivers are returned, selected with a
+                bounded heap instead of sorting every candidate.
         """
+        wanted = self.max_order_tries if k is None else k
         rider_cell = self.grid.get_cell_id(rider.location)
-        drivers_in_cell = self.grid.get_agents_in_cell(rider_cell)
-        idle_drivers = [d for d in drivers_in_cell if isinstance(d, DriverAgent) and d.current_state == DriverState.IDLE]
+        candidates = []
+        for ring_k in range(self.search_rings + 1):
+            for ring_cell in self.grid.ring(rider_cell, ring_k):
+                candidates.extend(self._idle_drivers_in_cell(ring_cell))
+            if len(candidates) >= wanted:
+                break
+
+        x, y = rider.location
+        def distance_sq(driver: DriverAgent) -> float:
+            return (driver.location[0] - x) ** 2 + (driver.location[1] - y) ** 2
+
+        if k is None:
+            candidates.sort(key=distance_sq)
+            return candidates
+        # Ties keep their scan order, exactly as with a full sort.
+        return heapq.nsmallest(k, candidates, key=distance_sq)
 
-        # --- NEW LOGIC: Sort drivers by distance ---
-        idle_drivers.sort(key=lambda driver: calculate_distance(driver.location, rider.location))
-        
-        return idle_drivers
+    def pickup_etas(self, drivers: List[DriverAgent], location: Tuple[int, int]) -> np.ndarray:
+        """
+        Returns each driver's ETA to a pickup location, in minutes.
+        """
+        if self.travel_times is None:
+            return np.full(len(drivers), SIMPLIFIED_ETA_MINUTES, dtype=np.float64)
+        pickup_cell = self.grid.get_cell_id(location)
+        minutes = self.travel_times.minutes
+        get_cell_id = self.grid.get_cell_id
+        return np.fromiter(
+            (minutes(get_cell_id(driver.location), pickup_cell) for driver in drivers),
+            dtype=np.float64, count=len(drivers)
+        )
+
+    def estimate_eta(self, cell_id: Tuple[int, int]) -> Optional[float]:
+        """
+        Estimates the pickup ETA for an order placed in a cell, from the idle
+        drivers in the nearest ring that has any.
+
+        Returns:
+            The ETA in minutes, or None if no idle driver is within the search rings.
+        """
+        for ring_k in range(self.search_rings + 1):
+            ring_cells = [ring_cell for ring_cell in self.grid.ring(cell_id, ring_k) if self._idle_drivers_in_cell(ring_cell)]
+            if ring_cells:
+                if self.travel_times is None:
+                    return SIMPLIFIED_ETA_MINUTES
+                return min(self.travel_times.minutes(ring_cell, cell_id) for ring_cell in ring_cells)
+        return None
 
     def process_order(self, rider: RiderAgent, fare: float, order_id: str, day: int, tick: int) -> Tuple[Optional[DriverAgent], str]:
         """
@@ -43,28 +125,93 @@ class Matcher:
         Returns:
             A tuple containing the matched driver (or None) and the outcome status.
         """
-        time_str = ticks_to_time_string(day, tick, self.ticks_per_major)
-        logging.info(f"MATCHER | ORDER_RECEIVED   | {time_str} | Order {order_id} from Rider {rider.agent_id}. Searching for drivers.")
-        idle_drivers = self.find_nearest_idle_drivers(rider)
+        current_tick = day * self.ticks_per_major + tick
+        self.output.log(logging.INFO, "ORDER_RECEIVED", current_tick, rider.agent_id, None, "MATCHER | ORDER_RECEIVED   | %s | Order %s from Rider %s. Searching for drivers.", order_id, rider.agent_id)
+        # One candidate beyond the try limit tells "out of tries" apart from "out of drivers".
+        idle_drivers = self.find_nearest_idle_drivers(rider, self.max_order_tries + 1)
 
         if not idle_drivers:
-            logging.warning(f"MATCHER | MATCH_FAILED     | {time_str} | Order {order_id}: Failed to match. Reason: UNFULFILLED_NO_DRIVERS.")
+            self.output.log(logging.WARNING, "MATCH_FAILED", current_tick, rider.agent_id, None, "MATCHER | MATCH_FAILED     | %s | Order %s: Failed to match. Reason: UNFULFILLED_NO_DRIVERS.", order_id)
             return None, "UNFULFILLED_NO_DRIVERS"
 
-        for i, driver in enumerate(idle_drivers):
+        etas_to_rider = self.pickup_etas(idle_drivers, rider.location)
+        profitability_scores = calculate_profitability_scores(*driver_sensitivities(idle_drivers), fare, etas_to_rider).tolist()
+
+        for i, (driver, eta_to_rider, profitability_score) in enumerate(zip(idle_drivers, etas_to_rider.tolist(), profitability_scores)):
             if i >= self.max_order_tries:
-                logging.warning(f"MATCHER | MATCH_FAILED     | {time_str} | Order {order_id}: Failed to match. Reason: UNFULFILLED_MAX_TRIES.")
+                self.output.log(logging.WARNING, "MATCH_FAILED", current_tick, rider.agent_id, None, "MATCHER | MATCH_FAILED     | %s | Order %s: Failed to match. Reason: UNFULFILLED_MAX_TRIES.", order_id)
                 return None, "UNFULFILLED_MAX_TRIES"
 
-            eta_to_rider = 5 # Simplified ETA
-            profitability_score = calculate_profitability_score(driver, fare, eta_to_rider)
-            logging.info(f"MATCHER | DRIVER_PROPOSED  | {time_str} | Order {order_id}: Attempting Driver {driver.agent_id} at {driver.location} for Rider {rider.agent_id} at {rider.location} (Profitability Score: {profitability_score:.2f}).")
+            self.output.log(logging.INFO, "DRIVER_PROPOSED", current_tick, rider.agent_id, driver.agent_id, "MATCHER | DRIVER_PROPOSED  | %s | Order %s: Attempting Driver %s at %s for Rider %s at %s (ETA %.1f min, Profitability Score: %.2f).", order_id, driver.agent_id, driver.location, rider.agent_id, rider.location, eta_to_rider, profitability_score)
 
             if profitability_score > 0:
-                logging.info(f"MATCHER | DRIVER_ACCEPTED  | {time_str} | Order {order_id}: Driver {driver.agent_id} ACCEPTED the offer.")
+                self.output.log(logging.INFO, "DRIVER_ACCEPTED", current_tick, rider.agent_id, driver.agent_id, "MATCHER | DRIVER_ACCEPTED  | %s | Order %s: Driver %s ACCEPTED the offer.", order_id, driver.agent_id)
                 return driver, "MATCH_SUCCESSFUL"
             else:
-                logging.info(f"MATCHER | DRIVER_REJECTED  | {time_str} | Order {order_id}: Driver {driver.agent_id} REJECTED the offer (score {profitability_score:.2f} <= 0).")
+                self.output.log(logging.INFO, "DRIVER_REJECTED", current_tick, rider.agent_id, driver.agent_id, "MATCHER | DRIVER_REJECTED  | %s | Order %s: Driver %s REJECTED the offer (score %.2f <= 0).", order_id, driver.agent_id, profitability_score)
 
-        logging.warning(f"MATCHER | MATCH_FAILED     | {time_str} | Order {order_id}: Failed to match after trying all available drivers. Reason: UNFULFILLED_NO_DRIVERS.")
+        self.output.log(logging.WARNING, "MATCH_FAILED", current_tick, rider.agent_id, None, "MATCHER | MATCH_FAILED     | %s | Order %s: Failed to match after trying all available drivers. Reason: UNFULFILLED_NO_DRIVERS.", order_id)
         return None, "UNFULFILLED_NO_DRIVERS"
+
+    def match_batch(self, riders: List[RiderAgent], fare: float, day: int, tick: int) -> Dict[int, DriverAgent]:
+        """
+        Assigns a batch of open orders to idle drivers in one pass.
+
+        Every rider gets the same candidates as in `process_order` (their
+        `max_order_tries` nearest idle drivers). Distances are computed for
+        these candidate pairs only, and pairs are assigned in order of
+        increasing distance, skipping riders and drivers already assigned, so no
+        driver is offered twice. Pairs the driver would reject (given the fare
+        and their ETA to the rider) are left out.
+
+        Returns:
+            The matched driver for each matched rider, by rider id.
+        """
+        if not riders:
+            return {}
+        current_tick = day * self.ticks_per_major + tick
+
+        # Column of each candidate driver in the matrix, in first-seen order.
+        driver_columns: Dict[DriverAgent, int] = {}
+        pair_rows, pair_columns, pair_etas = [], [], []
+        for row, rider in enumerate(riders):
+            candidates = self.find_nearest_idle_drivers(rider, self.max_order_tries)
+            for driver in candidates:
+                pair_rows.append(row)
+                pair_columns.append(driver_columns.setdefault(driver, len(driver_columns)))
+            pair_etas.extend(self.pickup_etas(candidates, rider.location).tolist())
+        if not driver_columns:
+            self.output.log(logging.WARNING, "BATCH_MATCHED", current_tick, None, None, "MATCHER | BATCH_MATCHED    | %s | Batch of %s orders: no idle drivers nearby.", len(riders))
+            return {}
+
+        drivers = list(driver_columns)
+        price_sensitivity, eta_sensitivity = driver_sensitivities(drivers)
+        pair_rows = np.array(pair_rows, dtype=np.int64)
+        pair_columns = np.array(pair_columns, dtype=np.int64)
+        accepts = calculate_profitability_scores(
+            price_sensitivity[pair_columns], eta_sensitivity[pair_columns], fare, np.array(pair_etas)
+        ) > 0
+
+        # Only the accepted candidate pairs are scored: at most max_order_tries per rider.
+        pair_rows = pair_rows[accepts]
+        pair_columns = pair_columns[accepts]
+        rider_xy = np.array([rider.location for rider in riders], dtype=np.float64)
+        driver_xy = np.array([driver.location for driver in drivers], dtype=np.float64)
+        distance_sq = ((rider_xy[pair_rows] - driver_xy[pair_columns]) ** 2).sum(axis=1)
+
+        # Global greedy assignment over the candidate pairs, nearest first (ties by rider, then driver).
+        pair_order = np.lexsort((pair_columns, pair_rows, distance_sq))
+        rider_taken = np.zeros(len(riders), dtype=bool)
+        driver_taken = np.zeros(len(drivers), dtype=bool)
+        max_matches = min(len(riders), len(drivers))
+        matches: Dict[int, DriverAgent] = {}
+        for row, column in zip(pair_rows[pair_order].tolist(), pair_columns[pair_order].tolist()):
+            if rider_taken[row] or driver_taken[column]:
+                continue
+            rider_taken[row] = driver_taken[column] = True
+            matches[riders[row].agent_id] = drivers[column]
+            if len(matches) == max_matches:
+                break
+
+        self.output.log(logging.INFO, "BATCH_MATCHED", current_tick, None, None, "MATCHER | BATCH_MATCHED    | %s | Batch of %s orders against %s drivers: %s matched.", len(riders), len(drivers), len(matches))
+        return matches
@@ -1,20 +1,115 @@
 # simulator/platform/platform.py
+from typing import Dict, NamedTuple, Optional, Tuple
 from simulator.platform.matcher import Matcher
+from simulator.platform.idle_index import IdleDriverIndex
+from simulator.agents.driver.driver import DriverAgent
+from simulator.agents.rider.rider import RiderAgent
+from simulator.agents.driver.logic import serves_platform
+
+class Quote(NamedTuple):
+    """A platform's offer for an order placed in a given cell and tick."""
+    platform_id: str
+    price: float
+    eta: Optional[int]  # None when no idle driver is nearby
+
+    @property
+    def available(self) -> bool:
+        return self.eta is not None
 
 class Platform:
     """
     Represents a ride-hailing platform.
     """
-    def __init__(self, platform_id: str, matcher: Matcher):
+    def __init__(self, platform_id: str, matcher: Matcher, base_fare: float = 20.0):
         """
         Initializes a Platform.
 
         Args:
             platform_id: The unique identifier for the platform (e.g., 'A').
             matcher: The matcher object for this platform.
+            base_fare: The fare charged for a ride.
         """
         self.platform_id = platform_id
         self.matcher = matcher
+        self.base_fare = base_fare
+        # The idle drivers this platform can dispatch, shared with its matcher.
+        if matcher.idle_drivers is None:
+            matcher.idle_drivers = IdleDriverIndex(matcher.grid)
+        self.idle_drivers = matcher.idle_drivers
+        # Orders waiting for the next batch dispatch, by rider id (batch mode only).
+        self.pending_orders: Dict[int, RiderAgent] = {}
+        self.batch_due_tick: Optional[int] = None
+        # Quotes of the current tick, by (cell, tick).
+        self._quotes: Dict[Tuple[Tuple[int, int], int], Quote] = {}
+        self._quotes_tick: Optional[int] = None
+        self.quote_hits = 0
+        self.quote_misses = 0
+
+    @property
+    def batches_orders(self) -> bool:
+        """True if the matcher dispatches orders in batch windows."""
+        return self.matcher.batch_window_ticks > 0
+
+    def queue_order(self, rider: RiderAgent, current_tick: int):
+        """
+        Adds a rider's order to the current batch. The first order of a batch
+        opens a window of `batch_window_ticks` minor ticks.
+        """
+        if not self.pending_orders:
+            self.batch_due_tick = current_tick + self.matcher.batch_window_ticks - 1
+        self.pending_orders[rider.agent_id] = rider
+
+    def batch_is_due(self, current_tick: int) -> bool:
+        return bool(self.pending_orders) and current_tick >= self.batch_due_tick
+
+    def reopen_batch(self, next_tick: int):
+        """Starts the next window for the orders left over after a dispatch."""
+        self.batch_due_tick = next_tick + self.matcher.batch_window_ticks - 1 if self.pending_orders else None
+
+    def get_quote(self, cell_id: Tuple[int, int], current_tick: int) -> Quote:
+        """
+        Returns the platform's price and ETA for an order placed in a cell.
+
+        Quotes are memoized by (cell, tick): every rider comparing offers in the
+        same cell and tick gets the cached quote. When the idle supply of a cell
+        changes, the quotes of every cell whose search reaches it are dropped,
+        so a hit costs one dict lookup.
+        """
+        if self.idle_drivers.changed_cells:
+            self._drop_stale_quotes(current_tick)
+        quote = self._quotes.get((cell_id, current_tick))
+        if quote is not None:
+            self.quote_hits += 1
+            return quote
+
+        self.quote_misses += 1
+        if current_tick != self._quotes_tick:
+            self._quotes.clear()
+            self._quotes_tick = current_tick
+        quote = Quote(self.platform_id, self.base_fare, self.matcher.estimate_eta(cell_id))
+        self._quotes[(cell_id, current_tick)] = quote
+        return quote
+
+    def _drop_stale_quotes(self, current_tick: int):
+        """Drops the cached quotes within `search_rings` of the cells whose idle supply changed."""
+        changed_cells = self.idle_drivers.changed_cells
+        if current_tick != self._quotes_tick:
+            self._quotes.clear()
+        elif self._quotes:
+            quotes, rings = self._quotes, self.matcher.search_rings
+            for changed_cell in changed_cells:
+                # Rings are symmetric: a cell's search reaches `changed_cell` iff it lies within `rings` of it.
+                for cell_id in self.grid.k_ring(changed_cell, rings):
+                    quotes.pop((cell_id, current_tick), None)
+        changed_cells.clear()
+
+    @property
+    def grid(self):
+        return self.matcher.grid
+
+    def serves(self, driver: DriverAgent) -> bool:
+        """Returns True if the driver takes orders from this platform."""
+        return serves_platform(driver, self.platform_id)
 
     def __repr__(self) -> str:
         return f"Platform(id={self.platform_id})"
@@ -0,0 +1,134 @@
+# simulator/utils/async_writer.py
+import logging
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+
+# Handed to the writer thread to make it stop.
+_STOP = object()
+
+class BackgroundWriter:
+    """
+    Formats and writes items on a background thread, in batches.
+
+    `put` only appends the raw item to the current batch; full batches go to
+    the writer thread through a bounded queue. When the thread falls behind
+    and `max_pending_batches` are waiting, `put` blocks until one has been
+    written (backpressure), so memory stays bounded on long runs.
+
+    A writer has a single producer: calls to `put` must not race each other.
+    An error raised by `write_batch` is re-raised in the producer on the next
+    `put`, `flush` or `close`.
+    """
+    def __init__(self, write_batch: Callable[[List[Any]], None], batch_size: int = 4096,
+                 max_pending_batches: int = 16, name: str = "background-writer"):
+        """
+        Initializes the BackgroundWriter and starts its thread.
+
+        Args:
+            write_batch: Called on the writer thread with each batch of items, in order.
+            batch_size: Number of items collected before a batch is handed over.
+            max_pending_batches: Size of the queue of batches waiting to be written.
+            name: Name of the writer thread.
+        """
+        self._write_batch = write_batch
+        self.batch_size = batch_size
+        self._batch: List[Any] = []
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending_batches)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, item: Any):
+        """Queues an item for writing."""
+        self._batch.append(item)
+        if len(self._batch) >= self.batch_size:
+            self._hand_over()
+
+    def _hand_over(self):
+        """Passes the current batch to the writer thread, blocking while the queue is full."""
+        self._raise_error()
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self._queue.put(batch)
+
+    def flush(self):
+        """Blocks until every item queued so far has been written."""
+        self._hand_over()
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """
+        Writes every queued item and stops the writer thread. The thread is
+        stopped even if a write failed; the error is re-raised afterwards.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._hand_over()
+        finally:
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_error()
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is _STOP:
+                    return
+                if self._error is None:
+                    self._write_batch(batch)
+            except BaseException as error:
+                # Later batches are dropped; the producer sees the error.
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+class BatchedFileHandler(logging.Handler):
+    """
+    A logging handler that formats and writes records on a background thread.
+
+    Records are queued unformatted, so a call site using lazy `%s` arguments
+    pays neither for the message formatting nor for the file write. Argument
+    values must not be mutated after the call (ids, numbers, strings and
+    tuples are safe).
+    """
+    def __init__(self, filename: str, mode: str = 'a', encoding: Optional[str] = None,
+                 batch_size: int = 4096, max_pending_batches: int = 16):
+        super().__init__()
+        self.baseFilename = filename
+        self._file = open(filename, mode, encoding=encoding)
+        self._writer = BackgroundWriter(self._write_records, batch_size, max_pending_batches, name="log-writer")
+
+    def emit(self, record: logging.LogRecord):
+        self._writer.put(record)
+
+    def _write_records(self, records: List[logging.LogRecord]):
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def flush(self):
+        self._writer.flush()
+
+    def close(self):
+        try:
+            self._writer.close()
+        finally:
+            self._file.close()
+            super().close()
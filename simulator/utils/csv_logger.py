@@ -1,15 +1,47 @@
 # simulator/utils/csv_logger.py
 import csv
+from simulator.utils.async_writer import BackgroundWriter
+from simulator.utils.time_utils import get_clock
 
 class CsvLogger:
-    def __init__(self, filename="simulation_log.csv"):
+    """
+    Writes simulation events to a CSV file.
+
+    Rows are queued as raw tuples and formatted and written on a background
+    thread in large batches (see BackgroundWriter). `details` may be a `%`
+    format string whose `details_args` are filled in on that thread, so call
+    sites don't build strings. `close` writes every queued row.
+
+    Events are logged with their absolute integer tick; the timestamp column
+    is formatted from it with `ticks_per_major` (or holds the raw tick if
+    that is None). See BinaryEventLogger for a compact alternative.
+    """
+    def __init__(self, filename="simulation_log.csv", ticks_per_major=None, batch_size=4096, max_pending_batches=16):
         self.filename = filename
+        self.ticks_per_major = ticks_per_major
+        self.clock = get_clock(ticks_per_major) if ticks_per_major is not None else None
         self.file = open(self.filename, 'w', newline='')
         self.writer = csv.writer(self.file)
         self.writer.writerow(["timestamp", "event_type", "rider_id", "driver_id", "details"])
+        self._background = BackgroundWriter(self._write_rows, batch_size, max_pending_batches, name="csv-writer")
+
+    def log(self, tick, event_type, rider_id=None, driver_id=None, details="", details_args=(), platform_id=None):
+        self._background.put((tick, event_type, rider_id, driver_id, details, details_args))
+
+    def _write_rows(self, rows):
+        label = self.clock.label if self.clock is not None else str
+        self.writer.writerows(
+            (label(tick), event_type, rider_id, driver_id, details % details_args if details_args else details)
+            for tick, event_type, rider_id, driver_id, details, details_args in rows
+        )
 
-    def log(self, timestamp, event_type, rider_id=None, driver_id=None, details=""):
-        self.writer.writerow([timestamp, event_type, rider_id, driver_id, details])
+    def flush(self):
+        """Blocks until every row logged so far is written to the file."""
+        self._background.flush()
+        self.file.flush()
 
     def close(self):
-        self.file.close()
+        try:
+            self._background.close()
+        finally:
+            self.file.close()
@@ -0,0 +1,175 @@
+# simulator/utils/event_log.py
+import csv
+import json
+import os
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+from simulator.utils.async_writer import BackgroundWriter
+from simulator.utils.time_utils import get_clock
+
+# File layout:
+#   MAGIC (8 bytes) | header length (uint32, little-endian) | JSON header
+#   | padding to DATA_ALIGNMENT | fixed-width records up to the end of the file
+MAGIC = b"RIDELOG1"
+FORMAT_VERSION = 1
+DATA_ALIGNMENT = 64
+
+# Event type codes; the code of an event type is its index.
+EVENT_TYPES = ("ORDER_CREATED", "SEARCH_ABANDONED", "STATE_IDLE", "STATE_OFFLINE", "TRIP_COMPLETED")
+EVENT_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+# Platform codes; 0 means no platform.
+PLATFORM_IDS = (None, 'A', 'B')
+PLATFORM_CODES = {platform_id: code for code, platform_id in enumerate(PLATFORM_IDS)}
+# Stored in place of a missing rider or driver id.
+NO_AGENT = -1
+# Records converted to Python rows at a time by `convert_to_csv`.
+CONVERT_CHUNK_RECORDS = 1 << 20
+
+# One 16-byte record per event.
+RECORD_DTYPE = np.dtype([
+    ("tick", "<u4"),
+    ("rider_id", "<i4"),
+    ("driver_id", "<i4"),
+    ("event_type", "u1"),
+    ("platform", "u1"),
+    ("reserved", "<u2"),
+])
+
+# Details column rebuilt by `convert_to_csv`. Records hold no locations, so
+# these are the Market's CSV details without the "at location (x, y)" parts.
+DETAILS_TEMPLATES = {
+    "ORDER_CREATED": "Rider {rider_id} starting search for Order {order_id}.",
+    "SEARCH_ABANDONED": "Rider {rider_id} ABANDONED SEARCH for Order {order_id}.",
+    "STATE_IDLE": "Driver {driver_id} is now IDLE.",
+    "STATE_OFFLINE": "Driver {driver_id} went OFFLINE.",
+    "TRIP_COMPLETED": "Trip completed for Rider {rider_id} and Driver {driver_id}.",
+}
+
+def _align(offset: int) -> int:
+    return (offset + DATA_ALIGNMENT - 1) // DATA_ALIGNMENT * DATA_ALIGNMENT
+
+class BinaryEventLogger:
+    """
+    A drop-in replacement for CsvLogger that writes fixed-width binary records.
+
+    Each event is a 16-byte RECORD_DTYPE record (tick, rider id, driver id,
+    event type code, platform code); the free-text details are not stored.
+    Records are packed and written in batches on a background thread, and the
+    file can be memory-mapped with `read_event_log` or turned back into the
+    CSV layout with `convert_to_csv`.
+    """
+    def __init__(self, filename: str = "simulation_log.bin", ticks_per_major: Optional[int] = None,
+                 batch_size: int = 16384, max_pending_batches: int = 16, platform_ids: Iterable[str] = ()):
+        """
+        Args:
+            platform_ids: Platforms the run will log events for; each must have a code in PLATFORM_IDS.
+
+        Raises:
+            ValueError: If a platform id has no code.
+        """
+        unknown = [platform_id for platform_id in platform_ids if platform_id not in PLATFORM_CODES]
+        if unknown:
+            raise ValueError(f"Platforms {unknown} are missing from PLATFORM_IDS {PLATFORM_IDS[1:]}; the binary event log cannot store them.")
+        self.filename = filename
+        header = {
+            "format_version": FORMAT_VERSION,
+            "ticks_per_major": ticks_per_major,
+            "event_types": list(EVENT_TYPES),
+            "platform_ids": list(PLATFORM_IDS),
+        }
+        header_bytes = json.dumps(header).encode("utf-8")
+        self.file = open(filename, 'wb')
+        self.file.write(MAGIC)
+        self.file.write(len(header_bytes).to_bytes(4, "little"))
+        self.file.write(header_bytes)
+        self.file.write(b"\0" * (_align(len(MAGIC) + 4 + len(header_bytes)) - self.file.tell()))
+        self._background = BackgroundWriter(self._write_records, batch_size, max_pending_batches, name="event-log-writer")
+
+    def log(self, tick, event_type, rider_id=None, driver_id=None, details="", details_args=(), platform_id=None):
+        try:
+            record = (
+                tick,
+                NO_AGENT if rider_id is None else rider_id,
+                NO_AGENT if driver_id is None else driver_id,
+                EVENT_CODES[event_type],
+                PLATFORM_CODES[platform_id],
+                0,
+            )
+        except KeyError:
+            if event_type not in EVENT_CODES:
+                raise ValueError(f"Event type {event_type!r} is missing from EVENT_TYPES; add it there to log it in binary.") from None
+            raise ValueError(f"Platform {platform_id!r} is missing from PLATFORM_IDS; add it there to log it in binary.") from None
+        self._background.put(record)
+
+    def _write_records(self, records):
+        self.file.write(np.array(records, dtype=RECORD_DTYPE).tobytes())
+
+    def flush(self):
+        """Blocks until every event logged so far is written to the file."""
+        self._background.flush()
+        self.file.flush()
+
+    def close(self):
+        try:
+            self._background.close()
+        finally:
+            self.file.close()
+
+def read_event_log(path: str) -> Tuple[np.ndarray, Dict]:
+    """
+    Memory-maps the records of a binary event log.
+
+    Returns:
+        The read-only RECORD_DTYPE records and the file header.
+
+    Raises:
+        ValueError: If the file is not a binary event log.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a binary event log.")
+        header_length = int.from_bytes(f.read(4), "little")
+        header = json.loads(f.read(header_length).decode("utf-8"))
+    data_offset = _align(len(MAGIC) + 4 + header_length)
+    count = (os.path.getsize(path) - data_offset) // RECORD_DTYPE.itemsize
+    if count <= 0:
+        return np.empty(0, dtype=RECORD_DTYPE), header
+    return np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=data_offset, shape=(count,)), header
+
+def convert_to_csv(binary_path: str, csv_path: str, ticks_per_major: Optional[int] = None) -> int:
+    """
+    Rebuilds the CsvLogger layout (timestamp, event_type, rider_id, driver_id,
+    details) from a binary event log.
+
+    Args:
+        ticks_per_major: Used for the timestamps when the log header has none.
+
+    Returns:
+        The number of rows written.
+    """
+    records, header = read_event_log(binary_path)
+    ticks_per_major = header["ticks_per_major"] or ticks_per_major
+    clock = get_clock(ticks_per_major) if ticks_per_major else None
+    event_types = header["event_types"]
+    # Order ids embed the tick the search started: remember it per rider.
+    order_start = {}
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "event_type", "rider_id", "driver_id", "details"])
+        for start_index in range(0, len(records), CONVERT_CHUNK_RECORDS):
+            # Converting the whole memory map at once would hold every record as a Python tuple.
+            for tick, rider_id, driver_id, event_code, _, _ in records[start_index:start_index + CONVERT_CHUNK_RECORDS].tolist():
+                event_type = event_types[event_code]
+                timestamp = clock.label(tick) if clock is not None else tick
+                if event_type == "ORDER_CREATED":
+                    order_start[rider_id] = tick
+                start = order_start.get(rider_id, tick)
+                order_id = f"order_{rider_id}_{start // ticks_per_major}_{start % ticks_per_major}" if ticks_per_major else None
+                details = DETAILS_TEMPLATES[event_type].format(rider_id=rider_id, driver_id=driver_id, order_id=order_id)
+                writer.writerow([
+                    timestamp, event_type,
+                    "" if rider_id == NO_AGENT else rider_id,
+                    "" if driver_id == NO_AGENT else driver_id,
+                    details,
+                ])
+    return len(records)
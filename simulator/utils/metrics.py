@@ -1,16 +1,53 @@
 # simulator/utils/metrics.py
+import bisect
+from typing import Dict
+from simulator.agents.rider.rider import RiderState
+from simulator.agents.driver.driver import DriverState
 
 class SimulationMetrics:
     def __init__(self):
+        self.rider_states = None
+        self.driver_states = None
         self.online_drivers = set()
         self.active_drivers = set()
         self.searching_riders = set()
         self.riders_with_completed_trips = set()
         self.total_completed_trips = 0
+        # Matched and abandoned orders per platform, for comparing dispatch modes.
+        self.matched_orders = {}
+        self.abandoned_orders = {}
+        # (tick, drivers online) after every driver going online or offline.
+        self.supply_timeline = []
+
+    def attach_state_indexes(self, rider_states, driver_states):
+        """Links the market's state indexes so current counts can be read instantly."""
+        self.rider_states = rider_states
+        self.driver_states = driver_states
+
+    def current_online_drivers(self) -> int:
+        return (
+            self.driver_states.count(DriverState.IDLE)
+            + self.driver_states.count(DriverState.DRIVING_TO_RIDER)
+            + self.driver_states.count(DriverState.ON_TRIP)
+        )
+
+    def current_idle_drivers(self) -> int:
+        return self.driver_states.count(DriverState.IDLE)
+
+    def current_searching_riders(self) -> int:
+        return self.rider_states.count(RiderState.SEARCHING) + self.rider_states.count(RiderState.COMPARING_OFFERS)
 
     def track_driver_online(self, driver_id: int):
         self.online_drivers.add(driver_id)
 
+    def record_supply(self, tick: int, online_drivers: int):
+        self.supply_timeline.append((tick, online_drivers))
+
+    def online_drivers_at(self, tick: int) -> int:
+        """Number of drivers online at a tick, from the supply timeline."""
+        index = bisect.bisect_right(self.supply_timeline, tick, key=lambda change: change[0])
+        return self.supply_timeline[index - 1][1] if index else 0
+
     def track_rider_search(self, rider_id: int):
         self.searching_riders.add(rider_id)
 
@@ -19,11 +56,52 @@ class SimulationMetrics:
         self.active_drivers.add(driver_id)
         self.riders_with_completed_trips.add(rider_id)
 
+    def track_match(self, platform_id: str):
+        self.matched_orders[platform_id] = self.matched_orders.get(platform_id, 0) + 1
+
+    def track_abandoned_order(self, platform_id: str):
+        self.abandoned_orders[platform_id] = self.abandoned_orders.get(platform_id, 0) + 1
+
+    def match_rate(self, platform_id: str) -> float:
+        """Share of a platform's closed orders that ended in a match."""
+        matched = self.matched_orders.get(platform_id, 0)
+        closed = matched + self.abandoned_orders.get(platform_id, 0)
+        return matched / closed if closed else 0.0
+
+    def summary_values(self) -> Dict[str, float]:
+        """
+        The headline metrics of the run as plain numbers, for comparing and
+        aggregating runs. Platform shares are shares of all matched orders.
+        """
+        total_matched = sum(self.matched_orders.values())
+        total_closed = total_matched + sum(self.abandoned_orders.values())
+        values = {
+            "completed_trips": self.total_completed_trips,
+            "unique_active_drivers": len(self.active_drivers),
+            "unique_online_drivers": len(self.online_drivers),
+            "unique_searching_riders": len(self.searching_riders),
+            "match_rate": total_matched / total_closed if total_closed else 0.0,
+        }
+        for platform_id in sorted(set(self.matched_orders) | set(self.abandoned_orders)):
+            values[f"platform_{platform_id}_match_rate"] = self.match_rate(platform_id)
+            values[f"platform_{platform_id}_share"] = (
+                self.matched_orders.get(platform_id, 0) / total_matched if total_matched else 0.0
+            )
+        return values
+
     def print_summary(self):
         print("\n--- Simulation Summary ---")
         print(f"Unique drivers who went online: {len(self.online_drivers)}")
+        if self.supply_timeline:
+            print(f"Peak drivers online: {max(online for _, online in self.supply_timeline)}")
         print(f"Unique active drivers (completed a trip): {len(self.active_drivers)}")
         print(f"Unique riders who searched: {len(self.searching_riders)}")
         print(f"Unique riders who completed a trip: {len(self.riders_with_completed_trips)}")
         print(f"Total completed trips: {self.total_completed_trips}")
+        for platform_id in sorted(set(self.matched_orders) | set(self.abandoned_orders)):
+            print(f"Platform {platform_id} match rate: {self.match_rate(platform_id):.1%} "
+                  f"({self.matched_orders.get(platform_id, 0)} matched, {self.abandoned_orders.get(platform_id, 0)} abandoned)")
+        if self.driver_states is not None:
+            print(f"Drivers online at end of run: {self.current_online_drivers()} ({self.current_idle_drivers()} idle)")
+            print(f"Riders searching at end of run: {self.current_searching_riders()}")
         print("------------------------\n")
@@ -0,0 +1,58 @@
+# simulator/utils/monte_carlo.py
+import math
+from typing import Dict, List
+
+# Two-sided 95% critical values of Student's t distribution, by degrees of freedom.
+_T_CRITICAL_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+_Z_95 = 1.959964
+
+def t_critical_95(degrees_of_freedom: int) -> float:
+    """Two-sided 95% critical value of Student's t distribution."""
+    if degrees_of_freedom < 1:
+        raise ValueError(f"degrees_of_freedom must be at least 1, got {degrees_of_freedom}.")
+    if degrees_of_freedom <= len(_T_CRITICAL_95):
+        return _T_CRITICAL_95[degrees_of_freedom - 1]
+    # Cornish-Fisher expansion around the normal quantile; within 1e-3 beyond 30 degrees of freedom.
+    z, df = _Z_95, degrees_of_freedom
+    return z + (z ** 3 + z) / (4 * df) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+
+def summarize_replicates(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """
+    Aggregates the summary metrics of replicate runs.
+
+    A metric missing from some runs (e.g. a platform that got no orders)
+    counts as 0 in those runs.
+
+    Returns:
+        For each metric: the mean, the sample standard deviation and the
+        bounds of the 95% confidence interval of the mean (equal to the mean
+        with a single run).
+    """
+    names = list(dict.fromkeys(name for run in runs for name in run))
+    summary = {}
+    for name in names:
+        values = [run.get(name, 0.0) for run in runs]
+        n = len(values)
+        mean = sum(values) / n
+        std = math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1)) if n > 1 else 0.0
+        half_width = t_critical_95(n - 1) * std / math.sqrt(n) if n > 1 else 0.0
+        summary[name] = {
+            "mean": mean,
+            "std": std,
+            "ci95_low": mean - half_width,
+            "ci95_high": mean + half_width,
+            "runs": n,
+        }
+    return summary
+
+def print_replicate_summary(summary: Dict[str, Dict[str, float]]):
+    print("\n--- Replicate Summary ---")
+    print(f"{'metric':<28} {'mean':>12} {'95% CI':>27} {'std':>10}")
+    for name, stats in summary.items():
+        ci = f"[{stats['ci95_low']:,.4g}, {stats['ci95_high']:,.4g}]"
+        print(f"{name:<28} {stats['mean']:>12,.4g} {ci:>27} {stats['std']:>10,.3g}")
+    print("------------------------\n")
@@ -0,0 +1,120 @@
+# simulator/utils/output_policy.py
+import logging
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from simulator.utils.time_utils import TickClock
+
+# Output sinks.
+CSV = "csv"
+LOG = "log"
+SINKS = (CSV, LOG)
+
+_MASK_64 = (1 << 64) - 1
+
+def _mix64(value: int) -> int:
+    """SplitMix64 finalizer: a fixed, well-spread hash of a 64-bit integer."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+class OutputPolicy:
+    """
+    Decides which events are written to each output sink.
+
+    Two filters apply, both checked before anything is formatted:
+
+    - Trace sampling: only events about a sampled subset of agents are
+      written. An agent is sampled based on a fixed hash of its id, so the
+      same riders and drivers are fully traced in every run and in every sink.
+      Events that involve no agent (e.g. batch summaries) are always kept.
+    - Event-type filters: each sink keeps or drops event types (e.g. CSV rows
+      but no DRIVER_PROPOSED lines in simulation.log).
+
+    Events that are filtered out are counted per sink and event type instead.
+    """
+    def __init__(self, trace_sample_rate: float = 1.0, trace_salt: int = 0,
+                 drop_events: Optional[Dict[str, Iterable[str]]] = None,
+                 keep_events: Optional[Dict[str, Optional[Iterable[str]]]] = None,
+                 clock: Optional[TickClock] = None):
+        """
+        Initializes the OutputPolicy.
+
+        Args:
+            trace_sample_rate: Share of agent ids whose events are written.
+            trace_salt: Changes which agents are sampled.
+            drop_events: Event types never written, by sink.
+            keep_events: If given for a sink, only these event types are written to it.
+            clock: Formats the tick of logged messages (the raw tick is logged without one).
+        """
+        if not 0.0 <= trace_sample_rate <= 1.0:
+            raise ValueError(f"output.trace_sample_rate must be between 0 and 1, got {trace_sample_rate}.")
+        self.trace_sample_rate = trace_sample_rate
+        self.trace_salt = trace_salt
+        self.clock = clock
+        self._trace_threshold = int(trace_sample_rate * (1 << 64))
+        self._samples_all = trace_sample_rate >= 1.0
+        drop_events = drop_events or {}
+        keep_events = keep_events or {}
+        for sink in set(drop_events) | set(keep_events):
+            if sink not in SINKS:
+                raise ValueError(f"Unknown output sink '{sink}', expected one of {SINKS}.")
+        self._dropped_types = {sink: frozenset(drop_events.get(sink) or ()) for sink in SINKS}
+        self._kept_types = {
+            sink: frozenset(keep_events[sink]) if keep_events.get(sink) is not None else None
+            for sink in SINKS
+        }
+        # Events filtered out, by (sink, event type).
+        self.dropped: Counter = Counter()
+
+    @classmethod
+    def from_config(cls, output_config: Optional[Dict], clock: Optional[TickClock] = None) -> "OutputPolicy":
+        """Builds the policy from the `output` config section (everything is written without one)."""
+        output_config = output_config or {}
+        return cls(
+            trace_sample_rate=output_config.get('trace_sample_rate', 1.0),
+            trace_salt=output_config.get('trace_salt', 0),
+            drop_events={sink: output_config.get(f'{sink}_drop_events') for sink in SINKS},
+            keep_events={sink: output_config.get(f'{sink}_keep_events') for sink in SINKS},
+            clock=clock,
+        )
+
+    def is_traced(self, agent_id: int) -> bool:
+        """Returns True if the agent's events are written."""
+        return self._samples_all or _mix64(agent_id + (self.trace_salt << 32)) < self._trace_threshold
+
+    def allows(self, sink: str, event_type: str, rider_id: Optional[int] = None, driver_id: Optional[int] = None) -> bool:
+        """
+        Returns True if an event should be written to a sink, and counts it as
+        dropped otherwise. The event is traced if any agent it involves is.
+        """
+        kept_types = self._kept_types[sink]
+        allowed = event_type not in self._dropped_types[sink] and (kept_types is None or event_type in kept_types)
+        if allowed and not self._samples_all and (rider_id is not None or driver_id is not None):
+            allowed = (
+                (rider_id is not None and self.is_traced(rider_id))
+                or (driver_id is not None and self.is_traced(driver_id))
+            )
+        if not allowed:
+            self.dropped[sink, event_type] += 1
+        return allowed
+
+    def log(self, level: int, event_type: str, tick: int, rider_id: Optional[int], driver_id: Optional[int], msg: str, *args):
+        """
+        Writes a lazily formatted message to simulation.log if the policy allows it.
+
+        The first `%s` of `msg` receives the time label of `tick`.
+        """
+        if self.allows(LOG, event_type, rider_id, driver_id):
+            logging.log(level, msg, self.clock.label(tick) if self.clock is not None else tick, *args)
+
+    def print_summary(self):
+        if not self.dropped:
+            return
+        print("--- Events not written ---")
+        for (sink, event_type), count in sorted(self.dropped.items()):
+            print(f"{sink:>4} | {event_type:<18} {count}")
+        print("------------------------\n")
+
+    def __repr__(self) -> str:
+        return f"OutputPolicy(trace_sample_rate={self.trace_sample_rate}, dropped={sum(self.dropped.values())})"
@@ -1,10 +1,42 @@
 # in simulator/utils/time_utils.py
-def ticks_to_time_string(day: int, tick: int, ticks_per_major: int, minor_tick_secs: int = 10) -> str:
-    """Converts simulation ticks to a formatted time string."""
-    total_seconds = (tick * minor_tick_secs) + ((day * 24 * 3600) / (3600 / (ticks_per_major / 360)))
+from functools import lru_cache
+
+SECONDS_PER_DAY = 24 * 3600
+
+class TickClock:
+    """
+    Turns absolute integer ticks into "Day d, HH:MM:SS" labels.
+
+    A major tick is one day, so a minor tick lasts 86400 / ticks_per_major
+    seconds. The clock part of every tick in a day is precomputed once, so a
+    label costs a table lookup; labels are only made when something is
+    written, never in the simulation core.
+    """
+    def __init__(self, ticks_per_major: int):
+        self.ticks_per_major = ticks_per_major
+        self.seconds_per_tick = SECONDS_PER_DAY / ticks_per_major
+        self._clock_labels = []
+        for tick in range(ticks_per_major):
+            seconds = tick * SECONDS_PER_DAY // ticks_per_major
+            self._clock_labels.append(f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}")
 
-    hours = int((total_seconds % 86400) / 3600)
-    minutes = int((total_seconds % 3600) / 60)
-    seconds = int(total_seconds % 60)
+    def label(self, tick: int) -> str:
+        """Returns the label of an absolute tick."""
+        day, tick_in_day = divmod(tick, self.ticks_per_major)
+        return f"Day {day}, {self._clock_labels[tick_in_day]}"
 
-    return f"Day {day}, {hours:02d}:{minutes:02d}:{seconds:02d}"
+    def minutes_to_ticks(self, minutes: float) -> int:
+        """Converts a duration in minutes to a whole number of minor ticks (at least one)."""
+        return max(1, round(minutes * 60 / self.seconds_per_tick))
+
+    def __repr__(self) -> str:
+        return f"TickClock(ticks_per_major={self.ticks_per_major})"
+
+@lru_cache(maxsize=None)
+def get_clock(ticks_per_major: int) -> TickClock:
+    """Returns the shared TickClock for a number of ticks per day."""
+    return TickClock(ticks_per_major)
+
+def ticks_to_time_string(day: int, tick: int, ticks_per_major: int) -> str:
+    """Converts simulation ticks to a formatted time string."""
+    return get_clock(ticks_per_major).label(day * ticks_per_major + tick)
@@ -1,6 +1,7 @@
 import pytest
+import numpy as np
 from simulator.agents.driver.driver import DriverAgent
-from simulator.agents.driver.logic import calculate_profitability_score
+from simulator.agents.driver.logic import calculate_profitability_score, calculate_profitability_scores, driver_sensitivities
 
 @pytest.fixture
 def driver_agent():
@@ -25,3 +26,22 @@ def test_profitability_rejects_long_eta(driver_agent):
     score_high_eta = calculate_profitability_score(driver_agent, fare=25, eta_to_rider=15)
     score_low_eta = calculate_profitability_score(driver_agent, fare=25, eta_to_rider=5)
     assert score_low_eta > score_high_eta
+
+def test_vectorized_profitability_matches_scalar():
+    """The array version returns exactly the scalar scores, for scalar and per-driver offers."""
+    # 1. Arrange
+    rng = np.random.default_rng(7)
+    drivers = [
+        DriverAgent(i, (0, 0), False, 0.0, price_sensitivity, eta_sensitivity)
+        for i, (price_sensitivity, eta_sensitivity) in enumerate(rng.normal(0.5, 0.3, size=(50, 2)))
+    ]
+    etas = rng.integers(0, 30, size=len(drivers))
+
+    # 2. Act
+    price_sensitivity, eta_sensitivity = driver_sensitivities(drivers)
+    one_offer = calculate_profitability_scores(price_sensitivity, eta_sensitivity, 23.5, 7)
+    per_driver_eta = calculate_profitability_scores(price_sensitivity, eta_sensitivity, 23.5, etas)
+
+    # 3. Assert
+    assert one_offer.tolist() == [calculate_profitability_score(d, 23.5, 7) for d in drivers]
+    assert per_driver_eta.tolist() == [calculate_profitability_score(d, 23.5, int(eta)) for d, eta in zip(drivers, etas)]
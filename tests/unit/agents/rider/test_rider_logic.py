@@ -1,6 +1,7 @@
 import pytest
+import numpy as np
 from simulator.agents.rider.rider import RiderAgent
-from simulator.agents.rider.logic import calculate_utility
+from simulator.agents.rider.logic import calculate_utility, calculate_utilities, rider_sensitivities
 
 @pytest.fixture
 def rider_agent():
@@ -34,3 +35,29 @@ def test_utility_respects_preference(rider_agent):
     rider_agent.preference_score = -0.2 # Change preference to B
     utility_without_pref = calculate_utility(rider_agent, price=15, eta=5, preference_score_weight=0.5)
     assert utility_with_pref > utility_without_pref
+
+def test_vectorized_utility_matches_scalar():
+    """The array version returns exactly the scalar utilities for many riders and many offers."""
+    # 1. Arrange
+    rng = np.random.default_rng(11)
+    riders = [
+        RiderAgent(i, (0, 0), True, True, preference_score, price_sensitivity, time_sensitivity, 3)
+        for i, (preference_score, price_sensitivity, time_sensitivity) in enumerate(rng.normal(0.3, 0.3, size=(40, 3)))
+    ]
+    prices = np.array([15.0, 20.0, 27.25])
+    etas = np.array([3, 8, 12])
+
+    # 2. Act
+    price_sensitivity, time_sensitivity, preference_score = rider_sensitivities(riders)
+    utilities = calculate_utilities(
+        price_sensitivity[:, None], time_sensitivity[:, None], preference_score[:, None],
+        prices[None, :], etas[None, :], 0.5
+    )
+
+    # 3. Assert
+    expected = [
+        [calculate_utility(rider, price, int(eta), 0.5) for price, eta in zip(prices.tolist(), etas)]
+        for rider in riders
+    ]
+    assert utilities.shape == (len(riders), len(prices))
+    assert utilities.tolist() == expected
@@ -39,3 +39,14 @@ def test_driver_initialization():
     # Test the __repr__ for consistent debugging output.
     expected_repr = "DriverAgent(id=201, state='OFFLINE', pref_score=-0.50)"
     assert repr(driver) == expected_repr
+
+def test_driver_is_slotted():
+    """Drivers have no per-instance __dict__, so unknown attributes cannot be set."""
+    driver = DriverAgent(agent_id=3, initial_location=(0, 0), is_exclusive=True,
+                         preference_score=0.3, price_sensitivity=0.5, eta_sensitivity=0.5)
+
+    assert not hasattr(driver, "__dict__")
+    with pytest.raises(AttributeError):
+        driver.unknown_attribute = 1
+    driver.current_state = DriverState.IDLE
+    assert repr(driver) == "DriverAgent(id=3, state='IDLE', pref_score=0.30)"
@@ -1,7 +1,7 @@
 # tests/unit/agents/test_rider.py
 
 import pytest
-from simulator.agents.rider.rider import RiderAgent, RiderState
+from simulator.agents.rider.rider import RiderAgent, RiderState, DEFAULT_PATIENCE_TICKS
 
 def test_rider_initialization():
     """
@@ -50,4 +50,49 @@ def test_rider_initialization():
 
     # It's also good practice to test the __repr__ for consistent debugging output.
     expected_repr = "RiderAgent(id=101, state='IDLE', pref_score=0.80)"
-    assert repr(rider) == expected_repr
\ No newline at end of file
+    assert repr(rider) == expected_repr
+
+@pytest.fixture
+def rider():
+    """Provides a rider with default patience."""
+    return RiderAgent(
+        agent_id=7, initial_location=(1, 2), has_app_a=True, has_app_b=True,
+        preference_score=-0.25, price_sensitivity=0.5, time_sensitivity=0.5, rides_per_week=1.0
+    )
+
+def test_rider_is_slotted(rider):
+    """Riders have no per-instance __dict__, so unknown attributes cannot be set."""
+    assert not hasattr(rider, "__dict__")
+    assert rider.patience_ticks == DEFAULT_PATIENCE_TICKS
+    with pytest.raises(AttributeError):
+        rider.unknown_attribute = 1
+
+def test_incentive_containers_are_allocated_on_first_access(rider):
+    """
+    The discount list and test dict stay unallocated until first read, then
+    the same container is returned on every access.
+    """
+    # 1. Arrange: A fresh rider carries no containers.
+    assert rider._active_discounts is None
+    assert rider._enrolled_tests is None
+
+    # 2. Act: Read each property and mutate the returned container.
+    rider.active_discounts.append({"platform": "A", "amount": 0.2})
+    rider.enrolled_tests["test_1"] = "treatment"
+
+    # 3. Assert: The mutations persist on the rider.
+    assert rider.active_discounts is rider._active_discounts
+    assert rider.active_discounts == [{"platform": "A", "amount": 0.2}]
+    assert rider.enrolled_tests is rider._enrolled_tests
+    assert rider.enrolled_tests == {"test_1": "treatment"}
+
+def test_incentive_containers_can_be_assigned(rider):
+    rider.active_discounts = [{"platform": "B", "amount": 0.1}]
+    rider.enrolled_tests = {"test_2": "control"}
+
+    assert rider._active_discounts == [{"platform": "B", "amount": 0.1}]
+    assert rider.enrolled_tests == {"test_2": "control"}
+
+def test_rider_repr_follows_state(rider):
+    rider.current_state = RiderState.SEARCHING
+    assert repr(rider) == "RiderAgent(id=7, state='SEARCHING', pref_score=-0.25)"
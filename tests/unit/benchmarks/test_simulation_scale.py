@@ -0,0 +1,99 @@
+import pytest
+from benchmarks.simulation_scale import aggregate_repeats, find_regressions, select_runs
+
+def make_record(run_id, revision="abc123", riders=1000, **metrics):
+    """Provides a history record with neutral metrics, overridden by `metrics`."""
+    record = {
+        "run_id": run_id, "revision": revision, "riders": riders, "days": 1,
+        "startup_seconds": 1.0, "ticks_per_second": 1000.0, "events_per_second": 5000.0,
+        "matcher_calls_per_second": 100.0, "peak_rss_mb": 50.0, "calibration_ops_per_second": 1e6,
+        "relative_ticks_per_second": 1000.0, "relative_events_per_second": 5000.0,
+        "relative_matcher_calls_per_second": 100.0,
+    }
+    record.update(metrics)
+    return record
+
+def test_aggregate_repeats_keeps_median_and_range():
+    """Repeats collapse to the median with the min-max range alongside."""
+    results = [make_record("r", relative_ticks_per_second=v) for v in (900.0, 1200.0, 1000.0)]
+
+    record = aggregate_repeats(results)
+
+    assert record["repeats"] == 3
+    assert record["relative_ticks_per_second"] == 1000.0
+    assert record["ranges"]["relative_ticks_per_second"] == [900.0, 1200.0]
+
+def test_change_within_the_measured_noise_is_not_a_regression():
+    """A median drop beyond the threshold is ignored while the repeat ranges overlap."""
+    # 1. Arrange
+    baseline = [make_record("1", relative_ticks_per_second=1000.0, ranges={"relative_ticks_per_second": [600.0, 1100.0]})]
+    latest = [make_record("2", relative_ticks_per_second=700.0, ranges={"relative_ticks_per_second": [650.0, 1050.0]})]
+
+    # 2. Act / 3. Assert
+    assert find_regressions(latest, baseline, threshold=0.1) == []
+
+def test_change_beyond_threshold_and_noise_is_flagged():
+    """Disjoint ranges and a large enough median change flag the metric, in the right direction."""
+    # 1. Arrange
+    baseline = [make_record("1", ranges={"relative_ticks_per_second": [950.0, 1050.0], "peak_rss_mb": [49.0, 51.0]})]
+    latest = [make_record(
+        "2", relative_ticks_per_second=700.0, peak_rss_mb=40.0,
+        ranges={"relative_ticks_per_second": [680.0, 720.0], "peak_rss_mb": [39.0, 41.0]},
+    )]
+
+    # 2. Act
+    regressions = find_regressions(latest, baseline, threshold=0.1)
+
+    # 3. Assert
+    # Lower memory is an improvement, not a regression.
+    assert len(regressions) == 1
+    assert "relative_ticks_per_second" in regressions[0]
+
+def test_small_change_is_not_flagged_even_without_overlap():
+    """Changes within the threshold pass even when the repeat ranges are disjoint."""
+    baseline = [make_record("1", ranges={"relative_events_per_second": [4990.0, 5010.0]})]
+    latest = [make_record("2", relative_events_per_second=4800.0, ranges={"relative_events_per_second": [4790.0, 4810.0]})]
+
+    assert find_regressions(latest, baseline, threshold=0.1) == []
+
+def test_changes_below_the_noise_floor_are_not_flagged():
+    """A few milliseconds on a very short startup are measurement resolution."""
+    baseline = [make_record("1", startup_seconds=0.030)]
+    latest = [make_record("2", startup_seconds=0.034)]
+
+    assert find_regressions(latest, baseline, threshold=0.1) == []
+
+def test_sizes_missing_from_the_baseline_are_skipped():
+    """Only sizes present in both runs are compared."""
+    latest = [make_record("2", riders=5000, relative_ticks_per_second=1.0)]
+    assert find_regressions(latest, [make_record("1")], threshold=0.1) == []
+
+def test_select_runs_defaults_to_the_previous_run():
+    """Records are grouped by run id; the latest run is compared with the one before it."""
+    history = [
+        make_record("1", revision="aaa"), make_record("1", revision="aaa", riders=2000),
+        make_record("2", revision="bbb"),
+        make_record("3", revision="ccc"), make_record("3", revision="ccc", riders=2000),
+    ]
+
+    latest, baseline = select_runs(history, None)
+
+    assert [r["riders"] for r in latest] == [1000, 2000]
+    assert {r["run_id"] for r in latest} == {"3"}
+    assert {r["run_id"] for r in baseline} == {"2"}
+
+def test_select_runs_by_baseline_revision():
+    """--baseline picks the latest earlier run of that revision, if any."""
+    history = [make_record("1", revision="aaa"), make_record("2", revision="bbb"), make_record("3", revision="ccc")]
+
+    _, baseline = select_runs(history, "aaa")
+    assert {r["run_id"] for r in baseline} == {"1"}
+
+    _, baseline = select_runs(history, "zzz")
+    assert baseline == []
+
+@pytest.mark.parametrize("history", [[], [make_record("1")]])
+def test_select_runs_without_a_baseline(history):
+    """An empty history or a single run has nothing to compare with."""
+    _, baseline = select_runs(history, None)
+    assert baseline == []
@@ -0,0 +1,90 @@
+import random
+from typing import Dict, List, NamedTuple, Optional
+import pytest
+from unittest.mock import Mock
+from simulator.market.market import Market
+from simulator.platform.matcher import Matcher
+from simulator.platform.platform import Platform
+from simulator.core.engine import Engine
+
+class MarketRun(NamedTuple):
+    """A Market wired to platforms A and B and an Engine."""
+    market: Market
+    engine: Engine
+    platforms: List[Platform]
+    csv_logger: Mock
+    # Types of the events scheduled on the engine, in order, initial events included.
+    scheduled: List
+
+@pytest.fixture
+def market_config():
+    """
+    Provides a small two-platform market on 1-minute ticks. Test modules
+    override only the settings they exercise.
+    """
+    return {
+        'simulation': {'ticks_per_major': 1440},
+        'market': {
+            'grid_resolution': 3333,
+            'initial_riders': 300,
+            'initial_drivers': 60,
+            'rider_population': {
+                'price_sensitivity_dist': [0.5, 0.2],
+                'time_sensitivity_dist': [0.5, 0.2],
+                'preference_score_dist': [0.0, 0.3],
+                'rides_per_week_dist': [20, 5],
+                'patience_ticks_dist': [18, 6],
+                'pct_with_app_a_only': 0.2,
+                'pct_with_app_b_only': 0.2
+            },
+            'driver_population': {
+                'price_sensitivity_dist': [0.7, 0.1],
+                'eta_sensitivity_dist': [0.3, 0.1],
+                'preference_score_dist': [0.0, 0.2],
+                'pct_exclusive': 0.15
+            }
+        }
+    }
+
+def _build_market(config: Dict, seed: int, matcher_options: Optional[Dict] = None, **market_overrides) -> MarketRun:
+    random.seed(seed)
+    config = dict(config, market=dict(config['market'], **market_overrides))
+    ticks_per_major = config['simulation']['ticks_per_major']
+    csv_logger = Mock()
+    market = Market(config, csv_logger)
+    platforms = [
+        Platform(platform_id, Matcher(market.grid, 3, ticks_per_major, **(matcher_options or {})))
+        for platform_id in ('A', 'B')
+    ]
+    market.set_platforms(platforms)
+    engine = Engine(market, platforms)
+    scheduled = []
+    schedule_event = engine.schedule_event
+    engine.schedule_event = lambda tick, event: scheduled.append(event[0]) or schedule_event(tick, event)
+    market.set_engine(engine)
+    return MarketRun(market, engine, platforms, csv_logger, scheduled)
+
+def _run_market(config: Dict, seed: int, duration_days: int = 1, skip_idle_ticks: bool = False,
+                matcher_options: Optional[Dict] = None, **market_overrides) -> MarketRun:
+    run = _build_market(config, seed, matcher_options, **market_overrides)
+    run.engine.run(duration_days=duration_days, ticks_per_major=config['simulation']['ticks_per_major'],
+                   skip_idle_ticks=skip_idle_ticks)
+    return run
+
+@pytest.fixture
+def build_market():
+    """
+    Provides `build_market(config, seed, matcher_options=None, **market_overrides)`:
+    seeds `random`, builds the Market with a mock CSV logger, platforms A and B
+    and an Engine, and returns the MarketRun without running it.
+    """
+    return _build_market
+
+@pytest.fixture
+def run_market():
+    """
+    Provides `run_market(config, seed, duration_days=1, skip_idle_ticks=False,
+    matcher_options=None, **market_overrides)`: builds the market like
+    `build_market` and runs it.
+    """
+    return _run_market
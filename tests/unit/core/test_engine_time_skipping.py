@@ -0,0 +1,55 @@
+import pytest
+from unittest.mock import Mock
+from simulator.core.engine import Engine
+
+def make_idle_market():
+    """Provides a mock market whose phases never report pending work."""
+    market = Mock()
+    market.process_rider_searches.return_value = False
+    market.process_matcher_offers.return_value = False
+    market.process_driver_responses.return_value = False
+    market.update_agent_locations.return_value = False
+    return market
+
+def test_skip_mode_jumps_to_scheduled_events_and_major_ticks():
+    """With nothing pending, the engine only visits event ticks and major ticks."""
+    # 1. Arrange
+    market = make_idle_market()
+    engine = Engine(market=market, platforms=[])
+    engine.schedule_event(7, "wake_up")
+    engine.schedule_event(25, "next_day_event")
+
+    # 2. Act
+    engine.run(duration_days=3, ticks_per_major=10, skip_idle_ticks=True)
+
+    # 3. Assert
+    visited = [c.args[1] for c in market.process_rider_searches.call_args_list]
+    assert visited == [0, 7, 0, 0, 5]
+    days = [c.args[0] for c in market.process_rider_searches.call_args_list]
+    assert days == [0, 0, 1, 2, 2]
+    assert [c.args for c in market.handle_event.call_args_list] == [("wake_up", 7), ("next_day_event", 25)]
+    assert engine.ticks_processed == 5
+    assert engine.ticks_skipped == 25
+
+def test_skip_mode_steps_every_tick_while_work_is_pending():
+    """A phase reporting pending work keeps the engine on a tick-by-tick clock."""
+    market = make_idle_market()
+    # Searches are in progress on ticks 2, 3 and 4 only.
+    market.process_rider_searches.side_effect = lambda day, tick: 2 <= tick <= 4
+    engine = Engine(market=market, platforms=[])
+    engine.schedule_event(2, "start_search")
+
+    engine.run(duration_days=1, ticks_per_major=10, skip_idle_ticks=True)
+
+    visited = [c.args[1] for c in market.process_rider_searches.call_args_list]
+    assert visited == [0, 2, 3, 4, 5]
+
+def test_default_mode_visits_every_tick():
+    """Without skipping, every tick is processed even if the market is idle."""
+    market = make_idle_market()
+    engine = Engine(market=market, platforms=[])
+
+    engine.run(duration_days=1, ticks_per_major=6)
+
+    assert market.process_rider_searches.call_count == 6
+    assert engine.ticks_skipped == 0
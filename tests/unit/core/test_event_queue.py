@@ -0,0 +1,95 @@
+from unittest.mock import Mock
+from simulator.core.event_queue import EventQueue
+from simulator.core.engine import Engine
+
+def test_events_pop_in_tick_then_insertion_order():
+    """Events come out ordered by tick, and by scheduling order within a tick."""
+    # 1. Arrange
+    queue = EventQueue()
+    queue.push(5, "late")
+    queue.push(2, "first_at_2")
+    queue.push(2, "second_at_2")
+    queue.push(0, "earliest")
+
+    # 2. Act
+    popped = list(queue.pop_due(5))
+
+    # 3. Assert
+    assert popped == ["earliest", "first_at_2", "second_at_2", "late"]
+    assert len(queue) == 0
+
+def test_pop_due_leaves_future_events_and_drops_consumed_ones():
+    """Only due events are returned, and they are released from the queue."""
+    queue = EventQueue()
+    queue.push(1, "a")
+    queue.push(3, "b")
+
+    assert list(queue.pop_due(1)) == ["a"]
+    assert len(queue) == 1
+    assert queue.peek_tick() == 3
+    assert list(queue.pop_due(2)) == []
+
+def test_events_scheduled_for_current_tick_while_popping_are_returned():
+    """An event pushed for the tick being drained is handled in the same tick."""
+    queue = EventQueue()
+    queue.push(4, "original")
+
+    popped = []
+    for event in queue.pop_due(4):
+        popped.append(event)
+        if event == "original":
+            queue.push(4, "follow_up")
+
+    assert popped == ["original", "follow_up"]
+
+def test_cancelled_events_are_never_returned():
+    """Cancelling an event removes it from the pending count and the output."""
+    queue = EventQueue()
+    handle = queue.push(1, "cancel_me")
+    queue.push(1, "keep_me")
+
+    assert queue.cancel(handle) is True
+    assert queue.cancel(handle) is False
+    assert len(queue) == 1
+    assert list(queue.pop_due(1)) == ["keep_me"]
+    assert queue.stats()["cancelled_entries"] == 0
+
+def test_stats_report_depth_and_memory():
+    """The queue reports its depth and a positive memory estimate."""
+    queue = EventQueue()
+    for tick in range(10):
+        queue.push(tick, {"action": "NOOP", "agent_id": tick})
+
+    stats = queue.stats()
+
+    assert stats["pending_events"] == 10
+    assert stats["memory_bytes"] > 0
+    assert queue.peek_tick() == 0
+
+def test_engine_releases_consumed_events():
+    """The engine hands due events to the market and frees them afterwards."""
+    market = Mock()
+    engine = Engine(market=market, platforms=[])
+    engine.schedule_event(0, "e0")
+    cancelled = engine.schedule_event(1, "e1")
+    engine.schedule_event(2, "e2")
+    engine.cancel_event(cancelled)
+
+    engine.run(duration_days=1, ticks_per_major=2)
+
+    handled = [c.args for c in market.handle_event.call_args_list]
+    assert handled == [("e0", 0)]
+    assert engine.get_queue_stats()["pending_events"] == 1
+
+def test_cancelled_slot_reuse_keeps_the_new_event():
+    """A slot freed by a cancellation can be reused without reviving the cancelled event."""
+    queue = EventQueue()
+    handle = queue.push(3, "cancelled")
+    queue.cancel(handle)
+    reused = queue.push(5, "reuses_the_slot")
+
+    assert queue.cancel(handle) is False
+    assert queue.peek_tick() == 5
+    assert list(queue.pop_due(5)) == ["reuses_the_slot"]
+    assert queue.cancel(reused) is False
+    assert len(queue) == 0
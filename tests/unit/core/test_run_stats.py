@@ -0,0 +1,78 @@
+import io
+import json
+import pytest
+from unittest.mock import Mock
+from simulator.core.engine import Engine
+from simulator.core.run_stats import PHASES, RunStats
+
+def make_idle_market():
+    """Provides a mock market whose phases never report pending work."""
+    market = Mock()
+    market.process_rider_searches.return_value = False
+    market.process_matcher_offers.return_value = False
+    market.process_driver_responses.return_value = False
+    market.update_agent_locations.return_value = False
+    return market
+
+def test_run_stats_collects_phase_times_event_counts_and_days(tmp_path):
+    """A run reports every phase, per-type event counts and one entry per simulated day."""
+    # 1. Arrange
+    engine = Engine(market=make_idle_market(), platforms=[])
+    engine.schedule_event(3, ("WAKE_UP", 1, 0))
+    engine.schedule_event(3, ("WAKE_UP", 2, 0))
+    engine.schedule_event(12, ("SLEEP", 1, 0))
+    progress = io.StringIO()
+    stats = RunStats(progress_stream=progress)
+
+    # 2. Act
+    returned = engine.run(duration_days=2, ticks_per_major=10, stats=stats)
+    stats.write_report(str(tmp_path / "report.json"))
+
+    # 3. Assert
+    assert returned is stats and engine.stats is stats
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["ticks_processed"] == 20
+    assert report["events_handled"] == 3
+    assert report["event_counts"] == {"WAKE_UP": 2, "SLEEP": 1}
+    assert set(report["phase_seconds"]) == set(PHASES)
+    assert [(d["day"], d["ticks_processed"], d["events_handled"]) for d in report["days"]] == [(0, 10, 2), (1, 10, 1)]
+    assert "profile" not in report
+    lines = progress.getvalue().splitlines()
+    assert lines[0].startswith("Day 0 complete (1/2)")
+    assert lines[1].startswith("Day 1 complete (2/2)")
+
+def test_non_tuple_events_are_counted_by_type():
+    """Events of any shape, including unhashable ones, are counted without breaking the run."""
+    # 1. Arrange
+    market = make_idle_market()
+    engine = Engine(market=market, platforms=[])
+    engine.schedule_event(1, {"action": "WAKE_UP", "agent_id": 1})
+    engine.schedule_event(2, "wake_up")
+
+    # 2. Act
+    stats = engine.run(duration_days=1, ticks_per_major=5, stats=RunStats(progress=False))
+
+    # 3. Assert
+    assert market.handle_event.call_count == 2
+    assert stats.report()["event_counts"] == {"dict": 1, "str": 1}
+
+def test_run_stats_profiles_only_the_chosen_days(tmp_path):
+    """cProfile runs over the requested day range and its stats are dumped and summarized."""
+    # 1. Arrange
+    market = make_idle_market()
+    profile_file = tmp_path / "run.prof"
+    stats = RunStats(progress=False, profile_days=[1, 1], profile_file=str(profile_file))
+
+    # 2. Act
+    Engine(market=market, platforms=[]).run(duration_days=3, ticks_per_major=4, stats=stats)
+    report = stats.report()
+
+    # 3. Assert
+    assert profile_file.exists()
+    assert report["profile"]["days"] == [1, 1]
+    assert report["profile"]["top_functions"]
+
+def test_run_stats_rejects_an_invalid_profile_range():
+    """The profiled range must be [first, last] with first <= last."""
+    with pytest.raises(ValueError):
+        RunStats(profile_days=[2, 1])
@@ -0,0 +1,67 @@
+import random
+import pytest
+from simulator.market.demand import PoissonDemand
+from simulator.core.events import EventType
+
+TICKS_PER_DAY = 8640
+
+@pytest.fixture
+def config(market_config):
+    """Provides a small market on 10-second ticks."""
+    market_config['simulation']['ticks_per_major'] = TICKS_PER_DAY
+    market_config['market']['rider_population']['rides_per_week_dist'] = [14, 3]
+    return market_config
+
+def sample_arrivals(demand, rides_per_week, weeks):
+    """Returns the ticks of all searches of one rider over a number of weeks."""
+    arrivals, tick = [], 0
+    while True:
+        tick = demand.next_search_tick(rides_per_week, tick)
+        if tick >= weeks * demand.ticks_per_week:
+            return arrivals
+        arrivals.append(tick)
+
+def test_poisson_demand_matches_weekly_rate():
+    """Arrivals average `rides_per_week` per week."""
+    random.seed(1)
+    demand = PoissonDemand(TICKS_PER_DAY)
+
+    arrivals = sample_arrivals(demand, rides_per_week=10, weeks=100)
+
+    assert len(arrivals) == pytest.approx(1000, rel=0.1)
+    assert demand.next_search_tick(0, 0) is None
+
+def test_hourly_profile_shifts_demand_but_keeps_the_total():
+    """Hours with zero weight get no searches; the weekly total is unchanged."""
+    # 1. Arrange
+    random.seed(2)
+    profile = [0] * 6 + [1] * 12 + [3] * 6  # Quiet nights, busy evenings
+    demand = PoissonDemand(TICKS_PER_DAY, profile)
+
+    # 2. Act
+    arrivals = sample_arrivals(demand, rides_per_week=10, weeks=100)
+    hours = [int((tick % TICKS_PER_DAY) * 24 / TICKS_PER_DAY) for tick in arrivals]
+
+    # 3. Assert
+    assert len(arrivals) == pytest.approx(1000, rel=0.1)
+    assert not any(hour < 6 for hour in hours)
+    assert sum(hour >= 18 for hour in hours) > sum(6 <= hour < 12 for hour in hours)
+
+def test_invalid_profile_is_rejected():
+    with pytest.raises(ValueError, match="24"):
+        PoissonDemand(TICKS_PER_DAY, [1, 2, 3])
+
+def count_rider_activity(run_market, config, demand_model):
+    """Runs one day and returns the number of scheduled rider events and of searches started."""
+    run = run_market(config, seed=5, skip_idle_ticks=True, demand_model=demand_model)
+    searches = sum(1 for call in run.csv_logger.log.call_args_list if call.args[1] == "ORDER_CREATED")
+    rider_events = sum(1 for action in run.scheduled if action in (EventType.EVALUATE_RIDER_SEARCH_INTENT, EventType.RIDER_SEARCH))
+    return rider_events, searches
+
+def test_poisson_demand_keeps_searches_with_far_fewer_events(config, run_market):
+    """The Poisson generator starts about as many searches as polling, from a fraction of the events."""
+    polling_events, polling_searches = count_rider_activity(run_market, config, 'polling')
+    poisson_events, poisson_searches = count_rider_activity(run_market, config, 'poisson')
+
+    assert poisson_searches == pytest.approx(polling_searches, rel=0.15)
+    assert poisson_events * 10 < polling_events
@@ -0,0 +1,93 @@
+import random
+import pytest
+import numpy as np
+from unittest.mock import Mock
+from simulator.market.market import Market
+from simulator.market.population import generate_riders, generate_drivers, riders_from_rows, drivers_from_rows
+
+@pytest.fixture
+def config(market_config):
+    """Provides a market config with a sizeable population."""
+    market_config['simulation']['ticks_per_major'] = 10
+    market_config['market'].update(grid_resolution=1000, initial_riders=20000, initial_drivers=4000)
+    market_config['market']['rider_population'].update(rides_per_week_dist=[3.0, 1.5], pct_with_app_b_only=0.3)
+    return market_config
+
+def test_rider_distributions_and_app_split(config):
+    """Batched rider draws follow the configured distributions and app split."""
+    rows = generate_riders(config['market']['rider_population'], 20000, np.random.default_rng(1))
+
+    a_only = rows["has_app_a"] & ~rows["has_app_b"]
+    b_only = ~rows["has_app_a"] & rows["has_app_b"]
+    assert (rows["has_app_a"] | rows["has_app_b"]).all()
+    assert a_only.mean() == pytest.approx(0.2, abs=0.02)
+    assert b_only.mean() == pytest.approx(0.3, abs=0.02)
+    assert rows["price_sensitivity"].mean() == pytest.approx(0.5, abs=0.01)
+    assert rows["price_sensitivity"].std() == pytest.approx(0.2, abs=0.01)
+    assert rows["rides_per_week"].min() >= 0
+    assert rows["patience_ticks"].min() >= 1
+    assert 0 <= rows["x"].min() and rows["x"].max() <= 10000
+
+def test_driver_distributions(config):
+    """Batched driver draws follow the configured distributions."""
+    rows = generate_drivers(config['market']['driver_population'], 20000, np.random.default_rng(2))
+
+    assert rows["is_exclusive"].mean() == pytest.approx(0.15, abs=0.02)
+    assert rows["eta_sensitivity"].mean() == pytest.approx(0.3, abs=0.01)
+
+@pytest.mark.parametrize("population_generator", ["bulk", "per_agent"])
+def test_exclusive_drivers_are_spread_over_the_configured_platforms(config, population_generator):
+    """Each exclusive driver gets one configured platform, independent of their preference; others get none."""
+    # 1. Arrange
+    config['market']['initial_drivers'] = 3000
+    config['market']['population_generator'] = population_generator
+    config['platforms'] = {'A': {}, 'B': {}, 'C': {}}
+    random.seed(4)
+
+    # 2. Act
+    drivers = Market(config, Mock()).drivers
+
+    # 3. Assert
+    exclusive = [d for d in drivers if d.is_exclusive]
+    assert all(d.exclusive_platform_id is None for d in drivers if not d.is_exclusive)
+    for platform_id in ('A', 'B', 'C'):
+        share = sum(d.exclusive_platform_id == platform_id for d in exclusive) / len(exclusive)
+        assert share == pytest.approx(1 / 3, abs=0.06)
+    assert any(d.exclusive_platform_id == 'B' and d.preference_score > 0 for d in exclusive)
+
+def test_agents_built_from_rows_have_plain_python_attributes(config):
+    """Agents get contiguous ids and plain Python attribute types."""
+    rng = np.random.default_rng(3)
+    riders = riders_from_rows(generate_riders(config['market']['rider_population'], 5, rng))
+    drivers = drivers_from_rows(generate_drivers(config['market']['driver_population'], 2, rng), first_id=5)
+
+    assert [r.agent_id for r in riders] == [0, 1, 2, 3, 4]
+    assert [d.agent_id for d in drivers] == [5, 6]
+    assert type(riders[0].price_sensitivity) is float
+    assert type(riders[0].patience_ticks) is int
+    assert type(riders[0].has_app_a) is bool
+    assert type(drivers[0].location[0]) is int
+
+def test_bulk_market_is_reproducible_and_grid_is_loaded(config):
+    """Seeding `random` fixes the bulk population, and every agent is in its cell."""
+    random.seed(5)
+    market = Market(config, Mock())
+    random.seed(5)
+    same_seed = Market(config, Mock())
+
+    assert len(market.riders) == 20000
+    assert len(market.drivers) == 4000
+    assert [r.location for r in market.riders[:50]] == [r.location for r in same_seed.riders[:50]]
+    for agent in market.riders[:100] + market.drivers[:100]:
+        assert agent in market.grid.get_agents_in_cell(market.grid.get_cell_id(agent.location))
+
+def test_per_agent_generator_remains_available(config):
+    """The per-agent reference path can still be selected."""
+    config['market']['population_generator'] = 'per_agent'
+    config['market']['initial_riders'] = 50
+    config['market']['initial_drivers'] = 10
+
+    market = Market(config, Mock())
+
+    assert len(market.riders) == 50
+    assert market.drivers[0].agent_id == 50
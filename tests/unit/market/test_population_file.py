@@ -0,0 +1,117 @@
+import random
+import pytest
+import numpy as np
+from unittest.mock import Mock
+from simulator.market.market import Market
+from simulator.market import population_file
+from simulator.market.population_file import build_population_file, load_population_file
+
+@pytest.fixture
+def config(market_config):
+    """Provides a seeded market config."""
+    market_config['simulation'].update(ticks_per_major=10, random_seed=42)
+    market_config['market'].update(grid_resolution=1000, initial_drivers=40)
+    market_config['market']['rider_population']['rides_per_week_dist'] = [3.0, 1.5]
+    return market_config
+
+def test_round_trip_is_memory_mapped(config, tmp_path):
+    """A built file loads back as read-only memory-mapped rows."""
+    path = str(tmp_path / "city.pop")
+
+    assert build_population_file(config, path) == (300, 40)
+    rider_rows, driver_rows = load_population_file(path, config)
+
+    assert isinstance(rider_rows, np.memmap)
+    assert len(rider_rows) == 300
+    assert len(driver_rows) == 40
+    assert not rider_rows.flags.writeable
+
+def test_market_from_file_matches_freshly_sampled_market(config, tmp_path):
+    """Loading the file gives the same agents as sampling with the same seed."""
+    path = str(tmp_path / "city.pop")
+    build_population_file(config, path)
+
+    random.seed(42)
+    sampled = Market(config, Mock())
+    after_sampling = random.random()
+    random.seed(42)
+    loaded = Market(dict(config, market=dict(config['market'], population_file=path)), Mock())
+    after_loading = random.random()
+
+    assert [(r.location, r.preference_score, r.patience_ticks) for r in loaded.riders] == \
+        [(r.location, r.preference_score, r.patience_ticks) for r in sampled.riders]
+    assert [d.is_exclusive for d in loaded.drivers] == [d.is_exclusive for d in sampled.drivers]
+    assert after_loading == after_sampling
+
+def test_stale_file_is_rejected(config, tmp_path):
+    """A file built for a different market section or seed is never used silently."""
+    path = str(tmp_path / "city.pop")
+    build_population_file(config, path)
+
+    config['market']['initial_riders'] = 301
+    with pytest.raises(ValueError, match="stale"):
+        load_population_file(path, config)
+
+    config['market']['initial_riders'] = 300
+    config['simulation']['random_seed'] = 7
+    with pytest.raises(ValueError, match="stale"):
+        load_population_file(path, config)
+
+    # Exclusive drivers are stored as an index into the platform ids.
+    config['simulation']['random_seed'] = 42
+    config['platforms'] = {'A': {}, 'B': {}, 'C': {}}
+    with pytest.raises(ValueError, match="stale"):
+        load_population_file(path, config)
+
+def test_dispatch_settings_do_not_invalidate_the_file(config, tmp_path):
+    """Only the inputs of the population are hashed, so other market settings can change freely."""
+    # 1. Arrange
+    path = str(tmp_path / "city.pop")
+    build_population_file(config, path)
+
+    # 2. Act
+    config['market']['search_mode'] = 'deadline'
+    config['market']['agent_backend'] = 'columnar'
+    config['platforms'] = {'A': {'matcher': {'batch_window_ticks': 6}}, 'B': {'base_fare': 25.0}}
+    rider_rows, driver_rows = load_population_file(path, config)
+
+    # 3. Assert
+    assert len(rider_rows) == 300
+    assert len(driver_rows) == 40
+
+def test_other_files_are_rejected(config, tmp_path):
+    """Files without the population header are refused."""
+    path = tmp_path / "not_a_population.bin"
+    path.write_bytes(b"timestamp,event_type\n")
+
+    with pytest.raises(ValueError, match="not a population file"):
+        load_population_file(str(path), config)
+
+def test_per_agent_generator_is_rejected(config, tmp_path):
+    """Files hold bulk-generated rows, which differ from what the per-agent sampler would draw."""
+    path = str(tmp_path / "city.pop")
+    build_population_file(config, path)
+    config['market']['population_generator'] = 'per_agent'
+
+    with pytest.raises(ValueError, match="bulk generator"):
+        build_population_file(config, str(tmp_path / "other.pop"))
+    with pytest.raises(ValueError, match="bulk generator"):
+        Market(dict(config, market=dict(config['market'], population_file=path)), Mock())
+
+def test_truncated_file_is_rejected(config, tmp_path):
+    """Row counts in the header are checked against the file size before mapping."""
+    path = tmp_path / "city.pop"
+    build_population_file(config, str(path))
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError, match="truncated"):
+        load_population_file(str(path), config)
+
+def test_rows_of_another_layout_are_rejected(config, tmp_path, monkeypatch):
+    """A file whose row dtype differs from the current RIDER_DTYPE is refused even if the hash matches."""
+    path = str(tmp_path / "city.pop")
+    build_population_file(config, path)
+    monkeypatch.setattr(population_file, "RIDER_DTYPE", np.dtype(population_file.RIDER_DTYPE.descr + [("extra", "<f4")]))
+
+    with pytest.raises(ValueError, match="rider_dtype"):
+        load_population_file(path, config)
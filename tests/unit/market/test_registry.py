@@ -0,0 +1,40 @@
+import pytest
+from simulator.market.registry import AgentRegistry
+from simulator.agents.rider.rider import RiderAgent
+from simulator.agents.driver.driver import DriverAgent
+
+def make_rider(agent_id):
+    return RiderAgent(agent_id, (0, 0), True, True, 0.0, 0.5, 0.5, 3, 18)
+
+def make_driver(agent_id):
+    return DriverAgent(agent_id, (0, 0), False, 0.0, 0.7, 0.3)
+
+@pytest.fixture
+def registry():
+    """Provides a registry with riders 0-2 and drivers 3-4."""
+    riders = [make_rider(i) for i in range(3)]
+    drivers = [make_driver(i) for i in range(3, 5)]
+    return AgentRegistry(riders, drivers)
+
+def test_lookup_by_id(registry):
+    """Riders and drivers are found by id through their own accessor."""
+    assert registry.get_rider(2).agent_id == 2
+    assert registry.get_driver(3).agent_id == 3
+    assert registry.get(4).agent_id == 4
+    assert len(registry) == 5
+    assert 4 in registry
+
+def test_lookup_of_wrong_kind_or_unknown_id_returns_none(registry):
+    """A driver id is not a rider id and vice versa, and unknown ids miss."""
+    assert registry.get_rider(3) is None
+    assert registry.get_driver(0) is None
+    assert registry.get(-1) is None
+    assert registry.get(5) is None
+    assert 5 not in registry
+
+def test_non_contiguous_ids_are_rejected():
+    """The registry refuses populations it cannot index by position."""
+    with pytest.raises(ValueError):
+        AgentRegistry([make_rider(0), make_rider(2)], [])
+    with pytest.raises(ValueError):
+        AgentRegistry([make_rider(0)], [make_driver(1), make_driver(3)])
@@ -0,0 +1,49 @@
+import pytest
+from unittest.mock import Mock
+from simulator.market.market import Market
+
+@pytest.fixture
+def config(market_config):
+    """Provides a small market that is short of drivers, so riders wait and abandon."""
+    market_config['market'].update(grid_resolution=2000, initial_drivers=15)
+    return market_config
+
+def run_counting_attempts(build_market, config, search_mode, skip_idle_ticks=False):
+    """Runs one simulated day and returns the market, its CSV logger and the number of match attempts."""
+    run = build_market(config, seed=4, search_mode=search_mode)
+    attempts = []
+    for platform in run.platforms:
+        process_order = platform.matcher.process_order
+        platform.matcher.process_order = lambda *args, process_order=process_order: attempts.append(1) or process_order(*args)
+    run.engine.run(duration_days=1, ticks_per_major=1440, skip_idle_ticks=skip_idle_ticks)
+    return run.market, run.csv_logger, len(attempts)
+
+def test_deadline_mode_reproduces_polling_with_fewer_attempts(config, build_market):
+    """
+    A retry can only succeed once idle supply near the rider has changed, so
+    retrying on supply changes gives the same matches and abandonments as polling.
+    """
+    # 1. Act
+    poll_market, poll_log, poll_attempts = run_counting_attempts(build_market, config, 'poll')
+    deadline_market, deadline_log, deadline_attempts = run_counting_attempts(build_market, config, 'deadline')
+
+    # 2. Assert
+    assert sum(poll_market.metrics.abandoned_orders.values()) > 0
+    # Within a tick, timeouts are logged after the matching round rather than in rider order.
+    assert sorted(map(repr, deadline_log.log.call_args_list)) == sorted(map(repr, poll_log.log.call_args_list))
+    assert deadline_market.metrics.matched_orders == poll_market.metrics.matched_orders
+    assert deadline_market.metrics.abandoned_orders == poll_market.metrics.abandoned_orders
+    assert deadline_attempts < poll_attempts
+
+def test_deadline_mode_lets_the_engine_skip_waiting_ticks(config, run_market):
+    """Waiting riders do not keep the engine ticking, and matches still happen."""
+    market = run_market(config, seed=4, skip_idle_ticks=True, search_mode='deadline').market
+
+    assert market.engine.ticks_skipped > 0
+    assert market.metrics.total_completed_trips > 0
+
+def test_unknown_search_mode_is_rejected(config):
+    """A typo in search_mode fails fast instead of silently polling."""
+    config['market']['search_mode'] = 'deadlines'
+    with pytest.raises(ValueError, match="search_mode"):
+        Market(config, Mock())
@@ -32,19 +32,115 @@ def test_add_and_get_agents():
     grid.add_agent(rider3)
 
     # 3. Assert
-    cell_1_2 = grid.get_cell_id(rider1.location)
-    assert cell_1_2 == (1, 2)
-    agents_in_cell_1_2 = grid.get_agents_in_cell(cell_1_2)
-    assert len(agents_in_cell_1_2) == 2
-    assert rider1 in agents_in_cell_1_2
-    assert rider2 in agents_in_cell_1_2
-
-    cell_3_4 = grid.get_cell_id(rider3.location)
-    assert cell_3_4 == (3, 4)
-    agents_in_cell_3_4 = grid.get_agents_in_cell(cell_3_4)
-    assert len(agents_in_cell_3_4) == 1
-    assert rider3 in agents_in_cell_3_4
+    cell_0_3 = grid.get_cell_id(rider1.location)
+    assert cell_0_3 == (0, 3)
+    agents_in_cell_0_3 = grid.get_agents_in_cell(cell_0_3)
+    assert len(agents_in_cell_0_3) == 2
+    assert rider1 in agents_in_cell_0_3
+    assert rider2 in agents_in_cell_0_3
+
+    cell_1_5 = grid.get_cell_id(rider3.location)
+    assert cell_1_5 == (1, 5)
+    agents_in_cell_1_5 = grid.get_agents_in_cell(cell_1_5)
+    assert len(agents_in_cell_1_5) == 1
+    assert rider3 in agents_in_cell_1_5
 
     # Check an empty cell
     empty_cell_agents = grid.get_agents_in_cell((0, 0))
     assert len(empty_cell_agents) == 0
+
+def make_rider(agent_id, location):
+    return RiderAgent(agent_id, location, True, True, 0.5, 0.5, 0.5, 3)
+
+def test_cell_ids_are_axial_hexagons():
+    """Cell centres map back to their own cell and neighbours are one step away."""
+    grid = HexGrid(grid_resolution=100)
+
+    for cell_id in HexGrid.k_ring((2, -1), 2):
+        center = grid.get_cell_center(cell_id)
+        assert grid.get_cell_id((round(center[0]), round(center[1]))) == cell_id
+
+    assert len(HexGrid.ring((0, 0), 1)) == 6
+    assert len(HexGrid.ring((0, 0), 3)) == 18
+    assert len(HexGrid.k_ring((0, 0), 2)) == 19
+    assert all(HexGrid.hex_distance((0, 0), c) == 2 for c in HexGrid.ring((0, 0), 2))
+    # Adjacent cell centres are grid_resolution apart.
+    x0, y0 = grid.get_cell_center((0, 0))
+    x1, y1 = grid.get_cell_center((0, 1))
+    assert ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5 == pytest.approx(100)
+
+def test_vectorized_cell_ids_match_scalar():
+    """Bulk cell assignment agrees with get_cell_id."""
+    grid = HexGrid(grid_resolution=37)
+    xs = [x * 13 % 1000 for x in range(500)]
+    ys = [x * 29 % 1000 for x in range(500)]
+
+    qs, rs = grid.get_cell_ids(xs, ys)
+
+    assert list(zip(qs.tolist(), rs.tolist())) == [grid.get_cell_id((x, y)) for x, y in zip(xs, ys)]
+
+def test_move_and_remove_agent():
+    """Moving re-indexes the agent in its new cell; removing drops it."""
+    grid = HexGrid(grid_resolution=10)
+    rider = make_rider(1, (0, 0))
+    grid.add_agent(rider)
+
+    grid.move_agent(rider, (500, 500))
+
+    assert rider.location == (500, 500)
+    assert rider not in grid.get_agents_in_cell(grid.get_cell_id((0, 0)))
+    assert rider in grid.get_agents_in_cell(grid.get_cell_id((500, 500)))
+    assert grid.get_agent_cell(rider) == grid.get_cell_id((500, 500))
+
+    grid.remove_agent(rider)
+    grid.remove_agent(rider)
+
+    assert len(grid) == 0
+    assert grid.get_agents_in_cell(grid.get_cell_id((500, 500))) == []
+
+def test_index_stays_consistent_under_many_moves():
+    """After thousands of random moves, every agent is indexed in exactly the cell of its location."""
+    import random
+    rng = random.Random(3)
+    grid = HexGrid(grid_resolution=50)
+    riders = [make_rider(i, (rng.randint(0, 1000), rng.randint(0, 1000))) for i in range(500)]
+    grid.add_agents(riders)
+
+    for _ in range(5000):
+        grid.move_agent(rng.choice(riders), (rng.randint(0, 1000), rng.randint(0, 1000)))
+
+    assert len(grid) == 500
+    for rider in riders:
+        assert grid.get_agents_in_cell(grid.get_cell_id(rider.location)).count(rider) == 1
+    assert sum(len(grid.get_agents_in_cell(c)) for c in set(grid.get_agent_cell(r) for r in riders)) == 500
+
+def test_radius_query_matches_brute_force():
+    """Radius queries return exactly the agents within the radius, across cells."""
+    import random
+    rng = random.Random(5)
+    grid = HexGrid(grid_resolution=30)
+    riders = [make_rider(i, (rng.randint(0, 500), rng.randint(0, 500))) for i in range(400)]
+    grid.add_agents(riders)
+
+    for center, radius in [((250, 250), 75), ((0, 0), 120), ((400, 100), 10)]:
+        found = set(r.agent_id for r in grid.get_agents_within_radius(center, radius))
+        expected = set(
+            r.agent_id for r in riders
+            if (r.location[0] - center[0]) ** 2 + (r.location[1] - center[1]) ** 2 <= radius ** 2
+        )
+        assert found == expected
+
+def test_ring_query_collects_neighbouring_cells():
+    """k-ring queries see agents in neighbouring cells, but not farther ones."""
+    grid = HexGrid(grid_resolution=10)
+    center = grid.get_cell_center((0, 0))
+    neighbour = grid.get_cell_center((1, 0))
+    far = grid.get_cell_center((3, 0))
+    near_rider = make_rider(1, (round(neighbour[0]), round(neighbour[1])))
+    far_rider = make_rider(2, (round(far[0]), round(far[1])))
+    grid.add_agent(near_rider)
+    grid.add_agent(far_rider)
+
+    found = list(grid.iter_agents_in_ring(grid.get_cell_id((round(center[0]), round(center[1]))), 1))
+
+    assert found == [near_rider]
@@ -0,0 +1,61 @@
+import pytest
+from unittest.mock import Mock
+from simulator.market.state_index import StateIndex
+from simulator.market.market import Market
+from simulator.agents.rider.rider import RiderAgent, RiderState
+from simulator.agents.driver.driver import DriverAgent, DriverState
+
+@pytest.fixture
+def riders():
+    """Provides three idle riders."""
+    return [RiderAgent(i, (0, 0), True, True, 0.0, 0.5, 0.5, 3, 18) for i in range(3)]
+
+@pytest.fixture
+def config(market_config):
+    """Provides a complete config for building a tiny Market."""
+    market_config['simulation']['ticks_per_major'] = 10
+    market_config['market'].update(grid_resolution=10, initial_riders=4, initial_drivers=2)
+    market_config['market']['rider_population'].update(
+        rides_per_week_dist=[5, 2], pct_with_app_a_only=0.3, pct_with_app_b_only=0.3
+    )
+    market_config['market']['driver_population']['pct_exclusive'] = 0.5
+    return market_config
+
+def test_index_starts_from_current_states(riders):
+    """Agents are indexed under the state they are in when the index is built."""
+    riders[1].current_state = RiderState.SEARCHING
+
+    index = StateIndex(RiderState, riders)
+
+    assert index.members(RiderState.IDLE) == [0, 2]
+    assert index.members(RiderState.SEARCHING) == [1]
+    assert index.count(RiderState.ORDERED) == 0
+
+def test_transition_moves_agent_between_sets(riders):
+    """A transition updates both the agent and the membership sets."""
+    index = StateIndex(RiderState, riders)
+
+    index.transition(riders[2], RiderState.SEARCHING)
+    index.transition(riders[0], RiderState.SEARCHING)
+    index.transition(riders[0], RiderState.SEARCHING)  # No-op
+
+    assert riders[2].current_state == RiderState.SEARCHING
+    assert index.members(RiderState.SEARCHING) == [0, 2]
+    assert index.count(RiderState.IDLE) == 1
+    assert index.counts()["SEARCHING"] == 2
+
+def test_market_transitions_feed_metrics_counts(config):
+    """State changes made through the Market are visible as instant metric counts."""
+    market = Market(config, Mock())
+    driver = market.drivers[0]
+    rider = market.riders[0]
+
+    market.set_driver_state(driver, DriverState.IDLE)
+    market.set_driver_state(market.drivers[1], DriverState.IDLE)
+    market.set_driver_state(market.drivers[1], DriverState.DRIVING_TO_RIDER)
+    market.set_rider_state(rider, RiderState.SEARCHING)
+
+    assert market.metrics.current_online_drivers() == 2
+    assert market.metrics.current_idle_drivers() == 1
+    assert market.metrics.current_searching_riders() == 1
+    assert market.driver_states.members(DriverState.DRIVING_TO_RIDER) == [market.drivers[1].agent_id]
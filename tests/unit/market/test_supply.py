@@ -0,0 +1,86 @@
+import random
+import pytest
+from simulator.market.supply import SessionSupply
+from simulator.core.events import EventType
+from simulator.agents.rider.rider import RiderState
+from simulator.agents.driver.driver import DriverState
+
+TICKS_PER_DAY = 1440
+
+@pytest.fixture
+def config(market_config):
+    """Provides a small market whose drivers work in sessions."""
+    market_config['market'].update(
+        grid_resolution=2000, initial_riders=200, initial_drivers=40,
+        supply_model='sessions', driver_sessions={'sessions_per_day': 2, 'session_hours_dist': [3, 1]}
+    )
+    return market_config
+
+def test_sessions_follow_the_start_profile():
+    """Sessions only start in hours with a positive weight and last at least a tick."""
+    # 1. Arrange
+    random.seed(3)
+    profile = [0] * 12 + [1] * 12  # Afternoon and evening shifts only
+    supply = SessionSupply(TICKS_PER_DAY, {'sessions_per_day': 1, 'session_hours_dist': [4, 2], 'start_profile': profile})
+
+    # 2. Act
+    sessions, tick = [], 0
+    while len(sessions) < 500:
+        session = supply.next_session(tick)
+        sessions.append(session)
+        tick = session[1]
+
+    # 3. Assert
+    assert all(start % TICKS_PER_DAY >= TICKS_PER_DAY // 2 for start, _ in sessions)
+    assert all(end > start for start, end in sessions)
+
+def test_first_session_may_already_be_running():
+    """First sessions are sampled from a day before the run, so some drivers start online."""
+    random.seed(3)
+    supply = SessionSupply(TICKS_PER_DAY, {'sessions_per_day': 2, 'session_hours_dist': [6, 1]})
+
+    sessions = [supply.first_session() for _ in range(200)]
+
+    assert all(end > max(0, start) for start, end in sessions)
+    assert 0 < sum(start == 0 for start, _ in sessions) < 200
+
+def test_session_end_waits_for_the_trip_to_complete(config, build_market):
+    """A driver whose session ends mid-trip goes offline when the trip completes, then gets a new session."""
+    # 1. Arrange
+    run = build_market(config, seed=5)
+    market, scheduled = run.market, run.scheduled
+    driver = next(driver for driver in market.drivers if driver.current_state == DriverState.OFFLINE)
+    rider = market.riders[0]
+    market.set_driver_state(driver, DriverState.ON_TRIP)
+    market.set_rider_state(rider, RiderState.ON_TRIP)
+    driver.match = rider.match = {'rider_id': rider.agent_id, 'platform_id': 'A', 'destination': (5000, 5000)}
+    scheduled.clear()
+
+    # 2. Act
+    market.handle_event((EventType.DRIVER_SESSION_END, driver.agent_id, 0), 100)
+    state_after_session_end = driver.current_state
+    market.handle_event((EventType.TRIP_COMPLETED, driver.agent_id, 0), 120)
+
+    # 3. Assert
+    assert state_after_session_end == DriverState.ON_TRIP
+    assert driver.current_state == DriverState.OFFLINE
+    assert all(driver not in platform.idle_drivers for platform in market.platforms)
+    assert [action for action in scheduled if "DRIVER" in action.name] == [EventType.DRIVER_SESSION_START]
+
+def test_sessions_schedule_only_real_transitions(config, build_market):
+    """Drivers come and go over the day, with a couple of events per session instead of hourly polls."""
+    # 1. Arrange
+    run = build_market(config, seed=5)
+    market, scheduled = run.market, run.scheduled
+
+    # 2. Act
+    run.engine.run(duration_days=2, ticks_per_major=TICKS_PER_DAY, skip_idle_ticks=True)
+
+    # 3. Assert
+    session_events = scheduled.count(EventType.DRIVER_SESSION_START) + scheduled.count(EventType.DRIVER_SESSION_END)
+    assert EventType.EVALUATE_DRIVER_GO_ONLINE not in scheduled
+    assert session_events < 40 * 2 * 2 * 2  # Under two sessions per driver per day
+    timeline = market.metrics.supply_timeline
+    assert min(online for _, online in timeline) < max(online for _, online in timeline)
+    assert market.metrics.online_drivers_at(2 * TICKS_PER_DAY) == market.metrics.current_online_drivers()
+    assert all(market.registry.get_driver(driver_id).current_state != DriverState.IDLE for driver_id in market._offline_after_trip)
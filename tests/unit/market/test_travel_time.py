@@ -0,0 +1,61 @@
+import pytest
+import numpy as np
+from simulator.market.space import HexGrid
+from simulator.market.travel_time import TravelTimeTable, city_cells
+from simulator.agents.driver.driver import DriverState
+from simulator.agents.rider.rider import RiderState
+
+@pytest.fixture
+def grid():
+    """Provides a coarse grid with a few hundred cells over the city."""
+    return HexGrid(grid_resolution=500)
+
+@pytest.fixture
+def config(market_config):
+    """Provides a small market config."""
+    market_config['market'].update(initial_riders=200, initial_drivers=40, travel_speed_kmh=30)
+    return market_config
+
+def test_dense_matrix_agrees_with_distance_table(grid):
+    """The dense matrix holds the same times as the hex-distance fallback."""
+    # 1. Arrange
+    dense = TravelTimeTable(grid, speed_kmh=30)
+    sparse = TravelTimeTable(grid, speed_kmh=30, max_dense_cells=0)
+    cells = [tuple(cell) for cell in city_cells(grid).tolist()]
+
+    # 2. Act
+    pairs = [(cells[0], cells[-1]), (cells[5], cells[5]), (cells[10], cells[11])]
+
+    # 3. Assert
+    assert dense.num_cells == len(cells) and sparse.num_cells == 0
+    assert [dense.minutes(a, b) for a, b in pairs] == [sparse.minutes(a, b) for a, b in pairs]
+    # One step of 500 m at 30 km/h takes one minute; within a cell, the 2-minute floor applies.
+    assert sparse.minutes((0, 0), (3, 0)) == pytest.approx(3.0)
+    assert sparse.minutes((0, 0), (0, 0)) == 2.0
+
+def test_travel_times_round_trip_through_a_file(grid, tmp_path):
+    """A saved matrix loads back, and cells outside it fall back to hex distance."""
+    table = TravelTimeTable(grid)
+    path = tmp_path / "travel_times.npz"
+
+    table.save(path)
+    loaded = TravelTimeTable.from_file(grid, path)
+
+    assert loaded.num_cells == table.num_cells
+    assert loaded.minutes((0, 0), (4, 4)) == table.minutes((0, 0), (4, 4))
+    assert loaded.minutes((1000, 0), (1003, 0)) == table.minutes((0, 0), (3, 0))
+
+def test_trips_run_on_scheduled_events(config, run_market):
+    """Matched trips go through pickup and completion events instead of being polled."""
+    # 1. Act
+    run = run_market(config, seed=2, skip_idle_ticks=True)
+    market, platforms = run.market, run.platforms
+
+    # 2. Assert
+    assert platforms[0].matcher.travel_times is market.travel_times
+    assert market.update_agent_locations(0, 0) is False
+    assert market.metrics.total_completed_trips > 0
+    in_progress = market.driver_states.count(DriverState.DRIVING_TO_RIDER) + market.driver_states.count(DriverState.ON_TRIP)
+    riders_in_progress = market.rider_states.count(RiderState.ORDERED) + market.rider_states.count(RiderState.ON_TRIP)
+    assert in_progress == riders_in_progress
+    assert sum(market.metrics.matched_orders.values()) == market.metrics.total_completed_trips + in_progress
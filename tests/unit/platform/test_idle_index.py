@@ -0,0 +1,83 @@
+import pytest
+from simulator.market.space import HexGrid
+from simulator.platform.idle_index import IdleDriverIndex
+from simulator.platform.matcher import Matcher
+from simulator.platform.platform import Platform
+from simulator.agents.rider.rider import RiderAgent
+from simulator.agents.driver.driver import DriverAgent, DriverState
+
+@pytest.fixture
+def grid():
+    """Provides an empty HexGrid for tests."""
+    return HexGrid(grid_resolution=10)
+
+def make_idle_driver(agent_id, location, exclusive_platform_id=None, preference_score=0.5):
+    driver = DriverAgent(agent_id, location, exclusive_platform_id is not None, preference_score, 0.5, 0.5,
+                         exclusive_platform_id=exclusive_platform_id)
+    driver.current_state = DriverState.IDLE
+    return driver
+
+def test_idle_index_tracks_adds_moves_and_removals(grid):
+    """Drivers are bucketed by their current cell and can be moved or removed."""
+    # 1. Arrange
+    index = IdleDriverIndex(grid)
+    driver = make_idle_driver(1, (0, 0))
+
+    # 2. Act
+    index.add(driver)
+    old_cell = grid.get_cell_id((0, 0))
+    driver.location = (500, 500)
+    index.update_location(driver)
+
+    # 3. Assert
+    assert list(index.drivers_in_cell(old_cell)) == []
+    assert list(index.drivers_in_cell(grid.get_cell_id((500, 500)))) == [driver]
+    index.remove(driver)
+    assert driver not in index and len(index) == 0
+    index.remove(driver)  # Removing twice is a no-op
+
+def test_platform_only_serves_eligible_drivers(grid):
+    """Exclusive drivers serve only their own platform, whatever their preference; others serve every platform."""
+    platform_a = Platform('A', Matcher(grid))
+    platform_c = Platform('C', Matcher(grid))
+    exclusive_a = make_idle_driver(1, (0, 0), exclusive_platform_id='A', preference_score=-0.7)
+    exclusive_c = make_idle_driver(2, (0, 0), exclusive_platform_id='C', preference_score=0.2)
+    multi_homing = make_idle_driver(3, (0, 0), preference_score=-0.9)
+
+    assert [platform_a.serves(d) for d in (exclusive_a, exclusive_c, multi_homing)] == [True, False, True]
+    assert [platform_c.serves(d) for d in (exclusive_a, exclusive_c, multi_homing)] == [False, True, True]
+    assert platform_a.idle_drivers is platform_a.matcher.idle_drivers
+
+def test_matcher_returns_k_nearest_from_idle_index(grid):
+    """With an idle index, only indexed drivers are candidates and at most k are returned."""
+    # 1. Arrange
+    index = IdleDriverIndex(grid)
+    matcher = Matcher(grid, idle_drivers=index)
+    rider = RiderAgent(101, (0, 0), True, True, 0.5, 0.5, 0.5, 3)
+    drivers = [make_idle_driver(i, (i, 0)) for i in (4, 1, 3, 2)]
+    for driver in drivers:
+        grid.add_agent(driver)
+        index.add(driver)
+    not_indexed = make_idle_driver(9, (0, 0))
+    grid.add_agent(not_indexed)
+
+    # 2. Act
+    nearest = matcher.find_nearest_idle_drivers(rider, k=2)
+
+    # 3. Assert
+    assert [d.agent_id for d in nearest] == [1, 2]
+    assert [d.agent_id for d in matcher.find_nearest_idle_drivers(rider)] == [1, 2, 3, 4]
+
+def test_matcher_reports_max_tries_with_bounded_candidates(grid):
+    """Trying max_order_tries rejecting drivers with more available ends in UNFULFILLED_MAX_TRIES."""
+    index = IdleDriverIndex(grid)
+    matcher = Matcher(grid, max_order_tries=2, idle_drivers=index)
+    rider = RiderAgent(101, (0, 0), True, True, 0.5, 0.5, 0.5, 3)
+    for i in range(1, 5):
+        driver = DriverAgent(i, (i, 0), False, 0.5, 0.0, 1.0)  # Always rejects
+        index.add(driver)
+
+    matched_driver, status = matcher.process_order(rider, fare=20, order_id="test_order", day=0, tick=0)
+
+    assert matched_driver is None
+    assert status == "UNFULFILLED_MAX_TRIES"
@@ -80,4 +80,31 @@ def test_matcher_unfulfilled_if_no_drivers(rider):
     matched_driver, status = matcher.process_order(rider, fare=20, order_id="test_order", day=0, tick=0)
 
     assert status == "UNFULFILLED_NO_DRIVERS"
-    assert matched_driver is None
\ No newline at end of file
+    assert matched_driver is None
+
+def test_matcher_grows_search_into_neighbouring_cells():
+    """An idle driver one cell away is found only when neighbouring rings are searched."""
+    grid = HexGrid(grid_resolution=10)
+    rider = RiderAgent(101, (0, 0), True, True, 0.5, 0.5, 0.5, 3)
+    neighbour_center = grid.get_cell_center((1, 0))
+    driver = DriverAgent(7, (round(neighbour_center[0]), round(neighbour_center[1])), False, 0.5, 0.5, 0.5)
+    driver.current_state = DriverStateEnum.IDLE
+    grid.add_agent(driver)
+
+    assert Matcher(grid, search_rings=0).find_nearest_idle_drivers(rider) == []
+    assert Matcher(grid, search_rings=1).find_nearest_idle_drivers(rider) == [driver]
+
+def test_matcher_sees_drivers_after_they_move():
+    """Drivers moved through the grid are matched from their new cell, not their old one."""
+    grid = HexGrid(grid_resolution=10)
+    driver = DriverAgent(7, (1000, 1000), False, 0.5, 0.5, 0.5)
+    driver.current_state = DriverStateEnum.IDLE
+    grid.add_agent(driver)
+    rider_near_old = RiderAgent(101, (1000, 1000), True, True, 0.5, 0.5, 0.5, 3)
+    rider_near_new = RiderAgent(102, (0, 0), True, True, 0.5, 0.5, 0.5, 3)
+
+    grid.move_agent(driver, (0, 0))
+
+    matcher = Matcher(grid)
+    assert matcher.find_nearest_idle_drivers(rider_near_old) == []
+    assert matcher.find_nearest_idle_drivers(rider_near_new) == [driver]
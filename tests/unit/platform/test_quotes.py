@@ -0,0 +1,106 @@
+import pytest
+from unittest.mock import Mock
+from simulator.market.space import HexGrid
+from simulator.platform.matcher import Matcher
+from simulator.platform.platform import Platform
+from simulator.agents.driver.driver import DriverAgent, DriverState
+
+@pytest.fixture
+def platform():
+    """Provides a platform on an empty grid."""
+    return Platform('A', Matcher(HexGrid(grid_resolution=100)), base_fare=18.0)
+
+@pytest.fixture
+def config(market_config):
+    """Provides a small market config with comparison shopping enabled."""
+    market_config['market'].update(comparison_shopping=True, initial_drivers=50)
+    return market_config
+
+def add_idle_driver(platform, agent_id, location):
+    driver = DriverAgent(agent_id, location, False, 0.5, 0.7, 0.3)
+    driver.current_state = DriverState.IDLE
+    platform.idle_drivers.add(driver)
+    return driver
+
+def test_quote_is_cached_per_cell_and_tick(platform):
+    """Repeated quotes for the same cell and tick are served from the cache."""
+    # 1. Arrange
+    add_idle_driver(platform, 1, (0, 0))
+    cell_id = platform.grid.get_cell_id((0, 0))
+
+    # 2. Act
+    first = platform.get_quote(cell_id, current_tick=5)
+    second = platform.get_quote(cell_id, current_tick=5)
+    next_tick = platform.get_quote(cell_id, current_tick=6)
+
+    # 3. Assert
+    assert first is second
+    assert first.available and first.price == 18.0
+    assert next_tick == first and next_tick is not first
+    assert (platform.quote_hits, platform.quote_misses) == (1, 2)
+
+def test_quote_is_invalidated_when_nearby_supply_changes(platform):
+    """Taking the last idle driver near a cell makes its cached quote stale."""
+    driver = add_idle_driver(platform, 1, (0, 0))
+    cell_id = platform.grid.get_cell_id((0, 0))
+    assert platform.get_quote(cell_id, current_tick=5).available
+
+    platform.idle_drivers.remove(driver)
+
+    assert not platform.get_quote(cell_id, current_tick=5).available
+    assert platform.quote_misses == 2
+
+def test_quote_hits_do_not_touch_the_index_or_the_matcher(platform, monkeypatch):
+    """A hit is a single cache lookup: no ring is built and no ETA estimated."""
+    # 1. Arrange
+    add_idle_driver(platform, 1, (0, 0))
+    cell_id = platform.grid.get_cell_id((0, 0))
+    first = platform.get_quote(cell_id, current_tick=5)
+    k_ring = Mock(side_effect=AssertionError("k_ring called on a hit"))
+    estimate_eta = Mock(side_effect=AssertionError("estimate_eta called on a hit"))
+    monkeypatch.setattr(platform.grid, "k_ring", k_ring)
+    monkeypatch.setattr(platform.matcher, "estimate_eta", estimate_eta)
+
+    # 2. Act
+    hits = [platform.get_quote(cell_id, current_tick=5) for _ in range(3)]
+
+    # 3. Assert
+    assert all(hit is first for hit in hits)
+    assert platform.quote_hits == 3
+    k_ring.assert_not_called()
+    estimate_eta.assert_not_called()
+
+def test_supply_changes_out_of_search_range_keep_the_quote(platform):
+    """Only the quotes of cells whose search reaches the changed cell are dropped."""
+    add_idle_driver(platform, 1, (0, 0))
+    cell_id = platform.grid.get_cell_id((0, 0))
+    first = platform.get_quote(cell_id, current_tick=5)
+
+    add_idle_driver(platform, 2, (5000, 5000))
+
+    assert platform.get_quote(cell_id, current_tick=5) is first
+    assert platform.quote_misses == 1
+
+def test_riders_in_the_same_cell_share_quotes(config, build_market):
+    """Comparing riders in the same cell and tick cost one quote per platform."""
+    # 1. Arrange
+    run = build_market(config, seed=5)
+    market, platforms = run.market, run.platforms
+    dual_app_riders = [rider for rider in market.riders if rider.has_app_a and rider.has_app_b][:3]
+    for rider in dual_app_riders:
+        market.grid.move_agent(rider, (5000, 5000))
+
+    # 2. Act
+    choices = [market._compare_offers(rider, current_tick=10) for rider in dual_app_riders]
+
+    # 3. Assert
+    assert all(choice in ('A', 'B') for choice in choices)
+    assert [(p.quote_misses, p.quote_hits) for p in platforms] == [(1, 2), (1, 2)]
+
+def test_comparison_shopping_runs_a_full_day(config, run_market):
+    """With comparison shopping on, dual-app riders compare quotes and still complete trips."""
+    run = run_market(config, seed=5)
+    market, platforms = run.market, run.platforms
+
+    assert market.metrics.total_completed_trips > 0
+    assert all(platform.quote_misses > 0 for platform in platforms)
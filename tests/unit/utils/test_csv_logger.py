@@ -0,0 +1,75 @@
+import csv
+import logging
+import pytest
+from simulator.utils.csv_logger import CsvLogger
+from simulator.utils.async_writer import BackgroundWriter, BatchedFileHandler
+
+def test_csv_logger_writes_every_row_in_order_on_close(tmp_path):
+    """Rows are batched through a small bounded queue and all written, formatted, by close."""
+    # 1. Arrange
+    path = tmp_path / "log.csv"
+    csv_logger = CsvLogger(str(path), ticks_per_major=8640, batch_size=7, max_pending_batches=1)
+
+    # 2. Act
+    for i in range(1000):
+        csv_logger.log(i, "ORDER_CREATED", rider_id=i, details="Rider %s from %s.", details_args=(i, (i, 2 * i)))
+    csv_logger.log(1006, "STATE_IDLE", driver_id=5, details="plain")
+    csv_logger.close()
+
+    # 3. Assert
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["timestamp", "event_type", "rider_id", "driver_id", "details"]
+    assert len(rows) == 1002
+    assert rows[1] == ["Day 0, 00:00:00", "ORDER_CREATED", "0", "", "Rider 0 from (0, 0)."]
+    assert rows[-2][4] == "Rider 999 from (999, 1998)."
+    assert rows[-1] == ["Day 0, 02:47:40", "STATE_IDLE", "", "5", "plain"]
+
+def test_writer_errors_surface_in_the_producer():
+    """A failing write is re-raised on the simulation thread instead of being lost."""
+    def write_batch(batch):
+        raise OSError("disk full")
+
+    writer = BackgroundWriter(write_batch, batch_size=2)
+    writer.put("a")
+    writer.put("b")
+
+    with pytest.raises(OSError, match="disk full"):
+        writer.flush()
+    writer.close()
+
+def test_close_after_a_failed_write_stops_the_thread_and_closes_the_file(tmp_path):
+    """The pending error is raised by close, but only after the thread is joined and the file closed."""
+    # 1. Arrange
+    csv_logger = CsvLogger(str(tmp_path / "log.csv"), batch_size=1)
+    # Two placeholders and one argument: formatting fails on the writer thread.
+    csv_logger.log(0, "STATE_IDLE", driver_id=1, details="Driver %s at %s.", details_args=(1,))
+    csv_logger._background._queue.join()
+
+    # 2. Act
+    with pytest.raises(TypeError):
+        csv_logger.close()
+
+    # 3. Assert
+    assert not csv_logger._background._thread.is_alive()
+    assert csv_logger.file.closed
+    csv_logger.close()
+
+def test_batched_file_handler_formats_lazily(tmp_path):
+    """Lazy %s log calls are formatted on the writer thread and flushed on close."""
+    path = tmp_path / "sim.log"
+    handler = BatchedFileHandler(str(path), mode='w', batch_size=3)
+    handler.setFormatter(logging.Formatter('%(levelname)s | %(message)s'))
+    logger = logging.getLogger("test_batched_file_handler")
+    logger.propagate = False
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+    for i in range(10):
+        logger.info("RIDER   | STATE_SEARCHING  | %s | Rider %s is now SEARCHING.", "Day 0", i)
+    logger.removeHandler(handler)
+    handler.close()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 10
+    assert lines[3] == "INFO | RIDER   | STATE_SEARCHING  | Day 0 | Rider 3 is now SEARCHING."
@@ -0,0 +1,77 @@
+import csv
+import pytest
+from simulator.utils import event_log as event_log_module
+from simulator.utils.event_log import BinaryEventLogger, RECORD_DTYPE, EVENT_CODES, PLATFORM_CODES, NO_AGENT, read_event_log, convert_to_csv
+
+def write_sample_log(path):
+    event_log = BinaryEventLogger(str(path), ticks_per_major=8640, batch_size=2)
+    event_log.log(406, "ORDER_CREATED", rider_id=333, details="ignored %s", details_args=(1,))
+    event_log.log(418, "SEARCH_ABANDONED", rider_id=333, platform_id='B')
+    event_log.log(8639, "TRIP_COMPLETED", rider_id=7, driver_id=1001, platform_id='A')
+    event_log.close()
+
+def test_binary_log_is_memory_mappable(tmp_path):
+    """Events are stored as 16-byte records that read back as a structured array."""
+    # 1. Arrange
+    path = tmp_path / "log.bin"
+
+    # 2. Act
+    write_sample_log(path)
+    records, header = read_event_log(str(path))
+
+    # 3. Assert
+    assert RECORD_DTYPE.itemsize == 16
+    assert header["ticks_per_major"] == 8640
+    assert records["tick"].tolist() == [406, 418, 8639]
+    assert records["event_type"].tolist() == [EVENT_CODES["ORDER_CREATED"], EVENT_CODES["SEARCH_ABANDONED"], EVENT_CODES["TRIP_COMPLETED"]]
+    assert records["driver_id"].tolist() == [NO_AGENT, NO_AGENT, 1001]
+    assert records["platform"].tolist() == [0, PLATFORM_CODES['B'], PLATFORM_CODES['A']]
+
+def test_converter_rebuilds_the_csv_layout(tmp_path):
+    """The converter writes CsvLogger's columns, timestamps and order ids."""
+    write_sample_log(tmp_path / "log.bin")
+
+    rows = convert_to_csv(str(tmp_path / "log.bin"), str(tmp_path / "log.csv"))
+
+    with open(tmp_path / "log.csv", newline='') as f:
+        table = list(csv.reader(f))
+    assert rows == 3
+    assert table[0] == ["timestamp", "event_type", "rider_id", "driver_id", "details"]
+    assert table[2] == ["Day 0, 01:09:40", "SEARCH_ABANDONED", "333", "", "Rider 333 ABANDONED SEARCH for Order order_333_0_406."]
+    assert table[3] == ["Day 0, 23:59:50", "TRIP_COMPLETED", "7", "1001", "Trip completed for Rider 7 and Driver 1001."]
+
+def test_non_event_log_files_are_rejected(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not an event log")
+
+    with pytest.raises(ValueError, match="not a binary event log"):
+        read_event_log(str(path))
+
+def test_converter_reads_the_records_in_chunks(tmp_path, monkeypatch):
+    """Chunk boundaries do not change the output, including order ids spanning two chunks."""
+    # 1. Arrange
+    write_sample_log(tmp_path / "log.bin")
+    convert_to_csv(str(tmp_path / "log.bin"), str(tmp_path / "whole.csv"))
+    monkeypatch.setattr(event_log_module, "CONVERT_CHUNK_RECORDS", 1)
+
+    # 2. Act
+    rows = convert_to_csv(str(tmp_path / "log.bin"), str(tmp_path / "chunked.csv"))
+
+    # 3. Assert
+    assert rows == 3
+    assert (tmp_path / "chunked.csv").read_text() == (tmp_path / "whole.csv").read_text()
+
+def test_unknown_platforms_are_rejected_up_front(tmp_path):
+    with pytest.raises(ValueError, match="missing from PLATFORM_IDS"):
+        BinaryEventLogger(str(tmp_path / "log.bin"), platform_ids=['A', 'C'])
+
+def test_unknown_event_type_names_the_missing_entry(tmp_path):
+    """A KeyError from the code lookup would not say which table to extend."""
+    event_log = BinaryEventLogger(str(tmp_path / "log.bin"), platform_ids=['A', 'B'])
+    try:
+        with pytest.raises(ValueError, match="'RIDER_TELEPORTED' is missing from EVENT_TYPES"):
+            event_log.log(1, "RIDER_TELEPORTED", rider_id=1)
+        with pytest.raises(ValueError, match="'C' is missing from PLATFORM_IDS"):
+            event_log.log(1, "ORDER_CREATED", rider_id=1, platform_id='C')
+    finally:
+        event_log.close()
@@ -0,0 +1,56 @@
+import pytest
+from simulator.utils.metrics import SimulationMetrics
+from simulator.utils.monte_carlo import summarize_replicates, t_critical_95
+
+def test_summarize_replicates_reports_mean_and_t_interval():
+    """The interval is mean +/- t * s / sqrt(n), and missing metrics count as 0."""
+    # 1. Arrange
+    runs = [
+        {"completed_trips": 10, "platform_B_share": 0.5},
+        {"completed_trips": 12},
+        {"completed_trips": 14, "platform_B_share": 0.25},
+    ]
+
+    # 2. Act
+    summary = summarize_replicates(runs)
+
+    # 3. Assert
+    trips = summary["completed_trips"]
+    assert trips["mean"] == pytest.approx(12.0)
+    assert trips["std"] == pytest.approx(2.0)
+    half_width = 4.303 * 2.0 / 3 ** 0.5
+    assert (trips["ci95_low"], trips["ci95_high"]) == pytest.approx((12.0 - half_width, 12.0 + half_width))
+    assert summary["platform_B_share"]["mean"] == pytest.approx(0.25)
+
+def test_single_run_has_a_degenerate_interval():
+    """With one run there is no spread to estimate."""
+    summary = summarize_replicates([{"match_rate": 0.9}])
+    assert summary["match_rate"]["ci95_low"] == summary["match_rate"]["ci95_high"] == 0.9
+
+def test_t_critical_values_approach_the_normal_quantile():
+    """Large samples use an expansion that continues the table smoothly."""
+    assert t_critical_95(30) == pytest.approx(2.042)
+    assert t_critical_95(31) == pytest.approx(2.040, abs=1e-3)
+    assert t_critical_95(1000) == pytest.approx(1.962, abs=1e-3)
+    with pytest.raises(ValueError):
+        t_critical_95(0)
+
+def test_summary_values_include_per_platform_share_of_matches():
+    """Shares are each platform's part of all matched orders."""
+    # 1. Arrange
+    metrics = SimulationMetrics()
+    for _ in range(3):
+        metrics.track_match('A')
+    metrics.track_match('B')
+    metrics.track_abandoned_order('B')
+    metrics.track_completed_trip(driver_id=1, rider_id=2)
+
+    # 2. Act
+    values = metrics.summary_values()
+
+    # 3. Assert
+    assert values["completed_trips"] == 1
+    assert values["unique_active_drivers"] == 1
+    assert values["match_rate"] == pytest.approx(4 / 5)
+    assert values["platform_A_share"] == pytest.approx(0.75)
+    assert values["platform_B_match_rate"] == pytest.approx(0.5)
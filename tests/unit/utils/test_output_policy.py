@@ -0,0 +1,51 @@
+import pytest
+from simulator.utils.output_policy import OutputPolicy, CSV, LOG
+
+def test_trace_sampling_is_deterministic():
+    """The same share of ids is sampled every time, and the salt picks a different subset."""
+    # 1. Arrange
+    policy = OutputPolicy(trace_sample_rate=0.1)
+    same_policy = OutputPolicy(trace_sample_rate=0.1)
+    salted_policy = OutputPolicy(trace_sample_rate=0.1, trace_salt=7)
+
+    # 2. Act
+    traced = {agent_id for agent_id in range(20000) if policy.is_traced(agent_id)}
+    salted = {agent_id for agent_id in range(20000) if salted_policy.is_traced(agent_id)}
+
+    # 3. Assert
+    assert len(traced) == pytest.approx(2000, rel=0.1)
+    assert traced == {agent_id for agent_id in range(20000) if same_policy.is_traced(agent_id)}
+    assert traced != salted
+
+def test_event_type_filters_apply_per_sink_and_are_counted():
+    """Each sink keeps or drops its own event types, and dropped events are counted."""
+    policy = OutputPolicy(drop_events={LOG: ["DRIVER_PROPOSED"]}, keep_events={CSV: ["TRIP_COMPLETED"]})
+
+    assert policy.allows(CSV, "DRIVER_PROPOSED", rider_id=1) is False
+    assert policy.allows(LOG, "DRIVER_PROPOSED", rider_id=1) is False
+    assert policy.allows(LOG, "TRIP_COMPLETED", rider_id=1) is True
+    assert policy.allows(CSV, "TRIP_COMPLETED", rider_id=1) is True
+    assert policy.dropped == {(CSV, "DRIVER_PROPOSED"): 1, (LOG, "DRIVER_PROPOSED"): 1}
+
+def test_unknown_sinks_are_rejected():
+    with pytest.raises(ValueError, match="sink"):
+        OutputPolicy(drop_events={"parquet": ["TRIP_COMPLETED"]})
+
+def test_market_only_writes_traced_agents(market_config, run_market):
+    """With trace sampling, CSV rows only mention traced agents and the rest is counted."""
+    # 1. Arrange
+    market_config['output'] = {'trace_sample_rate': 0.2}
+    market_config['market'].update(grid_resolution=2000, initial_riders=200, initial_drivers=40)
+
+    # 2. Act
+    run = run_market(market_config, seed=3, skip_idle_ticks=True)
+    market = run.market
+
+    # 3. Assert
+    rows = run.csv_logger.log.call_args_list
+    assert rows
+    for row in rows:
+        agent_ids = [row.kwargs[key] for key in ("rider_id", "driver_id") if row.kwargs[key] is not None]
+        assert any(market.output.is_traced(agent_id) for agent_id in agent_ids)
+    assert market.output.dropped[CSV, "ORDER_CREATED"] > 0
+    assert run.platforms[0].matcher.output is market.output
@@ -0,0 +1,34 @@
+import pytest
+from simulator.utils.time_utils import TickClock, get_clock, ticks_to_time_string
+
+@pytest.mark.parametrize("ticks_per_major, tick, expected", [
+    (8640, 0, "Day 0, 00:00:00"),
+    (8640, 1006, "Day 0, 02:47:40"),
+    (8640, 8641, "Day 1, 00:00:10"),
+    (1440, 2 * 1440 + 61, "Day 2, 01:01:00"),
+    (24, 24 + 23, "Day 1, 23:00:00"),
+])
+def test_clock_labels_absolute_ticks(ticks_per_major, tick, expected):
+    """Labels count whole days from the absolute tick, whatever a minor tick lasts."""
+    assert get_clock(ticks_per_major).label(tick) == expected
+
+def test_ticks_to_time_string_matches_the_clock():
+    """The day/tick helper agrees with the clock, including after day 0."""
+    assert ticks_to_time_string(1, 1, 8640) == "Day 1, 00:00:10"
+    assert ticks_to_time_string(3, 12, 24) == get_clock(24).label(3 * 24 + 12)
+
+def test_clocks_are_shared_per_tick_rate():
+    """Every component asking for the same tick rate gets one precomputed clock."""
+    assert get_clock(8640) is get_clock(8640)
+    assert get_clock(8640) is not get_clock(1440)
+
+def test_minutes_to_ticks_follows_the_tick_length():
+    """Durations scale with the tick rate and never round down to zero ticks."""
+    # 1. Arrange
+    fine = TickClock(8640)   # 10-second ticks
+    coarse = TickClock(24)   # 1-hour ticks
+
+    # 2. Act / 3. Assert
+    assert fine.minutes_to_ticks(15) == 90
+    assert coarse.minutes_to_ticks(120) == 2
+    assert coarse.minutes_to_ticks(5) == 1